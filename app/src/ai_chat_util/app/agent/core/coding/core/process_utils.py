@@ -121,12 +121,47 @@ def popen_new_process_group_kwargs() -> dict[str, Any]:
     return {"start_new_session": True}
 
 
+def _kill_process_tree_with_psutil(pid: int) -> bool:
+    """Kill pid and its descendants via psutil. Return False if psutil could not be used."""
+
+    try:
+        import psutil  # type: ignore
+    except Exception:
+        return False
+
+    try:
+        parent = psutil.Process(pid)
+    except psutil.NoSuchProcess:
+        return True
+    except Exception:
+        return False
+
+    try:
+        children = parent.children(recursive=True)
+    except psutil.NoSuchProcess:
+        return True
+    except Exception:
+        return False
+
+    # Kill children first so they are not re-parented while the parent exits.
+    for proc in [*children, parent]:
+        try:
+            proc.kill()
+        except psutil.NoSuchProcess:
+            pass
+        except Exception:
+            if proc is parent:
+                return False
+    return True
+
+
 def kill_process_tree(pid: int) -> None:
     """Best-effort kill for a process tree.
 
     This is used for cancelling detached tasks.
 
-    - Windows: taskkill /T /F
+    - Windows: terminate the process and its descendants via psutil (TerminateProcess),
+      falling back to taskkill /T /F
     - POSIX: kill the whole process group (SIGKILL)
 
     The function is intentionally best-effort and should not raise if the process
@@ -137,6 +172,11 @@ def kill_process_tree(pid: int) -> None:
         return
 
     if os.name == "nt":
+        # Avoid spawning taskkill.exe for every cancel: psutil walks the tree and
+        # calls TerminateProcess in-process.
+        if _kill_process_tree_with_psutil(pid):
+            return
+
         try:
             # /T: terminate child processes; /F: force.
             subprocess.run(
@@ -12,13 +12,29 @@ import atexit
 import shutil
 import json
 
+# create_temporary_zip で作成し、終了時に削除する一時ZIPファイル.
+# 呼び出しごとに atexit へハンドラを登録すると常駐プロセスでハンドラが溜まり続けるため、ハンドラは1つにまとめる
+_temporary_zip_paths: set[Path] = set()
+
+
+def _cleanup_temporary_zips() -> None:
+    for tmp_zip in list(_temporary_zip_paths):
+        tmp_zip.unlink(missing_ok=True)
+    _temporary_zip_paths.clear()
+
+
+atexit.register(_cleanup_temporary_zips)
+
+
 class ExecutorUtil:
     """タスクの実行と管理に関するユーティリティ関数をまとめたクラスです。"""
     @staticmethod
     def create_temporary_zip(source_dir: Path) -> Path:
         """ディレクトリを一時的なZIPファイルに固める"""
-        tmp_zip = Path(tempfile.NamedTemporaryFile(suffix=".zip", delete=False).name)
-        atexit.register(lambda: tmp_zip.unlink(missing_ok=True))  # 終了時に自動削除
+        fd, tmp_name = tempfile.mkstemp(suffix=".zip")
+        os.close(fd)
+        tmp_zip = Path(tmp_name)
+        _temporary_zip_paths.add(tmp_zip)  # 終了時に自動削除
         with zipfile.ZipFile(tmp_zip, 'w', zipfile.ZIP_DEFLATED) as zf:
             for file in source_dir.rglob('*'):
                 if file.is_file():
@@ -8,6 +8,7 @@ from ai_chat_util.core.common.config.runtime import AiChatUtilConfig
 from ai_chat_util.core.chat.model import ChatRequest, ChatHistory, ChatMessage, ChatContent
 
 from ai_chat_util.core.chat.abstract_chat_client import AbstractChatClient
+from ai_chat_util.core.common.flags import is_truthy
 
 
 class IOManagerBase(ABC):
@@ -45,8 +46,7 @@ class HITLClientBase(ABC):
         pass
 
     def _mk_user_request(self, text: str) -> ChatRequest:
-        auto_approve_raw = (os.environ.get("AI_CHAT_UTIL_AUTO_APPROVE") or "").strip().lower()
-        auto_approve = auto_approve_raw in {"1", "true", "yes", "y", "on"}
+        auto_approve = is_truthy(os.environ.get("AI_CHAT_UTIL_AUTO_APPROVE"))
         max_retries = None
         max_retries_raw = (os.environ.get("AI_CHAT_UTIL_AUTO_APPROVE_MAX_RETRIES") or "").strip()
         if max_retries_raw:
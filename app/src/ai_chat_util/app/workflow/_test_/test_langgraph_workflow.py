@@ -74,6 +74,82 @@ def test_mermaid_parser_infers_branch_loop_and_summary() -> None:
     assert [edge.label for edge in flowchart.get_edges_from("Decide")] == ["yes", "no"]
 
 
+def test_flowchart_lookups_follow_edge_and_node_updates() -> None:
+    flowchart = MermaidFlowChart(
+        code="""
+        flowchart TD
+            A[Start] --> B[Work]
+            B --> C[End]
+        """
+    )
+    assert [edge.target for edge in flowchart.get_edges_from("A")] == ["B"]
+
+    flowchart.edges = [
+        *(
+            edge.model_copy(update={"target": "X" if edge.target == "B" else edge.target})
+            for edge in flowchart.edges
+        ),
+        GraphEdge(source="X", target="B"),
+    ]
+    flowchart.nodes = [*flowchart.nodes, GraphNode(id="X", label="Review", kind="approval")]
+
+    assert [edge.target for edge in flowchart.get_edges_from("A")] == ["X"]
+    assert [edge.source for edge in flowchart.get_edges_to("B")] == ["X"]
+    assert flowchart.get_node("X").kind == "approval"
+
+
+def test_flowchart_lookups_follow_reassigned_lists() -> None:
+    flowchart = MermaidFlowChart(
+        code="""
+        flowchart TD
+            A[Start] --> B[Work]
+            B --> C[End]
+        """
+    )
+    assert [edge.target for edge in flowchart.get_edges_from("A")] == ["B"]
+    assert flowchart.get_node("C").label == "End"
+
+    flowchart.edges = [GraphEdge(source="A", target="C"), *flowchart.edges[1:]]
+    flowchart.nodes = [*flowchart.nodes[:2], GraphNode(id="C", label="Done", kind="end")]
+
+    assert [edge.target for edge in flowchart.get_edges_from("A")] == ["C"]
+    assert [edge.source for edge in flowchart.get_edges_to("B")] == []
+    assert flowchart.get_node("C").label == "Done"
+
+    copied = flowchart.model_copy(update={"edges": flowchart.edges[:1]})
+    assert copied.get_edges_from("B") == []
+    assert [edge.target for edge in flowchart.get_edges_from("B")] == ["C"]
+
+
+def test_flowchart_get_start_node_detects_second_start_node() -> None:
+    flowchart = MermaidFlowChart(
+        code="""
+        flowchart TD
+            A[Start] --> B[Work]
+            B --> C[End]
+        """
+    )
+    assert flowchart.get_start_node().id == "A"
+
+    flowchart.get_node("B").kind = "start"
+
+    with pytest.raises(ValueError, match="Multiple start nodes"):
+        flowchart.get_start_node()
+
+
+def test_flowchart_get_target_nodes_from_reports_unknown_node() -> None:
+    flowchart = MermaidFlowChart(
+        code="""
+        flowchart TD
+            A[Start] --> B[End]
+        """
+    )
+    flowchart.edges.append(GraphEdge(source="A", target="missing"))
+
+    with pytest.raises(KeyError, match="Unknown node id: missing"):
+        flowchart.get_target_nodes_from(flowchart.edges[0])
+
+
 def test_markdown_with_multiple_mermaid_blocks_is_rejected() -> None:
     markdown = """
     # Workflow
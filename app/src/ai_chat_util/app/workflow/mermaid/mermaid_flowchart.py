@@ -1,53 +1,61 @@
 from __future__ import annotations
 
+import itertools
 import re
+from typing import Iterator
 
 from ..workflow.flowchat import Flowchart, GraphEdge, GraphNode, NodeKind, Subgraph
 from ..workflow.mermaid_models import MermaidCodeBlock
 
+_MERMAID_BLOCK_RE = re.compile(r"```mermaid\s*(.*?)```", re.DOTALL | re.IGNORECASE)
+_GRAPH_RE = re.compile(r"(?:graph|flowchart)\s+([A-Za-z]+)")
+_NODE_ID_RE = re.compile(r"[A-Za-z0-9_\-]+")
+_EDGE_RE = re.compile(r"(?P<src>.+?)\s*-->\s*(?:\|(?P<label>.+?)\|\s*)?(?P<dst>.+)")
+
 
 class MermaidFlowChart(Flowchart):
     _NODE_ID_PATTERN = r"[A-Za-z0-9_\-]+"
-    _SHAPE_PATTERNS: tuple[tuple[str, str], ...] = (
-        (r"^(?P<id>[A-Za-z0-9_\-]+)\{(?P<label>.*)\}$", "decision"),
-        (r"^(?P<id>[A-Za-z0-9_\-]+)\(\[(?P<label>.*)\]\)$", "stadium"),
-        (r"^(?P<id>[A-Za-z0-9_\-]+)\(\((?P<label>.*)\)\)$", "terminal"),
-        (r"^(?P<id>[A-Za-z0-9_\-]+)\((?P<label>.*)\)$", "round"),
-        (r"^(?P<id>[A-Za-z0-9_\-]+)\[\[(?P<label>.*)\]\]$", "subroutine"),
-        (r"^(?P<id>[A-Za-z0-9_\-]+)\[(?P<label>.*)\]$", "rect"),
-        (r"^(?P<id>[A-Za-z0-9_\-]+)$", "plain"),
+    # (開き記号, 閉じ記号, shape)。元の判定順（decision → stadium → terminal → round → subroutine → rect）を維持する
+    _SHAPE_DELIMITERS: tuple[tuple[str, str, str], ...] = (
+        ("{", "}", "decision"),
+        ("([", "])", "stadium"),
+        ("((", "))", "terminal"),
+        ("(", ")", "round"),
+        ("[[", "]]", "subroutine"),
+        ("[", "]", "rect"),
     )
 
     def __init__(self, **data):
         super().__init__(**data)
-        if self.code:
+        # 解析済みの nodes が渡された場合（コピーや復元時）は、code を再解析して上書きしない
+        if self.code.strip() and not data.get("nodes"):
             self.parse(self.code)
 
     @staticmethod
     def extract_mermaid_code(markdown: str) -> list[str]:
-        return [block.code for block in MermaidFlowChart.extract_mermaid_blocks(markdown)]
+        return [block.code for block in MermaidFlowChart.iter_mermaid_blocks(markdown)]
 
     @staticmethod
-    def extract_mermaid_blocks(markdown: str) -> list[MermaidCodeBlock]:
-        pattern = r"```mermaid\s*(.*?)```"
-        blocks: list[MermaidCodeBlock] = []
-        for match in re.finditer(pattern, markdown or "", re.DOTALL | re.IGNORECASE):
+    def iter_mermaid_blocks(markdown: str) -> Iterator[MermaidCodeBlock]:
+        for match in _MERMAID_BLOCK_RE.finditer(markdown or ""):
             code = match.group(1).strip()
             if not code:
                 continue
-            blocks.append(
-                MermaidCodeBlock(
-                    code=code,
-                    full_text=match.group(0),
-                    start_index=match.start(),
-                    end_index=match.end(),
-                )
+            yield MermaidCodeBlock(
+                code=code,
+                full_text=match.group(0),
+                start_index=match.start(),
+                end_index=match.end(),
             )
-        return blocks
+
+    @staticmethod
+    def extract_mermaid_blocks(markdown: str) -> list[MermaidCodeBlock]:
+        return list(MermaidFlowChart.iter_mermaid_blocks(markdown))
 
     @staticmethod
     def extract_single_mermaid_block(markdown: str) -> MermaidCodeBlock:
-        blocks = MermaidFlowChart.extract_mermaid_blocks(markdown)
+        # 2つ目のブロックが見つかった時点で判定できるため、文書全体のブロックを集めない
+        blocks = list(itertools.islice(MermaidFlowChart.iter_mermaid_blocks(markdown), 2))
         if not blocks:
             raise ValueError("Markdown must contain exactly one mermaid block, but none were found")
         if len(blocks) > 1:
@@ -68,7 +76,8 @@ class MermaidFlowChart(Flowchart):
     def parse(self, code: str) -> None:
         nodes: dict[str, GraphNode] = {}
         edges: list[GraphEdge] = []
-        subgraphs: dict[str, list[str]] = {}
+        # サブグラフ名 -> 所属ノードID（挿入順を保つ集合として dict のキーを使う）
+        subgraphs: dict[str, dict[str, None]] = {}
         direction = "TD"
         current_subgraph: str | None = None
 
@@ -77,15 +86,17 @@ class MermaidFlowChart(Flowchart):
             if not line or line.startswith("%%"):
                 continue
 
-            if line.startswith(("graph", "flowchart")):
-                match = re.match(r"(?:graph|flowchart)\s+([A-Za-z]+)", line)
+            # 先頭トークンでキーワード行を振り分け、該当しない行だけエッジ/ノードとして解析する
+            first_token = line.split(None, 1)[0]
+            if first_token in ("graph", "flowchart"):
+                match = _GRAPH_RE.match(line)
                 if match:
                     direction = match.group(1)
                 continue
 
-            if line.startswith("subgraph"):
+            if first_token == "subgraph":
                 current_subgraph = line[len("subgraph"):].strip()
-                subgraphs.setdefault(current_subgraph, [])
+                subgraphs.setdefault(current_subgraph, {})
                 continue
 
             if line == "end":
@@ -109,12 +120,12 @@ class MermaidFlowChart(Flowchart):
         self.direction = direction
         self.nodes = list(nodes.values())
         self.edges = edges
-        self.subgraphs = [Subgraph(name=name, nodes=node_ids) for name, node_ids in subgraphs.items()]
+        self.subgraphs = [Subgraph(name=name, nodes=list(node_ids)) for name, node_ids in subgraphs.items()]
         self.code = code
         self._apply_graph_inference()
 
     def _parse_edge_line(self, line: str) -> tuple[str, str, str]:
-        match = re.match(r"(?P<src>.+?)\s*-->\s*(?:\|(?P<label>.+?)\|\s*)?(?P<dst>.+)", line)
+        match = _EDGE_RE.match(line)
         if not match:
             raise ValueError(f"Unsupported mermaid edge syntax: {line}")
         source_token = match.group("src").strip()
@@ -127,7 +138,7 @@ class MermaidFlowChart(Flowchart):
         nodes: dict[str, GraphNode],
         token: str,
         current_subgraph: str | None,
-        subgraphs: dict[str, list[str]],
+        subgraphs: dict[str, dict[str, None]],
     ) -> GraphNode:
         parsed_node = self._parse_node_ref(token)
         if parsed_node is None:
@@ -139,13 +150,13 @@ class MermaidFlowChart(Flowchart):
         nodes: dict[str, GraphNode],
         parsed_node: GraphNode,
         current_subgraph: str | None,
-        subgraphs: dict[str, list[str]],
+        subgraphs: dict[str, dict[str, None]],
     ) -> GraphNode:
         existing = nodes.get(parsed_node.id)
         if existing is None:
             nodes[parsed_node.id] = parsed_node
             if current_subgraph:
-                subgraphs.setdefault(current_subgraph, []).append(parsed_node.id)
+                subgraphs.setdefault(current_subgraph, {})[parsed_node.id] = None
             return parsed_node
 
         if existing.label == existing.id and parsed_node.label != parsed_node.id:
@@ -156,22 +167,35 @@ class MermaidFlowChart(Flowchart):
             existing.shape = parsed_node.shape
         existing.metadata.update(parsed_node.metadata)
         if current_subgraph:
-            subgraphs.setdefault(current_subgraph, [])
-            if parsed_node.id not in subgraphs[current_subgraph]:
-                subgraphs[current_subgraph].append(parsed_node.id)
+            subgraphs.setdefault(current_subgraph, {})[parsed_node.id] = None
         return existing
 
     def _parse_node_ref(self, token: str) -> GraphNode | None:
         text = token.strip()
-        for pattern, shape in self._SHAPE_PATTERNS:
-            match = re.match(pattern, text)
-            if not match:
-                continue
-            node_id = match.group("id")
-            label = (match.groupdict().get("label") or node_id).strip().strip('"')
-            kind, metadata = self._infer_node_kind(label, shape)
-            return GraphNode(id=node_id, label=label, kind=kind, shape=shape, metadata=metadata)
-        return None
+        id_match = _NODE_ID_RE.match(text)
+        if not id_match:
+            return None
+        node_id = id_match.group(0)
+        rest = text[id_match.end():]
+
+        # ID に続く記号から形状を判定する（正規表現を形状ごとに試さない）
+        shape: str | None = "plain" if not rest else None
+        raw_label = ""
+        for open_mark, close_mark, candidate in self._SHAPE_DELIMITERS:
+            if (
+                len(rest) >= len(open_mark) + len(close_mark)
+                and rest.startswith(open_mark)
+                and rest.endswith(close_mark)
+            ):
+                shape = candidate
+                raw_label = rest[len(open_mark):len(rest) - len(close_mark)]
+                break
+        if shape is None:
+            return None
+
+        label = (raw_label or node_id).strip().strip('"')
+        kind, metadata = self._infer_node_kind(label, shape)
+        return GraphNode(id=node_id, label=label, kind=kind, shape=shape, metadata=metadata)
 
     def _infer_node_kind(self, label: str, shape: str) -> tuple[NodeKind, dict[str, str]]:
         normalized = label.strip().lower()
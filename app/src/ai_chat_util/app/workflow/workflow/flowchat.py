@@ -2,9 +2,9 @@ from __future__ import annotations
 
 from abc import abstractmethod
 from collections import deque
-from typing import Literal
+from typing import Any, Literal
 
-from pydantic import BaseModel, Field, model_validator
+from pydantic import BaseModel, Field, PrivateAttr, model_validator
 
 NodeKind = Literal["start", "task", "decision", "summary", "dry_run", "approval", "end"]
 
@@ -44,6 +44,21 @@ class Flowchart(BaseModel):
     markdown: str = Field(default="", description="Markdown document used to derive the workflow")
     tool_catalog_text: str = Field(default="", description="Resolved MCP tool catalog available to the workflow")
 
+    # nodes / edges から作る参照用インデックス. 生成時に作り、nodes / edges を代入で差し替えたら作り直す.
+    # リストの要素をその場で追加・削除・書き換えた場合は検知できないため、変更時は新しいリストを代入すること
+    _indexed_lists: tuple[list[GraphNode], list[GraphEdge]] | None = PrivateAttr(default=None)
+    _nodes_by_id: dict[str, GraphNode] = PrivateAttr(default_factory=dict)
+    _edges_by_source: dict[str, list[GraphEdge]] = PrivateAttr(default_factory=dict)
+    _edges_by_target: dict[str, list[GraphEdge]] = PrivateAttr(default_factory=dict)
+
+    def model_post_init(self, __context: Any) -> None:
+        self._ensure_indices()
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        super().__setattr__(name, value)
+        if name in ("nodes", "edges"):
+            self._indexed_lists = None
+
     @model_validator(mode="after")
     def _normalize_graph(self) -> "Flowchart":
         return self._apply_graph_inference()
@@ -84,31 +99,58 @@ class Flowchart(BaseModel):
                     node.kind = "end"
         return self
 
-    def get_node(self, node_id: str) -> GraphNode:
+    def _ensure_indices(self) -> None:
+        nodes, edges = self.nodes, self.edges
+        indexed = self._indexed_lists
+        # model_copy(update=...) は __setattr__ を通らないため、インデックスを作ったリスト自体とも比較する
+        if indexed is not None and indexed[0] is nodes and indexed[1] is edges:
+            return
+
+        nodes_by_id: dict[str, GraphNode] = {}
         for node in self.nodes:
-            if node.id == node_id:
-                return node
-        raise KeyError(f"Unknown node id: {node_id}")
+            # 同じIDが複数ある場合は、線形探索と同じく先頭のノードを優先する
+            nodes_by_id.setdefault(node.id, node)
+        edges_by_source: dict[str, list[GraphEdge]] = {}
+        edges_by_target: dict[str, list[GraphEdge]] = {}
+        for edge in self.edges:
+            edges_by_source.setdefault(edge.source, []).append(edge)
+            edges_by_target.setdefault(edge.target, []).append(edge)
+
+        self._nodes_by_id = nodes_by_id
+        self._edges_by_source = edges_by_source
+        self._edges_by_target = edges_by_target
+        self._indexed_lists = (nodes, edges)
+
+    def get_node(self, node_id: str) -> GraphNode:
+        self._ensure_indices()
+        node = self._nodes_by_id.get(node_id)
+        if node is None:
+            raise KeyError(f"Unknown node id: {node_id}")
+        return node
 
     def get_edges_from(self, src_node: GraphNode | str) -> list[GraphEdge]:
         node_id = src_node.id if isinstance(src_node, GraphNode) else src_node
-        return [edge for edge in self.edges if edge.source == node_id]
+        self._ensure_indices()
+        return list(self._edges_by_source.get(node_id, ()))
 
     def get_edges_to(self, target_node: GraphNode | str) -> list[GraphEdge]:
         node_id = target_node.id if isinstance(target_node, GraphNode) else target_node
-        return [edge for edge in self.edges if edge.target == node_id]
+        self._ensure_indices()
+        return list(self._edges_by_target.get(node_id, ()))
 
     def get_target_nodes_from(self, edge: GraphEdge) -> list[GraphNode]:
         return [self.get_node(target_edge.target) for target_edge in self.get_edges_from(edge.source)]
 
     def get_start_node(self) -> GraphNode:
+        # kind は生成後に書き換えられることがあるため、start ノードは毎回数え直す（複数あればエラーにする）
         start_nodes = [node for node in self.nodes if node.kind == "start"]
         if len(start_nodes) == 1:
             return start_nodes[0]
         if len(start_nodes) > 1:
             raise ValueError("Multiple start nodes found")
 
-        candidates = [node for node in self.nodes if not self.get_edges_to(node.id)]
+        self._ensure_indices()
+        candidates = [node for node in self.nodes if node.id not in self._edges_by_target]
         if len(candidates) == 1:
             return candidates[0]
         if not candidates:
@@ -119,7 +161,8 @@ class Flowchart(BaseModel):
         explicit = [node for node in self.nodes if node.kind == "end"]
         if explicit:
             return explicit
-        return [node for node in self.nodes if not self.get_edges_from(node.id)]
+        self._ensure_indices()
+        return [node for node in self.nodes if node.id not in self._edges_by_source]
 
     def get_end_node(self) -> GraphNode:
         end_nodes = self.get_end_nodes()
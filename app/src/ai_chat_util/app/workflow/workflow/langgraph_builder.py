@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import re
 from typing import Any, Awaitable, Callable, TypedDict
 
 from langgraph.graph import END, START, StateGraph
@@ -7,6 +8,15 @@ from langgraph.types import interrupt
 
 from .flowchat import Flowchart, GraphEdge, GraphNode
 
+# 分岐ラベルを示すタグ。先に一致したものを優先する（DECISION → ROUTE → BRANCH）
+_EDGE_LABEL_TAG_PATTERNS = tuple(
+    re.compile(rf"<{tag}>\s*(.*?)\s*</{tag}>", flags=re.IGNORECASE | re.DOTALL)
+    for tag in ("DECISION", "ROUTE", "BRANCH")
+)
+
+# 承認ノードの再開時に承認とみなす応答（小文字化・前後空白除去後に比較する）
+_APPROVAL_WORDS = frozenset({"approve", "approved", "yes", "y"})
+
 
 class WorkflowState(TypedDict, total=False):
     input_text: str
@@ -36,6 +46,8 @@ class LangGraphWorkflowBuilder:
     def __init__(self, flowchart: Flowchart, executor: NodeExecutor):
         self.flowchart = flowchart
         self.executor = executor
+        # ノードID -> 正規化した分岐ラベル -> 遷移先ノードID（同じラベルが複数ある場合は先勝ち）
+        self._branch_targets: dict[str, dict[str, str]] = {}
 
     def build(self, *, checkpointer: Any | None = None):
         graph = StateGraph(WorkflowState)
@@ -48,7 +60,7 @@ class LangGraphWorkflowBuilder:
         for node in self.flowchart.nodes:
             destinations = {edge.target: edge.target for edge in self.flowchart.get_edges_from(node.id)}
             destinations["__end__"] = END
-            graph.add_conditional_edges(node.id, self._build_router(node), destinations)
+            graph.add_conditional_edges(node.id, self._route_to_next_node, destinations)
 
         return graph.compile(checkpointer=checkpointer) if checkpointer is not None else graph.compile()
 
@@ -156,16 +168,14 @@ class LangGraphWorkflowBuilder:
             return None
         return outgoing_edges[0].target
 
-    def _build_router(self, node: GraphNode):
-        outgoing_edges = self.flowchart.get_edges_from(node.id)
-
-        def _route(state: WorkflowState) -> str:
-            next_node_id = state.get("next_node_id")
-            if not outgoing_edges or not next_node_id:
-                return "__end__"
-            return str(next_node_id)
-
-        return _route
+    @staticmethod
+    def _route_to_next_node(state: WorkflowState) -> str:
+        # 遷移先はノードハンドラが出力辺から決めて next_node_id に入れている（出力辺がなければ None）ため、
+        # ノードごとにルータを作らず全ノードで共有する
+        next_node_id = state.get("next_node_id")
+        if not next_node_id:
+            return "__end__"
+        return str(next_node_id)
 
     def _select_next_node(self, node: GraphNode, *, output_text: str, selected_edge: str | None) -> str | None:
         outgoing_edges = self.flowchart.get_edges_from(node.id)
@@ -178,26 +188,29 @@ class LangGraphWorkflowBuilder:
         if not normalized_selected:
             raise ValueError(f"Node {node.id} requires a branch selection but executor did not provide one")
 
-        for edge in outgoing_edges:
-            if self._normalize_edge_label(edge.label) == normalized_selected:
-                return edge.target
+        target = self._get_branch_targets(node.id, outgoing_edges).get(normalized_selected)
+        if target is not None:
+            return target
 
         available_labels = [edge.label for edge in outgoing_edges]
         raise ValueError(
             f"Node {node.id} selected unknown branch '{normalized_selected}'. Available labels: {available_labels}"
         )
 
+    def _get_branch_targets(self, node_id: str, outgoing_edges: list[GraphEdge]) -> dict[str, str]:
+        targets = self._branch_targets.get(node_id)
+        if targets is None:
+            targets = {}
+            for edge in outgoing_edges:
+                targets.setdefault(self._normalize_edge_label(edge.label), edge.target)
+            self._branch_targets[node_id] = targets
+        return targets
+
     @staticmethod
     def _extract_edge_label(output_text: str) -> str:
         text = output_text or ""
-        for pattern in (
-            r"<DECISION>\s*(.*?)\s*</DECISION>",
-            r"<ROUTE>\s*(.*?)\s*</ROUTE>",
-            r"<BRANCH>\s*(.*?)\s*</BRANCH>",
-        ):
-            import re
-
-            match = re.search(pattern, text, flags=re.IGNORECASE | re.DOTALL)
+        for pattern in _EDGE_LABEL_TAG_PATTERNS:
+            match = pattern.search(text)
             if match:
                 return match.group(1).strip()
         return ""
@@ -209,4 +222,4 @@ class LangGraphWorkflowBuilder:
     @staticmethod
     def _is_approval_text(text: str) -> bool:
         normalized = str(text or "").strip().lower()
-        return normalized in {"approve", "approved", "yes", "y"} or normalized.startswith("approve ")
\ No newline at end of file
+        return normalized in _APPROVAL_WORDS or normalized.startswith("approve ")
\ No newline at end of file
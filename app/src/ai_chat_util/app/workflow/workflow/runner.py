@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 import contextlib
 import re
 import uuid
@@ -18,8 +19,9 @@ from ...agent.core.prompts import CodingAgentPrompts
 from ...agent.core.tool_limits import ToolLimits
 from ai_chat_util.core.chat.model import HitlRequest
 from ai_chat_util.core.common.config.runtime import AiChatUtilConfig, get_runtime_config
+from ai_chat_util.core.common.flags import is_truthy
 from ..mermaid.mermaid_flowchart import MermaidFlowChart
-from .flowchat import Flowchart, GraphNode
+from .flowchat import Flowchart, GraphEdge, GraphNode
 from .langgraph_builder import (
     LangGraphWorkflowBuilder,
     NodeExecutionResult,
@@ -33,6 +35,12 @@ from .markdown_workflow import (
 
 logger = log_settings.getLogger(__name__)
 
+# ツール実行エージェントのXML出力から取り出すタグ
+_TOOL_AGENT_TAG_PATTERNS = {
+    tag: re.compile(rf"<{tag}>\s*(.*?)\s*</{tag}>", flags=re.IGNORECASE | re.DOTALL)
+    for tag in ("TEXT", "RESPONSE_TYPE", "HITL_KIND", "HITL_TOOL")
+}
+
 
 class WorkflowMarkdownPreprocessorProtocol(Protocol):
     async def prepare_document(self, markdown: str, *, message: str = "") -> WorkflowMarkdownDocument:
@@ -42,13 +50,34 @@ class WorkflowMarkdownPreprocessorProtocol(Protocol):
         ...
 
 
+# 要約・判定・通常ノードで共通の system prompt. ノード種別ごとの指示はユーザーメッセージの末尾に置き、
+# system prompt とワークフロー仕様までをノード間で同一のプレフィックスに保つ
+_WORKFLOW_NODE_SYSTEM_PROMPT = (
+    "あなたはWF型エージェントのノード実行器です。"
+    "ワークフロー仕様に従い、メッセージ末尾のノード種別の指示に沿って指定されたノードの役割だけを果たしてください。"
+)
+
+
+def build_workflow_preamble(flowchart: Flowchart) -> str:
+    """各ノードのプロンプト先頭に置くワークフロー仕様部分を返す.
+
+    ノードごとに変わる情報より前に置くことで、同じワークフロー内のLLM呼び出しが共通のプレフィックスを持ち、
+    プロバイダ側のプロンプトキャッシュが効くようにする.
+    """
+    return f"ワークフロー仕様Markdown:\n{flowchart.markdown or flowchart.code}\n\n"
+
+
 class WorkflowToolAgentRuntime:
-    def __init__(self, runtime_config: AiChatUtilConfig):
+    def __init__(self, runtime_config: AiChatUtilConfig, llm: Any | None = None):
         self.runtime_config = runtime_config
-        self.llm = AgentClientUtil.create_llm(runtime_config)
+        self.llm = llm if llm is not None else AgentClientUtil.create_llm(runtime_config)
         self.prompts = CodingAgentPrompts()
         self.tool_limits = ToolLimits.from_config(runtime_config)
         self._agent_cache: dict[tuple[str, ...], Any] = {}
+        # MCPサーバーから取得したツール一覧. ノードごとに許可ツールが異なっても取得は1回で済ませる
+        self._langchain_tools: list[Any] | None = None
+        # 先行取得中のツール一覧（prefetch_tools で開始し、最初のツールノードが待ち合わせる）
+        self._langchain_tools_task: asyncio.Task[list[Any]] | None = None
 
     async def invoke(
         self,
@@ -60,6 +89,7 @@ class WorkflowToolAgentRuntime:
         allowed_tools_text: str,
         execution_mode: str = "normal",
         auto_approve_tools: bool = False,
+        workflow_preamble: str | None = None,
     ) -> str:
         normalized_names = tuple(sorted({name.strip() for name in allowed_tool_names if isinstance(name, str) and name.strip()}))
         if not normalized_names:
@@ -85,8 +115,8 @@ class WorkflowToolAgentRuntime:
                 "ユーザーが指定していない config ファイルや仮想パスへ置き換えてはいけません。"
             )
         prompt = (
-            f"ワークフロー仕様Markdown:\n{flowchart.markdown or flowchart.code}\n\n"
-            f"現在のノードID: {node.id}\n"
+            (workflow_preamble if workflow_preamble is not None else build_workflow_preamble(flowchart))
+            + f"現在のノードID: {node.id}\n"
             f"ノードの役割: {node.label}\n"
             f"利用可能ツール:\n{allowed_tools_text}\n"
             f"ユーザー入力: {state.get('input_text', '')}\n"
@@ -121,10 +151,9 @@ class WorkflowToolAgentRuntime:
         if cached is not None:
             return cached
 
-        mcp_config = self.runtime_config.get_mcp_server_config()
-        agent_client = MultiServerMCPClient(mcp_config.to_langchain_config())
-        langchain_tools = await agent_client.get_tools()
-        filtered_tools = [tool for tool in langchain_tools if str(getattr(tool, "name", "")).strip() in set(allowed_tool_names)]
+        langchain_tools = await self._get_langchain_tools()
+        allowed_names = set(allowed_tool_names)
+        filtered_tools = [tool for tool in langchain_tools if str(getattr(tool, "name", "")).strip() in allowed_names]
 
         inferred_approval_tools = AgentBuilder.infer_approval_tools_from_langchain_tools(filtered_tools)
         tools_description = self.prompts.create_tools_description(filtered_tools)
@@ -150,6 +179,31 @@ class WorkflowToolAgentRuntime:
         self._agent_cache[cache_key] = agent
         return agent
 
+    def prefetch_tools(self) -> asyncio.Task[list[Any]] | None:
+        """MCPサーバーの起動とツール一覧の取得をバックグラウンドで開始する. 取得済みの場合は None を返す."""
+        if self._langchain_tools is not None:
+            return None
+        task = self._langchain_tools_task
+        if task is None or task.done() or task.get_loop() is not asyncio.get_running_loop():
+            task = asyncio.ensure_future(self._load_langchain_tools())
+            self._langchain_tools_task = task
+        return task
+
+    async def _load_langchain_tools(self) -> list[Any]:
+        mcp_config = self.runtime_config.get_mcp_server_config()
+        agent_client = MultiServerMCPClient(mcp_config.to_langchain_config())
+        self._langchain_tools = list(await agent_client.get_tools())
+        return self._langchain_tools
+
+    async def _get_langchain_tools(self) -> list[Any]:
+        if self._langchain_tools is None:
+            task = self.prefetch_tools()
+            try:
+                self._langchain_tools = await task  # type: ignore[misc]
+            finally:
+                self._langchain_tools_task = None
+        return self._langchain_tools
+
     @staticmethod
     def _previous_outputs_text(state: WorkflowState) -> str:
         node_outputs = state.get("node_outputs") or {}
@@ -158,10 +212,10 @@ class WorkflowToolAgentRuntime:
     @staticmethod
     def _parse_tool_agent_xml(output_text: str) -> tuple[str | None, str | None, str | None, str | None]:
         text = output_text or ""
-        m_text = re.search(r"<TEXT>\s*(.*?)\s*</TEXT>", text, flags=re.IGNORECASE | re.DOTALL)
-        m_type = re.search(r"<RESPONSE_TYPE>\s*(.*?)\s*</RESPONSE_TYPE>", text, flags=re.IGNORECASE | re.DOTALL)
-        m_kind = re.search(r"<HITL_KIND>\s*(.*?)\s*</HITL_KIND>", text, flags=re.IGNORECASE | re.DOTALL)
-        m_tool = re.search(r"<HITL_TOOL>\s*(.*?)\s*</HITL_TOOL>", text, flags=re.IGNORECASE | re.DOTALL)
+        m_text = _TOOL_AGENT_TAG_PATTERNS["TEXT"].search(text)
+        m_type = _TOOL_AGENT_TAG_PATTERNS["RESPONSE_TYPE"].search(text)
+        m_kind = _TOOL_AGENT_TAG_PATTERNS["HITL_KIND"].search(text)
+        m_tool = _TOOL_AGENT_TAG_PATTERNS["HITL_TOOL"].search(text)
         return (
             m_type.group(1).strip().lower() if m_type else None,
             m_text.group(1).strip() if m_text else None,
@@ -170,6 +224,14 @@ class WorkflowToolAgentRuntime:
         )
 
 
+def _discard_task(task: asyncio.Task[Any]) -> None:
+    # ワークフロー終了時に使われなかった先行取得を後始末する（未回収の例外の警告も出さない）
+    if not task.done():
+        task.cancel()
+    elif not task.cancelled():
+        task.exception()
+
+
 class WorkflowRunResult(BaseModel):
     final_output: str = ""
     summary: str = ""
@@ -189,13 +251,25 @@ class DefaultWorkflowNodeExecutor:
     def __init__(self, runtime_config: AiChatUtilConfig | None = None):
         self.runtime_config = runtime_config or get_runtime_config()
         self.llm = AgentClientUtil.create_llm(self.runtime_config)
-        self.tool_agent_runtime = WorkflowToolAgentRuntime(self.runtime_config)
+        # ツール実行用エージェントも同じLLM（LiteLLM Router）を共有する
+        self.tool_agent_runtime = WorkflowToolAgentRuntime(self.runtime_config, llm=self.llm)
+        # (ワークフロー仕様の文字列, 前置きプロンプト)。同じワークフローのノード間で使い回す
+        self._preamble_cache: tuple[str, str] | None = None
+
+    def _get_workflow_preamble(self, flowchart: Flowchart) -> str:
+        workflow_markdown = flowchart.markdown or flowchart.code
+        cached = self._preamble_cache
+        if cached is not None and cached[0] is workflow_markdown:
+            return cached[1]
+        preamble = build_workflow_preamble(flowchart)
+        self._preamble_cache = (workflow_markdown, preamble)
+        return preamble
 
     async def __call__(self, node: GraphNode, state: WorkflowState, flowchart: Flowchart) -> NodeExecutionResult:
         outgoing_edges = flowchart.get_edges_from(node.id)
         node_outputs = state.get("node_outputs") or {}
         previous_outputs_text = "\n".join(f"- {node_id}: {text}" for node_id, text in node_outputs.items()) or "(none)"
-        workflow_markdown = flowchart.markdown or flowchart.code
+        workflow_preamble = self._get_workflow_preamble(flowchart)
         allowed_tools_text = node.metadata.get("allowed_tools_text", "(none)")
         allowed_tool_names = [
             name.strip()
@@ -224,6 +298,7 @@ class DefaultWorkflowNodeExecutor:
                 allowed_tools_text=node.metadata.get("dry_run_tools_text", allowed_tools_text),
                 execution_mode="dry_run",
                 auto_approve_tools=True,
+                workflow_preamble=workflow_preamble,
             )
             return {"output_text": tool_output or "Dry run completed."}
 
@@ -231,13 +306,14 @@ class DefaultWorkflowNodeExecutor:
             summary_prompt = node.metadata.get("summary_prompt") or node.label
             result = await self.llm.ainvoke(
                 [
-                    SystemMessage(content="あなたはWF型エージェントの要約ノードです。簡潔で実務向けの要約だけを返してください。"),
+                    SystemMessage(content=_WORKFLOW_NODE_SYSTEM_PROMPT),
                     HumanMessage(
                         content=(
-                            f"要約指示:\n{summary_prompt}\n\n"
-                            f"ワークフロー仕様Markdown:\n{workflow_markdown}\n\n"
+                            workflow_preamble
+                            + f"要約指示:\n{summary_prompt}\n\n"
                             f"利用可能ツール:\n{allowed_tools_text}\n\n"
-                            f"これまでの各ノード出力:\n{previous_outputs_text}"
+                            f"これまでの各ノード出力:\n{previous_outputs_text}\n\n"
+                            "ノード種別の指示: あなたは要約ノードです。簡潔で実務向けの要約だけを返してください。"
                         )
                     ),
                 ]
@@ -249,21 +325,18 @@ class DefaultWorkflowNodeExecutor:
             labels = [edge.label for edge in outgoing_edges if edge.label.strip()]
             result = await self.llm.ainvoke(
                 [
-                    SystemMessage(
-                        content=(
-                            "あなたはWF型エージェントの判定ノードです。"
-                            "与えられた候補ラベルのどれか1つだけを選んでください。"
-                            "出力形式は必ず <DECISION>選んだラベル</DECISION><OUTPUT>説明</OUTPUT> にしてください。"
-                        )
-                    ),
+                    SystemMessage(content=_WORKFLOW_NODE_SYSTEM_PROMPT),
                     HumanMessage(
                         content=(
-                            f"判定ノード: {node.label}\n"
+                            workflow_preamble
+                            + f"判定ノード: {node.label}\n"
                             f"ユーザー入力: {state.get('input_text', '')}\n"
-                            f"ワークフロー仕様Markdown:\n{workflow_markdown}\n"
                             f"利用可能ツール:\n{allowed_tools_text}\n"
                             f"これまでの出力:\n{previous_outputs_text}\n"
-                            f"選択可能な分岐ラベル: {labels}"
+                            f"選択可能な分岐ラベル: {labels}\n\n"
+                            "ノード種別の指示: あなたは判定ノードです。"
+                            "与えられた候補ラベルのどれか1つだけを選んでください。"
+                            "出力形式は必ず <DECISION>選んだラベル</DECISION><OUTPUT>説明</OUTPUT> にしてください。"
                         )
                     ),
                 ]
@@ -281,33 +354,29 @@ class DefaultWorkflowNodeExecutor:
                 allowed_tool_names=allowed_tool_names,
                 allowed_tools_text=allowed_tools_text,
                 auto_approve_tools=bool(approval_tool_names),
+                workflow_preamble=workflow_preamble,
             )
             if tool_output.strip():
                 if node.kind == "end":
                     return {"output_text": tool_output, "summary_text": tool_output}
                 return {"output_text": tool_output}
 
-        system_prompt = (
-            "あなたはWF型エージェントのノード実行器です。"
-            "指定されたノードの責務だけを実行し、次ノードが利用できる簡潔な結果を返してください。"
-        )
+        kind_directive = "指定されたノードの責務だけを実行し、次ノードが利用できる簡潔な結果を返してください。"
         if node.kind == "end":
-            system_prompt = (
-                "あなたはWF型エージェントの終了ノードです。"
-                "これまでの流れを踏まえて最終結果だけを簡潔に返してください。"
-            )
+            kind_directive = "あなたは終了ノードです。これまでの流れを踏まえて最終結果だけを簡潔に返してください。"
 
         result = await self.llm.ainvoke(
             [
-                SystemMessage(content=system_prompt),
+                SystemMessage(content=_WORKFLOW_NODE_SYSTEM_PROMPT),
                 HumanMessage(
                     content=(
-                        f"ワークフロー仕様Markdown:\n{workflow_markdown}\n\n"
-                        f"現在のノードID: {node.id}\n"
+                        workflow_preamble
+                        + f"現在のノードID: {node.id}\n"
                         f"ノードの役割: {node.label}\n"
                         f"利用可能ツール:\n{allowed_tools_text}\n"
                         f"ユーザー入力: {state.get('input_text', '')}\n"
-                        f"これまでのノード出力:\n{previous_outputs_text}"
+                        f"これまでのノード出力:\n{previous_outputs_text}\n\n"
+                        f"ノード種別の指示: {kind_directive}"
                     )
                 ),
             ]
@@ -360,6 +429,17 @@ class WorkflowRunner(BaseModel):
         builder = LangGraphWorkflowBuilder(self.flowchart, self._executor)
         return builder.build(checkpointer=checkpointer)
 
+    def _prefetch_node_tools(self) -> asyncio.Task[list[Any]] | None:
+        if not isinstance(self._executor, DefaultWorkflowNodeExecutor):
+            return None
+        uses_tools = any(
+            node.metadata.get("allowed_tool_names") or node.metadata.get("dry_run_tool_names")
+            for node in self.flowchart.nodes
+        )
+        if not uses_tools:
+            return None
+        return self._executor.tool_agent_runtime.prefetch_tools()
+
     async def run(
         self,
         message: str,
@@ -370,6 +450,8 @@ class WorkflowRunner(BaseModel):
         resume_value: str = "",
     ) -> WorkflowRunResult | WorkflowPauseResult:
         graph = self.build(checkpointer=checkpointer)
+        # ツールを使うノードがある場合、MCPサーバーの起動を先頭ノードの実行と並行して始めておく
+        tools_prefetch = self._prefetch_node_tools()
         effective_thread_id = thread_id or str(uuid.uuid4())
         invocation: Any
         if resume_value.strip():
@@ -384,13 +466,17 @@ class WorkflowRunner(BaseModel):
                 "visit_counts": {},
                 "max_node_visits": self.max_node_visits,
             }
-        result = await graph.ainvoke(
-            invocation,
-            config={
-                "configurable": {"thread_id": effective_thread_id},
-                "recursion_limit": recursion_limit or max(25, self.max_node_visits * max(len(self.flowchart.nodes), 1)),
-            },
-        )
+        try:
+            result = await graph.ainvoke(
+                invocation,
+                config={
+                    "configurable": {"thread_id": effective_thread_id},
+                    "recursion_limit": recursion_limit or max(25, self.max_node_visits * max(len(self.flowchart.nodes), 1)),
+                },
+            )
+        finally:
+            if tools_prefetch is not None:
+                _discard_task(tools_prefetch)
         interrupts = result.get("__interrupt__") if isinstance(result, dict) else None
         if interrupts:
             first_interrupt = interrupts[0]
@@ -537,8 +623,7 @@ def _metadata_value(metadata: Any, key: str) -> str:
 
 
 def _metadata_bool(metadata: Any, key: str) -> bool:
-    value = _metadata_value(metadata, key).lower()
-    return value in {"1", "true", "yes", "y", "on"}
+    return is_truthy(_metadata_value(metadata, key))
 
 
 def _select_relevant_tools(
@@ -625,15 +710,15 @@ def _inject_review_nodes(flowchart: Flowchart) -> Flowchart:
     if not rewritten_targets:
         return flowchart
 
+    # Flowchart のインデックスは代入時に作り直されるため、その場で追記せず新しいリストを代入する
     flowchart.edges = [
-        edge.model_copy(update={"target": rewritten_targets.get(edge.target, edge.target)})
-        for edge in flowchart.edges
+        *(
+            edge.model_copy(update={"target": rewritten_targets.get(edge.target, edge.target)})
+            for edge in flowchart.edges
+        ),
+        *(GraphEdge(source=source, target=target) for source, target in added_edges),
     ]
-    for source, target in added_edges:
-        from ai_chat_util.app.workflow.workflow.flowchat import GraphEdge
-
-        flowchart.edges.append(GraphEdge(source=source, target=target))
-    flowchart.nodes.extend(added_nodes)
+    flowchart.nodes = [*flowchart.nodes, *added_nodes]
     return flowchart
 
 
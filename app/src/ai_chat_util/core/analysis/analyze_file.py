@@ -1,6 +1,5 @@
 from typing import Annotated, Literal
 import tempfile
-import atexit
 import time
 from pydantic import Field
 
@@ -38,23 +37,22 @@ async def analyze_file_urls(
         len(file_path_urls or []),
         detail,
     )
-    tmpdir = tempfile.TemporaryDirectory()
-    atexit.register(tmpdir.cleanup)
     llm_client = create_llm_client()
     try:
-        requests_verify, ca_bundle = _get_network_download_options()
-        path_list = DownLoader.download_files(
-            file_path_urls,
-            tmpdir.name,
-            requests_verify=requests_verify,
-            ca_bundle=ca_bundle,
-        )
-        response = await AnalyzeFileUtil.analyze_files(
-            llm_client,
-            path_list,
-            prompt,
-            detail,
-        )
+        with tempfile.TemporaryDirectory() as tmpdir:
+            requests_verify, ca_bundle = _get_network_download_options()
+            path_list = await DownLoader.download_files_async(
+                file_path_urls,
+                tmpdir,
+                requests_verify=requests_verify,
+                ca_bundle=ca_bundle,
+            )
+            response = await AnalyzeFileUtil.analyze_files(
+                llm_client,
+                path_list,
+                prompt,
+                detail,
+            )
         return response.output
     except Exception:
         logger.exception("MCP_TOOL_ERR tool=analyze_file_urls")
@@ -130,13 +130,7 @@ async def convert_office_files_to_pdf(
 
         def _convert_one(office_path: str) -> dict[str, str]:
             resolved_output_path = output_dir if output_dir is not None else _build_default_output_path(office_path)
-            if config.office2pdf.method == LibreOfficeExecOffice2PDFUtil.METHOD_NAME:
-                pdf_path = LibreOfficeExecOffice2PDFUtil.create_pdf_from_document_file(
-                    input_path=office_path,
-                    output_path=resolved_output_path,
-                    libreoffice_path=config.office2pdf.libreoffice_exec.libreoffice_path,
-                )
-            elif config.office2pdf.method == LibreOfficeUnoOffice2PDFUtil.METHOD_NAME:
+            if config.office2pdf.method == LibreOfficeUnoOffice2PDFUtil.METHOD_NAME:
                 pdf_path = LibreOfficeUnoOffice2PDFUtil.create_pdf_from_document_file(
                     input_path=office_path,
                     output_path=resolved_output_path,
@@ -158,6 +152,21 @@ async def convert_office_files_to_pdf(
                 raise RuntimeError(f"Unsupported Office2PDF method: {config.office2pdf.method}")
             return {"source_path": office_path, "pdf_path": str(pdf_path)}
 
+        if config.office2pdf.method == LibreOfficeExecOffice2PDFUtil.METHOD_NAME:
+            # libreoffice_exec はファイルごとに起動せず、出力先ディレクトリ単位で1回の soffice 起動にまとめる.
+            # 子プロセスの待機は asyncio 上で行うため、変換中も他の処理を進められる
+            pdf_paths = await LibreOfficeExecOffice2PDFUtil.create_pdfs_from_document_files_async(
+                office_path_list,
+                output_dir,
+                libreoffice_path=config.office2pdf.libreoffice_exec.libreoffice_path,
+                listener_pool_size=config.office2pdf.libreoffice_exec.listener_pool_size,
+                listener_max_tasks_per_process=config.office2pdf.libreoffice_exec.listener_max_tasks_per_process,
+            )
+            return [
+                {"source_path": office_path, "pdf_path": str(pdf_path)}
+                for office_path, pdf_path in zip(office_path_list, pdf_paths)
+            ]
+
         results: list[dict[str, str]] = await asyncio.gather(
             *[asyncio.to_thread(_convert_one, p) for p in office_path_list]
         )
@@ -5,6 +5,7 @@
 """
 from __future__ import annotations
 
+import itertools
 import time
 import json
 import re
@@ -32,6 +33,7 @@ from ai_chat_util.core.common.config.runtime import get_runtime_config
 import ai_chat_util.core.log.log_settings as log_settings
 import fitz  # PyMuPDF
 from ai_chat_util.util.analyze_file_util.file_util_llm_messages import FileUtilLLMMessages
+from ai_chat_util.core.common.concurrency import gather_per_item
 from ai_chat_util.util.analyze_file_util.office2pdf import (
     LibreOfficeExecOffice2PDFUtil,
     LibreOfficeUnoOffice2PDFUtil,
@@ -75,9 +77,9 @@ class AnalyzeImageUtil:
         image_content_list: list[ChatContent] = []
         encode_started = time.perf_counter()
         total_bytes = 0
-        # 各画像ファイルをエンコードしてコンテンツリストに追加する
-        for image_path in file_list:
-            doc = FileUtilDocument.from_file(document_path=image_path)
+        # 各画像ファイルを並列に読み込み、入力順にエンコードしてコンテンツリストに追加する
+        docs = await gather_per_item(file_list, FileUtilDocument.from_file_async)
+        for doc in docs:
             try:
                 total_bytes += len(doc.data or b"")
             except Exception:
@@ -127,17 +129,18 @@ class AnalyzeImageUtil:
         """
         # テキストプロンプトをチャットコンテンツに変換する
         prompt_content = llm_client.get_message_factory().create_text_content(text=prompt)
-        image_content_list: list[ChatContent] = []
         file_util_llm_messages = FileUtilLLMMessages(llm_client)
-        # 各URLの画像を非同期でエンコードしてコンテンツリストに追加する
-        for image_url in image_url_list:
-            image_contents = await file_util_llm_messages.create_image_content_from_url_async(
-                image_url, detail
-            )
-            image_content_list.extend(image_contents)
+        # 各URLの画像を並列に取得・エンコードし、入力順のまま結果を受け取る
+        async def _create_one(image_url: WebRequestModel) -> list[ChatContent]:
+            return await file_util_llm_messages.create_image_content_from_url_async(image_url, detail)
+
+        image_contents_per_url = await gather_per_item(image_url_list, _create_one)
 
         # プロンプトとURL画像コンテンツをまとめてチャットリクエストを構築し、LLMに送信する
-        chat_message = ChatMessage(role="user", content=[prompt_content] + image_content_list)
+        chat_message = ChatMessage(
+            role="user",
+            content=[prompt_content, *itertools.chain.from_iterable(image_contents_per_url)],
+        )
         chat_request: ChatRequest = ChatRequest(
             chat_history=ChatHistory(messages=[chat_message]), chat_request_context=None
         )
@@ -155,24 +158,23 @@ class AnalyzePDFUtil:
         detail: str = "auto",
     ) -> ChatResponse:
         prompt_content = llm_client.get_message_factory().create_text_content(text=prompt)
-        pdf_content_list = []
         config = llm_client.get_config()
         if not config:
             raise ValueError("LLMClientの設定が取得できませんでした。")
 
-        for file_path in file_list:
+        async def _create_one(file_path: str) -> list[ChatContent]:
+            pdf_data = await FileUtilDocument.read_bytes_async(file_path)
             if config.features.use_custom_pdf_analyzer:
                 logger.info(f"Using custom PDF analyzer for file: {file_path}")
-                with open(file_path, "rb") as f:
-                    pdf_data = f.read()
-                pdf_content = llm_client.get_message_factory()._create_custom_pdf_content_(file_path, pdf_data, detail)
-            else:
-                with open(file_path, "rb") as f:
-                    pdf_data = f.read()
-                pdf_content = llm_client.get_message_factory()._create_pdf_content_(file_path, pdf_data, detail)
-            pdf_content_list.extend(pdf_content)
-
-        chat_message = ChatMessage(role="user", content=[prompt_content] + pdf_content_list)
+                return await llm_client.get_message_factory()._create_custom_pdf_content_async_(file_path, pdf_data, detail)
+            return llm_client.get_message_factory()._create_pdf_content_(file_path, pdf_data, detail)
+
+        # 中間リストを作らず、プロンプトと各PDFのコンテンツから送信用のリストを1回で組み立てる
+        pdf_contents_per_file = await gather_per_item(file_list, _create_one)
+        chat_message = ChatMessage(
+            role="user",
+            content=[prompt_content, *itertools.chain.from_iterable(pdf_contents_per_file)],
+        )
         chat_request: ChatRequest = ChatRequest(
             chat_history=ChatHistory(messages=[chat_message]), chat_request_context=None
         )
@@ -217,15 +219,22 @@ class AnalyzePDFUtil:
         # ランタイム設定から変換方式を読み込み、各ファイルを変換する
         results: list[dict[str, str]] = []
         config = get_runtime_config()
+        if config.office2pdf.method == LibreOfficeExecOffice2PDFUtil.METHOD_NAME:
+            # libreoffice_exec は出力先ディレクトリごとに soffice を1回だけ起動してまとめて変換する
+            pdf_paths = LibreOfficeExecOffice2PDFUtil.create_pdfs_from_document_files(
+                file_path_list,
+                output_dir,
+                libreoffice_path=(libreoffice_path or config.office2pdf.libreoffice_exec.libreoffice_path),
+                listener_pool_size=config.office2pdf.libreoffice_exec.listener_pool_size,
+                listener_max_tasks_per_process=config.office2pdf.libreoffice_exec.listener_max_tasks_per_process,
+            )
+            return [
+                {"source_path": planned_item["source_path"], "pdf_path": str(pdf_path)}
+                for planned_item, pdf_path in zip(planned, pdf_paths)
+            ]
         for office_path, planned_item in zip(file_path_list, planned):
             resolved_output_path = output_dir if output_dir is not None else _build_default_output_path(office_path)
-            if config.office2pdf.method == LibreOfficeExecOffice2PDFUtil.METHOD_NAME:
-                pdf_path = LibreOfficeExecOffice2PDFUtil.create_pdf_from_document_file(
-                    input_path=office_path,
-                    output_path=resolved_output_path,
-                    libreoffice_path=(libreoffice_path or config.office2pdf.libreoffice_exec.libreoffice_path),
-                )
-            elif config.office2pdf.method == LibreOfficeUnoOffice2PDFUtil.METHOD_NAME:
+            if config.office2pdf.method == LibreOfficeUnoOffice2PDFUtil.METHOD_NAME:
                 pdf_path = LibreOfficeUnoOffice2PDFUtil.create_pdf_from_document_file(
                     input_path=office_path,
                     output_path=resolved_output_path,
@@ -305,22 +314,21 @@ class AnalyzeOfficeUtil:
         Returns:
             LLMからのチャットレスポンス。
         """
-        office_contents: list[ChatContent] = []
         file_util_llm_messages = FileUtilLLMMessages(llm_client)
-        # 各Officeファイルをコンテンツに変換してリストに追加する
-        for file_path in file_path_list:
-            with open(file_path, "rb") as f:
-                office_data = f.read()
-            pdf_content = file_util_llm_messages.create_office_content_from_file(
-                file_path, detail=detail
-            )
-            office_contents.extend(pdf_content)
+        # 各Officeファイルを並列にコンテンツへ変換し、入力順のまま結果を受け取る
+        async def _create_one(file_path: str) -> list[ChatContent]:
+            return await file_util_llm_messages.create_office_content_from_file_async(file_path, detail=detail)
+
+        office_contents_per_file = await gather_per_item(file_path_list, _create_one)
 
         # テキストプロンプトをチャットコンテンツに変換する
         prompt_content = file_util_llm_messages.create_text_content(text=prompt)
 
         # プロンプトとOfficeコンテンツをまとめてチャットリクエストを構築し、LLMに送信する
-        chat_message = ChatMessage(role="user", content=[prompt_content] + office_contents)
+        chat_message = ChatMessage(
+            role="user",
+            content=[prompt_content, *itertools.chain.from_iterable(office_contents_per_file)],
+        )
         chat_request: ChatRequest = ChatRequest(
             chat_history=ChatHistory(messages=[chat_message]), chat_request_context=None
         )
@@ -396,15 +404,19 @@ class AnalyzeFileUtil:
         content_list = []
         skipped_files: list[str] = []
         file_util_llm_messages = FileUtilLLMMessages(llm_client)
-        # ファイルを順に処理し、サポートされていない形式はスキップする
-        for file_path in file_path_list:
+        # ファイルを並列に処理し、サポートされていない形式は None を返してスキップする
+        async def _create_one(file_path: str) -> list[ChatContent] | None:
             try:
-                contents = file_util_llm_messages.create_multi_format_contents_from_file(
+                return await file_util_llm_messages.create_multi_format_contents_from_file_async(
                     file_path, detail=detail
                 )
             except ValueError as exc:
                 if "Unsupported document type" not in str(exc):
                     raise
+                return None
+
+        for file_path, contents in zip(file_path_list, await gather_per_item(file_path_list, _create_one)):
+            if contents is None:
                 skipped_files.append(file_path)
                 logger.info("FILE_ANALYZE_SKIP unsupported=%s", file_path)
                 continue
@@ -1,6 +1,8 @@
+import aiofiles
 from magika import Magika
 from magika.types import MagikaResult 
 from chardet.universaldetector import UniversalDetector
+from functools import lru_cache
 from pathlib import Path
 from datetime import datetime
 
@@ -10,6 +12,12 @@ logger = log_settings.getLogger(__name__)
 
 from enum import StrEnum
 
+
+@lru_cache(maxsize=1)
+def _get_magika() -> Magika:
+    """Magikaインスタンスを取得する（モデルのロードはプロセス内で1回だけ行う）"""
+    return Magika()
+
 class FileUtilDocumentType(StrEnum):
     TEXT = "text"
     PDF = "pdf"
@@ -58,6 +66,32 @@ class FileUtilDocument(BaseModel):
         
         return cls(data=byte_data, identifier=document_path)
 
+    @classmethod
+    async def read_bytes_async(cls, document_path: str) -> bytes:
+        """ファイルのバイト列をイベントループをブロックせずに読み込む
+
+        Args:
+            document_path: 読み込むファイルパス
+
+        Returns:
+            bytes: ファイルのバイト列
+        """
+        async with aiofiles.open(document_path, "rb") as f:
+            return await f.read()
+
+    @classmethod
+    async def from_file_async(cls, document_path: str) -> "FileUtilDocument":
+        """ファイルパスからDocumentTypeインスタンスを非同期で作成する
+
+        Args:
+            document_path: ドキュメントのファイルパス
+
+        Returns:
+            DocumentType: 作成されたDocumentTypeインスタンス
+        """
+        byte_data = await cls.read_bytes_async(document_path)
+        return cls(data=byte_data, identifier=document_path)
+
     @classmethod
     def identify_data_type(cls, data: bytes) -> tuple[str | None, str | None]:
         """バイト列のMIMEタイプとエンコーディングを判定する
@@ -70,7 +104,7 @@ class FileUtilDocument(BaseModel):
                 MIMEタイプ文字列とエンコーディング文字列のタプル。
                 判定失敗時は(None, None)
         """
-        m = Magika()
+        m = _get_magika()
         try:
             res: MagikaResult = m.identify_bytes(data) # type: ignore
             encoding = None
@@ -95,7 +129,7 @@ class FileUtilDocument(BaseModel):
                 MIMEタイプ文字列とエンコーディング文字列のタプル。
                 判定失敗時は(None, None)
         """
-        m = Magika()
+        m = _get_magika()
         # ファイルの種類を判定
         path = Path(filename)
         try:
@@ -1,10 +1,14 @@
-from pathlib import Path
+from __future__ import annotations
 
-from browser_use.llm.openai.chat import ChatOpenAI
+from pathlib import Path
+from typing import TYPE_CHECKING
 
 from ai_chat_util.core.common.config.runtime import get_runtime_config
 import ai_chat_util.core.log.log_settings as log_settings
 
+if TYPE_CHECKING:
+    from browser_use.llm.openai.chat import ChatOpenAI
+
 logger = log_settings.getLogger(__name__)
 
 # Default Chromium binary installed by `playwright install chromium`
@@ -28,6 +32,9 @@ def create_browser_llm() -> ChatOpenAI:
     Since litellm exposes an OpenAI-compatible API, ChatOpenAI works with any
     provider by pointing base_url at the litellm proxy endpoint.
     """
+    # browser-use は読み込みが重いため、ブラウザタスクを実行するときに初めて import する
+    from browser_use.llm.openai.chat import ChatOpenAI
+
     config = get_runtime_config()
     llm_config = config.llm
 
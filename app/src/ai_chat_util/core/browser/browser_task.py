@@ -3,16 +3,32 @@ from __future__ import annotations
 import json
 import time
 import traceback
-from typing import Annotated, Any
+from typing import TYPE_CHECKING, Annotated, Any
 
 from pydantic import Field, create_model
 
 from ai_chat_util.core.browser.base import create_browser_llm, get_default_chromium_path
-from ai_chat_util.core.browser.browser_task_util import BrowserTaskUtil
 import ai_chat_util.core.log.log_settings as log_settings
 
+if TYPE_CHECKING:
+    from ai_chat_util.core.browser.browser_task_util import BrowserTaskUtil
+
 logger = log_settings.getLogger(__name__)
 
+# browser-use を読み込んだ BrowserTaskUtil のキャッシュ（初回のブラウザタスク実行時に設定）
+_browser_task_util_cls: type[BrowserTaskUtil] | None = None
+
+
+def _get_browser_task_util() -> type[BrowserTaskUtil]:
+    # browser-use (playwright等を含む) の import はMCPサーバーの起動時間の大半を占めるため、
+    # ブラウザタスクが実際に呼ばれるまで遅延させる
+    global _browser_task_util_cls
+    if _browser_task_util_cls is None:
+        from ai_chat_util.core.browser.browser_task_util import BrowserTaskUtil
+
+        _browser_task_util_cls = BrowserTaskUtil
+    return _browser_task_util_cls
+
 
 _JSON_SCHEMA_PRIMITIVE_TYPES: dict[str, type] = {
     "string": str,
@@ -63,7 +79,7 @@ async def run_browser_task(
     if executable_path:
         logger.debug("Using Chromium at %s", executable_path)
     try:
-        result = await BrowserTaskUtil.run_task(
+        result = await _get_browser_task_util().run_task(
             task=task,
             browser_llm=browser_llm,
             allowed_domains=allowed_domains,
@@ -143,7 +159,7 @@ async def run_browser_task_with_output(
             _extract_array_item_types(model_schema),
         )
 
-        result = await BrowserTaskUtil.run_task_with_output(
+        result = await _get_browser_task_util().run_task_with_output(
             task=task,
             browser_llm=browser_llm,
             output_model_schema=output_model,
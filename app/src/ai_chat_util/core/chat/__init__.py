@@ -6,12 +6,26 @@ from .chat_client import LLMClient
 from .llm_messages_factory import LLMMessageContentFactory, LLMMessageContentFactoryBase
 
 
+# ランタイム設定で作成したクライアントのキャッシュ（設定オブジェクト, クライアント）
+_default_llm_client: tuple[AiChatUtilConfig, LLMClient] | None = None
+
+
 def create_llm_client(
     llm_config: AiChatUtilConfig | None = None,
 ) -> AbstractChatClient:
-    if llm_config is None:
-        llm_config = get_runtime_config()
-    return LLMClient(llm_config)
+    global _default_llm_client
+    if llm_config is not None:
+        return LLMClient(llm_config)
+
+    # LLMClient は会話状態を持たないため、ランタイム設定が同じ間はツール呼び出しごとに作り直さず使い回す.
+    # init_runtime で設定が再読込された場合は設定オブジェクトが変わるため作り直す.
+    llm_config = get_runtime_config()
+    cached = _default_llm_client
+    if cached is not None and cached[0] is llm_config:
+        return cached[1]
+    client = LLMClient(llm_config)
+    _default_llm_client = (llm_config, client)
+    return client
 
 __all__ = [
     "AbstractChatClient",
@@ -0,0 +1,167 @@
+import asyncio
+from pathlib import Path
+
+import litellm
+import pandas as pd
+import pytest
+
+from ai_chat_util.core.chat import batch_client_base as batch_mod
+from ai_chat_util.core.chat.batch_client_base import BatchClientBase, _RateLimitCooldown
+from ai_chat_util.core.chat.model import ChatContent, ChatHistory, ChatMessage, ChatRequest, ChatResponse
+
+
+class _FakeMessageFactory:
+    def create_text_content(self, text: str) -> ChatContent:
+        return ChatContent(params={"type": "text", "text": text})
+
+
+class _FakeLLMClient:
+    """プロンプトをそのまま返す。rate_limited[text] 回だけ先に RateLimitError を送出する。"""
+
+    def __init__(self, rate_limited: dict[str, int] | None = None):
+        self.rate_limited = dict(rate_limited or {})
+        self.calls: list[tuple[str, float]] = []
+
+    def get_message_factory(self) -> _FakeMessageFactory:
+        return _FakeMessageFactory()
+
+    async def chat(self, chat_request: ChatRequest) -> ChatResponse:
+        text = chat_request.chat_history.messages[0].content[0].params["text"]
+        self.calls.append((text, asyncio.get_running_loop().time()))
+        if self.rate_limited.get(text, 0) > 0:
+            self.rate_limited[text] -= 1
+            raise litellm.RateLimitError("rate limited", llm_provider="openai", model="fake")
+        await asyncio.sleep(0)
+        return ChatResponse(
+            messages=[ChatMessage(role="assistant", content=[ChatContent(params={"type": "text", "text": text})])],
+            input_tokens=0,
+            output_tokens=0,
+            documents=[],
+        )
+
+
+class _FakeBatchClient(BatchClientBase):
+    def __init__(self, llm_client: _FakeLLMClient):
+        self._fake_client = llm_client
+        super().__init__()
+
+    def _create_client(self, llm_config=None):
+        return self._fake_client
+
+
+def _request(text: str) -> ChatRequest:
+    content = ChatContent(params={"type": "text", "text": text})
+    return ChatRequest(chat_history=ChatHistory(messages=[ChatMessage(role="user", content=[content])]))
+
+
+@pytest.fixture(autouse=True)
+def _fast_backoff(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(batch_mod, "_RATE_LIMIT_BACKOFF_BASE_SECONDS", 0.01)
+    monkeypatch.setattr(batch_mod, "_RATE_LIMIT_BACKOFF_MAX_SECONDS", 0.05)
+
+
+def test_rate_limited_row_is_retried_until_success() -> None:
+    llm_client = _FakeLLMClient(rate_limited={"a": 2})
+    batch = _FakeBatchClient(llm_client)
+
+    responses = asyncio.run(batch.run_batch_chat([_request("a")], concurrency=1))
+
+    assert [text for text, _ in llm_client.calls] == ["a", "a", "a"]
+    assert responses[0][1].output == "a"
+
+
+def test_rate_limited_row_gives_up_after_max_retries(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(batch_mod, "_RATE_LIMIT_MAX_RETRIES", 2)
+    llm_client = _FakeLLMClient(rate_limited={"a": 10})
+    batch = _FakeBatchClient(llm_client)
+
+    async def _main():
+        return await batch._chat_with_rate_limit_retry(0, _request("a"), _RateLimitCooldown())
+
+    with pytest.raises(litellm.RateLimitError):
+        asyncio.run(_main())
+    # 初回 + 再試行2回
+    assert len(llm_client.calls) == 3
+
+    # バッチ経由では例外にならず、エラー行として返る
+    llm_client.calls.clear()
+    responses = asyncio.run(batch.run_batch_chat([_request("a")], concurrency=1))
+    assert len(llm_client.calls) == 3
+    assert responses[0][1].output.startswith("[ERROR] row=0: RateLimitError")
+
+
+def test_rate_limit_cooldown_is_shared_between_rows(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(batch_mod, "_RATE_LIMIT_BACKOFF_BASE_SECONDS", 0.2)
+    monkeypatch.setattr(batch_mod, "_RATE_LIMIT_BACKOFF_MAX_SECONDS", 0.2)
+    llm_client = _FakeLLMClient(rate_limited={"a": 1})
+    batch = _FakeBatchClient(llm_client)
+
+    async def _main():
+        cooldown = _RateLimitCooldown()
+        first = asyncio.create_task(batch._chat_with_rate_limit_retry(0, _request("a"), cooldown))
+        # "a" が429を受けた後に "b" を開始する
+        while not llm_client.calls:
+            await asyncio.sleep(0)
+        await asyncio.sleep(0)
+        await batch._chat_with_rate_limit_retry(1, _request("b"), cooldown)
+        await first
+
+    asyncio.run(_main())
+
+    times = dict(reversed(llm_client.calls))  # 各行の最初の呼び出し時刻
+    # 他の行が受けたレート制限の待機が明けるまで "b" も送信しない
+    assert times["b"] - times["a"] >= 0.15
+
+
+def test_rate_limited_row_releases_semaphore_while_waiting() -> None:
+    llm_client = _FakeLLMClient(rate_limited={"a": 1})
+    batch = _FakeBatchClient(llm_client)
+
+    async def _main():
+        sem = asyncio.Semaphore(1)
+        await asyncio.gather(
+            batch._chat_with_rate_limit_retry(0, _request("a"), None, sem),
+            batch._chat_with_rate_limit_retry(1, _request("b"), None, sem),
+        )
+
+    asyncio.run(_main())
+
+    # "a" のバックオフ中に "b" が同時実行枠を使って先に完了する
+    assert [text for text, _ in llm_client.calls] == ["a", "b", "a"]
+
+
+def test_simple_batch_chat_sends_duplicate_messages_once() -> None:
+    llm_client = _FakeLLMClient()
+    batch = _FakeBatchClient(llm_client)
+
+    outputs = asyncio.run(batch.run_simple_batch_chat("P", ["x", "y", "x", "z", "y"], concurrency=2))
+
+    assert sorted(text for text, _ in llm_client.calls) == ["P\nx", "P\ny", "P\nz"]
+    assert outputs == ["P\nx", "P\ny", "P\nx", "P\nz", "P\ny"]
+
+
+def test_batch_chat_from_excel_sends_duplicate_rows_once(tmp_path: Path) -> None:
+    llm_client = _FakeLLMClient()
+    batch = _FakeBatchClient(llm_client)
+    input_path = tmp_path / "in.xlsx"
+    output_path = tmp_path / "out.xlsx"
+    pd.DataFrame({"content": ["x", "y", "x", "y", "z"]}).to_excel(input_path, index=False)
+
+    asyncio.run(batch.run_batch_chat_from_excel("P", str(input_path), str(output_path), concurrency=2))
+
+    assert sorted(text for text, _ in llm_client.calls) == ["P\nx", "P\ny", "P\nz"]
+    result = pd.read_excel(output_path)
+    assert list(result["content"]) == ["x", "y", "x", "y", "z"]
+    assert list(result["output"]) == ["P\nx", "P\ny", "P\nx", "P\ny", "P\nz"]
+
+
+def test_simple_batch_chat_dispatches_longest_first_but_keeps_input_order() -> None:
+    llm_client = _FakeLLMClient()
+    batch = _FakeBatchClient(llm_client)
+    messages = ["bb", "a", "dddd", "ccc"]
+
+    outputs = asyncio.run(batch.run_simple_batch_chat("P", messages, concurrency=1))
+
+    # 同時実行数1なので送信順がそのまま観測できる
+    assert [text for text, _ in llm_client.calls] == ["P\ndddd", "P\nccc", "P\nbb", "P\na"]
+    assert outputs == [f"P\n{m}" for m in messages]
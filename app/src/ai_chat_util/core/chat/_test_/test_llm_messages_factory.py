@@ -0,0 +1,57 @@
+import pytest
+
+from ai_chat_util.core.chat import llm_messages_factory as factory_mod
+from ai_chat_util.core.chat.llm_messages_factory import _PdfElementsCache
+
+
+def _image(size: int) -> list[dict]:
+    return [{"type": "image", "bytes": b"x" * size, "mime_type": "image/png"}]
+
+
+def test_pdf_elements_cache_is_bounded_by_total_bytes() -> None:
+    cache = _PdfElementsCache(max_bytes=10, max_entry_bytes=8)
+    cache.put(b"a", _image(5))
+    cache.put(b"b", _image(5))
+    assert cache.get(b"a") is not None
+
+    cache.put(b"c", _image(5))
+    cache.put(b"big", _image(9))
+
+    assert cache.get(b"b") is None
+    assert cache.get(b"a") is not None
+    assert cache.get(b"c") is not None
+    assert cache.get(b"big") is None
+
+
+def test_extract_pdf_elements_returns_copy_of_cached_list(monkeypatch: pytest.MonkeyPatch) -> None:
+    calls: list[bytes] = []
+
+    def _fake_extract(data: bytes) -> list[dict]:
+        calls.append(data)
+        return [{"type": "text", "text": "page"}]
+
+    monkeypatch.setattr(factory_mod, "_pdf_elements_cache", _PdfElementsCache(max_bytes=1024))
+    monkeypatch.setattr(factory_mod.pdf_util, "extract_content_from_bytes", _fake_extract)
+
+    first = factory_mod._extract_pdf_elements(b"%PDF")
+    first.append({"type": "text", "text": "injected"})
+    second = factory_mod._extract_pdf_elements(b"%PDF")
+    second.clear()
+    third = factory_mod._extract_pdf_elements(b"%PDF")
+
+    assert calls == [b"%PDF"]
+    assert third == [{"type": "text", "text": "page"}]
+
+
+def test_pdf_page_images_keep_their_mime_type() -> None:
+    factory = factory_mod.LLMMessageContentFactory()
+    elements = [
+        {"type": "image", "bytes": b"\xff\xd8jpeg", "mime_type": "image/jpeg"},
+        {"type": "image", "bytes": b"\x89PNG"},
+    ]
+
+    contents = factory.__create_custom_pdf_contents_from_elements__("a.pdf", elements, "auto")
+
+    urls = [c.params["image_url"]["url"] for c in contents if c.params.get("type") == "image_url"]
+    assert urls[0].startswith("data:image/jpeg;base64,")
+    assert urls[1].startswith("data:image/png;base64,")
@@ -1,13 +1,18 @@
 import os
 import asyncio
+import contextlib
+import hashlib
 from abc import abstractmethod
 
 from tqdm.asyncio import tqdm_asyncio
+import litellm
 import pandas as pd
 
 from ai_chat_util.core.chat import AbstractChatClient
 from ai_chat_util.core.chat.model import ChatMessage, ChatResponse, ChatHistory, ChatContent, ChatRequest
 from ai_chat_util.core.common.config.runtime import AiChatUtilConfig
+from ai_chat_util.core.common.concurrency import gather_per_item
+from ai_chat_util.util.analyze_file_util.file_util_llm_messages import FileUtilLLMMessages
 
 import ai_chat_util.core.log.log_settings as log_settings
 
@@ -15,6 +20,52 @@ from .abstract_batch_client import AbstractBatchClient
 
 logger = log_settings.getLogger(__name__)
 
+# レート制限(429)を受けた行の再試行回数と、指数バックオフの初期値・上限(秒)
+_RATE_LIMIT_MAX_RETRIES = 5
+_RATE_LIMIT_BACKOFF_BASE_SECONDS = 0.5
+_RATE_LIMIT_BACKOFF_MAX_SECONDS = 10.0
+
+
+def _dedupe_rows(keys: list[bytes]) -> tuple[list[int], list[int]]:
+    '''
+    同じキーの行を1つにまとめる.
+    (LLMに送る一意な行の元インデックスのリスト, 各行が参照する一意な行の位置のリスト) を返す
+    '''
+    first_positions: dict[bytes, int] = {}
+    unique_rows: list[int] = []
+    positions: list[int] = []
+    for i, key in enumerate(keys):
+        pos = first_positions.get(key)
+        if pos is None:
+            pos = len(unique_rows)
+            first_positions[key] = pos
+            unique_rows.append(i)
+        positions.append(pos)
+    return unique_rows, positions
+
+
+def _row_key(*parts: str) -> bytes:
+    return hashlib.sha256("\0".join(parts).encode("utf-8")).digest()
+
+
+class _RateLimitCooldown:
+    '''
+    バッチ内の全行で共有する待機状態. いずれかの行がレート制限(429)を受けたら、
+    待機時間が明けるまで他の行も新しいリクエストを送らない.
+    同時実行数を固定したままでも、クォータを超えた分だけ全体の送信ペースが自動的に下がる.
+    '''
+    def __init__(self) -> None:
+        self._resume_at = 0.0
+
+    async def wait(self) -> None:
+        loop = asyncio.get_running_loop()
+        while (delay := self._resume_at - loop.time()) > 0:
+            await asyncio.sleep(delay)
+
+    def extend(self, delay: float) -> None:
+        loop = asyncio.get_running_loop()
+        self._resume_at = max(self._resume_at, loop.time() + delay)
+
 
 class BatchClientBase(AbstractBatchClient):
     def __init__(self, llm_config: AiChatUtilConfig | None = None) -> None:
@@ -24,13 +75,47 @@ class BatchClientBase(AbstractBatchClient):
     def _create_client(self, llm_config: AiChatUtilConfig | None = None) -> AbstractChatClient:
         raise NotImplementedError
 
-    async def _run_one_(self, i: int, chat_history: ChatRequest, sem: asyncio.Semaphore, progress: tqdm_asyncio) -> tuple[int, ChatResponse]:
+    async def _run_one_(
+            self, i: int, chat_history: ChatRequest, sem: asyncio.Semaphore, progress: tqdm_asyncio,
+            cooldown: _RateLimitCooldown | None = None,
+            ) -> tuple[int, ChatResponse]:
         # Semaphore is effective only when each task acquires it.
-        async with sem:
-            return await self._process_row_(i, chat_history, progress)
+        # レート制限の待機中は枠を手放せるよう、取得はLLM呼び出しの直前に行う
+        return await self._process_row_(i, chat_history, progress, cooldown, sem)
+
+    async def _chat_with_rate_limit_retry(
+            self, row_num: int, chat_request: ChatRequest, cooldown: _RateLimitCooldown | None,
+            sem: asyncio.Semaphore | None = None,
+            ) -> ChatResponse:
+        '''
+        レート制限(429)を受けた場合は指数バックオフで再試行する. 待機はバッチ全体で共有する.
+        sem はLLM呼び出しの間だけ保持し、待機中の行が同時実行枠を占有しないようにする
+        '''
+        attempt = 0
+        while True:
+            if cooldown is not None:
+                await cooldown.wait()
+            try:
+                async with sem if sem is not None else contextlib.nullcontext():
+                    return await self.llm_client.chat(chat_request)
+            except litellm.RateLimitError:
+                if attempt >= _RATE_LIMIT_MAX_RETRIES:
+                    raise
+                delay = min(_RATE_LIMIT_BACKOFF_BASE_SECONDS * (2 ** attempt), _RATE_LIMIT_BACKOFF_MAX_SECONDS)
+                attempt += 1
+                logger.warning(
+                    "Batch row rate limited; retrying: row=%s attempt=%s/%s delay=%.1fs",
+                    row_num, attempt, _RATE_LIMIT_MAX_RETRIES, delay,
+                )
+                if cooldown is not None:
+                    cooldown.extend(delay)
+                else:
+                    await asyncio.sleep(delay)
 
     async def _process_row_(
-            self, row_num: int, chat_request: ChatRequest, progress: tqdm_asyncio
+            self, row_num: int, chat_request: ChatRequest, progress: tqdm_asyncio,
+            cooldown: _RateLimitCooldown | None = None,
+            sem: asyncio.Semaphore | None = None,
             ) -> tuple[int, ChatResponse]:
 
         if not chat_request.chat_history.messages:
@@ -38,7 +123,7 @@ class BatchClientBase(AbstractBatchClient):
             chat_response = ChatResponse(messages=[ChatMessage(role="assistant", content=[])], input_tokens=0, output_tokens=0, documents=[])
         else:
             try:
-                chat_response = await self.llm_client.chat(chat_request)
+                chat_response = await self._chat_with_rate_limit_retry(row_num, chat_request, cooldown, sem)
             except asyncio.CancelledError:
                 raise
             except Exception as e:
@@ -74,8 +159,12 @@ class BatchClientBase(AbstractBatchClient):
         progress.bar_format = "{l_bar}{bar}| {n_fmt}/{total_fmt} [{elapsed}<{remaining}, {rate_fmt}]"
 
         sem = asyncio.Semaphore(concurrency)
+        cooldown = _RateLimitCooldown()
 
-        tasks = [asyncio.create_task(self._run_one_(i, chat_request, sem, progress)) for i, chat_request in enumerate(chat_requests)]
+        tasks = [
+            asyncio.create_task(self._run_one_(i, chat_request, sem, progress, cooldown))
+            for i, chat_request in enumerate(chat_requests)
+        ]
 
         try:
             responses = await asyncio.gather(*tasks)
@@ -90,19 +179,26 @@ class BatchClientBase(AbstractBatchClient):
         '''
         指定されたメッセージリストに対して、指定されたプロンプトを用いてバッチ処理を行う。
         '''
+        # 同じメッセージの行はLLMに1回だけ送り、結果を共有する
+        unique_rows, positions = _dedupe_rows([_row_key(prompt, msg) for msg in messages])
+
+        # 長いメッセージほど応答に時間がかかりやすいため、長いものから先に送り出す.
+        # 最後に長い応答だけが残って全体の完了が遅れる（テールレイテンシ）のを抑える
+        dispatch_order = sorted(range(len(unique_rows)), key=lambda pos: len(messages[unique_rows[pos]]), reverse=True)
+
         chat_requests: list[ChatRequest] = []
-        for msg in messages:
-            chat_content = self.llm_client.get_message_factory().create_text_content(text=f"{prompt}\n{msg}")
+        for pos in dispatch_order:
+            chat_content = self.llm_client.get_message_factory().create_text_content(text=f"{prompt}\n{messages[unique_rows[pos]]}")
             chat_message = ChatMessage(role="user", content=[chat_content])
             chat_history = ChatHistory(messages=[chat_message])
             chat_requests.append(ChatRequest(chat_history=chat_history))
 
         responses = await self.run_batch_chat(chat_requests, concurrency)
-        response_messages = []
-        for _, chat_response in responses:
-            response_messages.append(chat_response.output)
+        unique_outputs = [""] * len(unique_rows)
+        for i, chat_response in responses:
+            unique_outputs[dispatch_order[i]] = chat_response.output
 
-        return response_messages
+        return [unique_outputs[pos] for pos in positions]
 
     async def run_batch_chat_from_excel(
             self, prompt: str,
@@ -132,26 +228,44 @@ class BatchClientBase(AbstractBatchClient):
         if file_path_column in df.columns:
             df[file_path_column] = df[file_path_column].fillna("").astype(str)
 
-        # 指定された入力列からメッセージを取得
-        # 1行ずつ読み込んで、ChatHistoryオブジェクトのリストを作成
-        chat_requests: list[ChatRequest] = []
+        # 指定された入力列からメッセージとファイルパスを取得
+        rows: list[tuple[str, str]] = []
         for _, row in df.iterrows():
-            contents: list[ChatContent] = []
             input_message = str(row[content_column]) if content_column in df.columns else ""
             file_path = str(row[file_path_column]) if file_path_column in df.columns else ""
+            rows.append((input_message, file_path))
+
+        # 入力メッセージとファイルパスが同じ行は、ファイル変換もLLM呼び出しも1回だけ行い結果を共有する
+        unique_rows, positions = _dedupe_rows([_row_key(input_message, file_path) for input_message, file_path in rows])
+        unique_items = [rows[i] for i in unique_rows]
+
+        # ファイルの読み込み・変換は行ごとに独立しているため、LLM呼び出しと同じ同時実行数で並列に行う
+        file_util_llm_messages = FileUtilLLMMessages(self.llm_client)
+
+        async def _create_file_contents(file_path: str) -> list[ChatContent]:
+            # ファイルが存在しない場合はfile_pathを無視
+            if not os.path.isfile(file_path):
+                return []
+            logger.info(f"Processing file: {file_path}")
+            return await file_util_llm_messages.create_multi_format_contents_from_file_async(
+                file_path, detail=detail
+            )
+
+        file_contents_list = await gather_per_item(
+            [file_path for _, file_path in unique_items], _create_file_contents, concurrency_limit=concurrency
+        )
+
+        # 1行ずつ、ChatRequestオブジェクトのリストを作成
+        chat_requests: list[ChatRequest] = []
+        for (input_message, file_path), file_contents in zip(unique_items, file_contents_list):
             # input_messageとfile_pathの両方が空の場合はスキップ
             if not input_message and not file_path:
                 chat_requests.append(ChatRequest(chat_history=ChatHistory(messages=[])))
                 continue
-            contents.append(self.llm_client.get_message_factory().create_text_content(text=f"{prompt}\n{input_message}"))
-            # ファイルが存在しない場合はfile_pathを無視
-            if os.path.isfile(file_path):
-                logger.info(f"Processing file: {file_path}")
-                file_content = self.llm_client.get_message_factory().create_multi_format_contents_from_file(
-                    file_path=file_path,
-                    detail=detail
-                )
-                contents.extend(file_content)
+            contents: list[ChatContent] = [
+                self.llm_client.get_message_factory().create_text_content(text=f"{prompt}\n{input_message}")
+            ]
+            contents.extend(file_contents)
 
             chat_message = ChatMessage(
                 role="user",
@@ -164,7 +278,8 @@ class BatchClientBase(AbstractBatchClient):
         results = await self.run_batch_chat(chat_requests, concurrency)
 
         # 結果を指定された出力列に追加
-        df[output_column] = [response.output for _, response in results]
+        unique_outputs = [response.output for _, response in results]
+        df[output_column] = [unique_outputs[pos] for pos in positions]
 
         # 結果を新しいExcelファイルに保存
         df.to_excel(output_excel_path, index=False)
\ No newline at end of file
@@ -11,6 +11,7 @@ from ai_chat_util.core.chat.model import (
 from .llm_messages_factory import LLMMessageContentFactoryBase, LLMMessageContentFactory
 from .chat_client_base import ChatClientBase
 
+import aiohttp
 import litellm
 
 import ai_chat_util.core.log.log_settings as log_settings
@@ -61,26 +62,24 @@ class LLMClient(ChatClientBase):
     async def run_litellm_chat_completion(
         self, llm_config: AiChatUtilConfig, chat_request: ChatRequest, default_timeout_seconds, **kwargs
     ) -> ChatResponse:
+        # 属性参照をローカル変数に束縛しておく（メッセージ数に比例するループで毎回辿らない）
+        llm_section = llm_config.llm
         messages = chat_request.chat_history.messages
-        message_dict_list: list[dict[str, Any]] = [msg.model_dump() for msg in messages]
+        dump = ChatMessage.model_dump
+        message_dict_list: list[dict[str, Any]] = [dump(msg) for msg in messages]
         params = {}
         # api_key の解決/未設定エラーは設定ロード時(runtime)に行う。
-        provider = (llm_config.llm.provider or "").lower()
-        api_key = llm_config.llm.api_key
-        params["api_key"] = api_key
-        params["model"] = f"{llm_config.llm.provider}/{llm_config.llm.completion_model}"
+        provider = (llm_section.provider or "").lower()
+        params["api_key"] = llm_section.api_key
+        params["model"] = f"{llm_section.provider}/{llm_section.completion_model}"
         params["messages"] = message_dict_list
-        if llm_config.llm.base_url:
-            params["base_url"] = llm_config.llm.base_url
-        if llm_config.llm.api_version:
-            params["api_version"] = llm_config.llm.api_version
-        extra_headers = getattr(llm_config.llm, "extra_headers", None)
+        if llm_section.base_url:
+            params["base_url"] = llm_section.base_url
+        if llm_section.api_version:
+            params["api_version"] = llm_section.api_version
+        extra_headers = llm_section.get_litellm_extra_headers()
         if extra_headers:
-            filtered = {
-                k: v for k, v in extra_headers.items() if not (k or "").lower().startswith("x-mcp-")
-            }
-            if filtered:
-                params["extra_headers"] = filtered
+            params["extra_headers"] = extra_headers
 
         # タイムアウトが未指定だと、ネットワーク待ちで無限に止まることがある
         kwargs.setdefault("timeout", default_timeout_seconds)
@@ -118,56 +117,82 @@ class LLMClient(ChatClientBase):
         logger.debug("LLM completion response type: %s", type(response))
 
         if isinstance(response, litellm.ModelResponse):
-            # NOTE: litellm.ModelResponse は実行時に usage が載りますが、型定義上は
-            # 属性として見えないことがあるため dict-style access を使う。
-            usage = response.get("usage") or {}
-            output_tokens = int(usage.get("completion_tokens", 0) or 0)
-            input_tokens = int(usage.get("prompt_tokens", 0) or 0)
-
-            choices = cast(list[Any], response.get("choices") or [])
-            output = ""
-            if choices:
-                first_choice = cast(Any, choices[0])
-                # OpenAI互換の {"message": {"content": "..."}} を優先して読む
-                if isinstance(first_choice, dict):
-                    message = first_choice.get("message")
-                else:
-                    message = getattr(first_choice, "message", None)
-
-                if isinstance(message, dict):
-                    output = message.get("content") or ""
-                else:
-                    output = getattr(message, "content", "") or ""
-
-            # choicesが空 or contentが空の場合は、明示的に失敗させて原因をユーザーに見せる。
-            # （"何も出力されない" 体験を避ける）
-            if not choices:
-                err = response.get("error")
-                if err:
-                    raise RuntimeError(f"LLM応答にエラーが含まれています: {err}")
-                response_dict = cast(dict[str, Any], response)
-                raise RuntimeError(
-                    "LLM応答の choices が空でした。"
-                    f" response_keys={list(response_dict.keys())}"
-                )
-            if not str(output).strip():
-                err = response.get("error")
-                if err:
-                    raise RuntimeError(f"LLM応答にエラーが含まれています: {err}")
-                response_dict = cast(dict[str, Any], response)
-                raise RuntimeError(
-                    "LLM応答の content が空でした。"
-                    f" response_keys={list(response_dict.keys())}"
-                )
+            output, input_tokens, output_tokens = self._extract_completion_fields(response)
 
-            return ChatResponse(
-                messages=[ChatMessage(role="assistant", content=[ChatContent(params={"type": "text", "text": output})])],
+            # 必要なのは出力テキストとトークン数だけなので、検証済みの値から
+            # model_construct で直接組み立て、pydantic の再検証を省く。
+            text_content = ChatContent.model_construct(params={"type": "text", "text": output})
+            return ChatResponse.model_construct(
+                messages=[ChatMessage.model_construct(role="assistant", content=[text_content])],
                 input_tokens=input_tokens,
                 output_tokens=output_tokens
             )
         raise TypeError(f"Unexpected response type: {type(response)!r}")
 
 
+    @staticmethod
+    def _extract_completion_fields(response: litellm.ModelResponse) -> tuple[str, int, int]:
+        '''
+        LiteLLMの応答から、出力テキスト・入力トークン数・出力トークン数の3値だけを取り出す.
+        属性チェーンを辿らず、dict-style accessで1回ずつ読み出す.
+
+        Args:
+            response (litellm.ModelResponse): LiteLLMの応答
+        Returns:
+            tuple[str, int, int]: (出力テキスト, 入力トークン数, 出力トークン数)
+        '''
+        # NOTE: litellm.ModelResponse は実行時に usage が載りますが、型定義上は
+        # 属性として見えないことがあるため dict-style access を使う。
+        usage = response.get("usage") or {}
+        output_tokens = int(usage.get("completion_tokens", 0) or 0)
+        input_tokens = int(usage.get("prompt_tokens", 0) or 0)
+
+        choices = cast(list[Any], response.get("choices") or [])
+        output = ""
+        if choices:
+            first_choice = cast(Any, choices[0])
+            # OpenAI互換の {"message": {"content": "..."}} を優先して読む
+            if isinstance(first_choice, dict):
+                message = first_choice.get("message")
+            else:
+                message = getattr(first_choice, "message", None)
+
+            if isinstance(message, dict):
+                output = message.get("content") or ""
+            else:
+                output = getattr(message, "content", "") or ""
+
+        # choicesが空 or contentが空の場合は、明示的に失敗させて原因をユーザーに見せる。
+        # （"何も出力されない" 体験を避ける）
+        if not choices or not str(output).strip():
+            err = response.get("error")
+            if err:
+                raise RuntimeError(f"LLM応答にエラーが含まれています: {err}")
+            response_dict = cast(dict[str, Any], response)
+            field_name = "choices" if not choices else "content"
+            raise RuntimeError(
+                f"LLM応答の {field_name} が空でした。"
+                f" response_keys={list(response_dict.keys())}"
+            )
+
+        return str(output), input_tokens, output_tokens
+
+
+    def _create_shared_session_(self) -> aiohttp.ClientSession | None:
+        '''
+        分割リクエストの並列実行で共有する aiohttp.ClientSession を作成する.
+        LiteLLM は呼び出しごとに aiohttp transport を経由するため、shared_session を渡すことで
+        リクエスト間でコネクションを再利用させる. 接続数の上限は concurrency_limit に揃える.
+        LiteLLM 側で aiohttp transport が無効化されている場合は None を返す.
+
+        Returns:
+            aiohttp.ClientSession | None: 共有セッション
+        '''
+        if litellm.disable_aiohttp_transport:
+            return None
+        connector = aiohttp.TCPConnector(limit=self.concurrency_limit)
+        return aiohttp.ClientSession(connector=connector, trust_env=litellm.aiohttp_trust_env)
+
     async def __normal_chat__(self, chat_request: ChatRequest, **kwargs) -> ChatResponse:
         '''
         LLMに対してChatCompletionを実行する.
@@ -212,29 +237,32 @@ class LLMClient(ChatClientBase):
         preprocessed_messages = self.get_message_factory().__preprocess_text_message__(last_user_messages, request_context)
         preprocessed_messages = self.get_message_factory().__preprocess_image_urls__(preprocessed_messages, request_context)
 
-        # LLMに対してChatCompletionを実行. messageごとにasyncioのタスクを作成して実行する
-        async def __process_message__(message_num: int, message: ChatMessage, previous_messages: list[ChatMessage]) -> tuple[int, ChatResponse]:
-            client = self.create(self.llm_config)
-            chat_request: ChatRequest = ChatRequest(chat_history=ChatHistory(messages=previous_messages), chat_request_context=request_context)
-            
-            chat_request.chat_history.add_message(message)
-            chat_response =  await client._chat_completion_(chat_request, **kwargs)
-            return (message_num, chat_response)
-            
-        chat_response_tuples: list[tuple[int, ChatResponse]] = []
-
+        # LLMに対してChatCompletionを実行. messageごとにasyncioのタスクを作成して並列実行する
         sem = asyncio.Semaphore(self.concurrency_limit)
+        session = self._create_shared_session_()
+        if session is not None:
+            # 並列実行する全リクエストで1つのHTTPセッション（コネクションプール）を共有する
+            kwargs.setdefault("shared_session", session)
 
-        async def __run_one__(i: int, message: ChatMessage) -> tuple[int, ChatResponse]:
+        async def __process_message__(message: ChatMessage) -> ChatResponse:
             async with sem:
-                return await __process_message__(i, message, previous_messages)
-
-        tasks = [asyncio.create_task(__run_one__(i, message)) for i, message in enumerate(preprocessed_messages)]
-        chat_response_tuples = await asyncio.gather(*tasks)
+                # _chat_completion_ はクライアントの状態を変更しないため、メッセージごとに
+                # クライアントを作成せず self をそのまま使う.
+                # 既存履歴の浅いスナップショットに対象メッセージを加えたものを、このタスク専用の履歴とする
+                chat_request: ChatRequest = ChatRequest(
+                    chat_history=ChatHistory(messages=[*previous_messages, message]),
+                    chat_request_context=request_context
+                )
+                return await self._chat_completion_(chat_request, **kwargs)
 
-        # message_numでソートしてCompletionResponseのリストを作成
-        chat_response_tuples.sort(key=lambda x: x[0])
-        chat_responses = [t[1] for t in chat_response_tuples]
+        try:
+            # asyncio.gather は引数の順序で結果を返すため、メッセージ順の並べ替えは不要
+            chat_responses: list[ChatResponse] = list(await asyncio.gather(
+                *[__process_message__(message) for message in preprocessed_messages]
+            ))
+        finally:
+            if session is not None:
+                await session.close()
 
         # 後処理を実行
         postprocessed_response = await self.__postprocess_messages__(chat_responses, request_context)
@@ -132,9 +132,9 @@ class ChatClientBase(AbstractChatClient, ABC):
                 return chat_responses[0]
 
             # split_modeがsplit_and_summarize以外の場合は、各テキストの冒頭に[answer_part_i]を付与して結合する
-            result_text = ""
-            for i, chat_response in enumerate(chat_responses):
-                result_text += f"[answer_part_{i+1}]\n" + chat_response.output + "\n"
+            result_text = "".join(
+                f"[answer_part_{i+1}]\n{chat_response.output}\n" for i, chat_response in enumerate(chat_responses)
+            )
             return ChatResponse(
                 messages=[
                     ChatMessage(role="assistant", content=[
@@ -146,19 +146,10 @@ class ChatClientBase(AbstractChatClient, ABC):
         if not request_context.summarize_prompt_text:
             raise ValueError("summarize_prompt_text must be set when split_mode is 'split_and_summarize'")
         # split_modeがsplit_and_summarizeの場合は要約を実施する
-        summmarize_request_text = request_context.summarize_prompt_text + "\n"
-        for chat_response in chat_responses:
-            summmarize_request_text += chat_response.output + "\n"
-
-        # request_contextはsplit_modeをnoneに設定して要約を実施する
-        request_context = ChatRequestContext(
-            split_mode=ChatRequestContext.split_mode_name_none,
-            summarize_prompt_text=request_context.summarize_prompt_text
-        )
-        chat_request: ChatRequest = ChatRequest(
-            chat_history=ChatHistory(
-                messages=[]
-                ), chat_request_context=request_context)
+        summmarize_request_text = "\n".join(
+            [request_context.summarize_prompt_text, *(chat_response.output for chat_response in chat_responses)]
+        ) + "\n"
+
         client = self.create(self.get_config())
         text_content = client.get_message_factory().create_text_content(summmarize_request_text)
         message = ChatMessage(
@@ -1,13 +1,17 @@
 from __future__ import annotations
 
-from typing import Optional
+from typing import Any, Optional
 from io import BytesIO
 import os
 import uuid
 import tempfile
-import atexit
 import base64
+import asyncio
+import hashlib
+import threading
 from abc import ABC, abstractmethod
+from collections import OrderedDict
+from functools import lru_cache
 
 from docx import Document as WordDocument
 from openpyxl import load_workbook
@@ -24,16 +28,92 @@ import ai_chat_util.core.log.log_settings as log_settings
 logger = log_settings.getLogger(__name__)
 
 
+@lru_cache(maxsize=64)
+def _b64_for_path(path: str, mtime_ns: int, size: int) -> str:
+    '''
+    ファイルを読み込んでbase64文字列に変換する.
+    同じ画像を複数回参照する場合に再読込・再エンコードしないよう、パス・更新時刻・サイズをキーにキャッシュする
+    '''
+    with open(path, "rb") as f:
+        return base64.b64encode(f.read()).decode("ascii")
+
+
+def _pdf_elements_size(pdf_elements: tuple[dict[str, Any], ...]) -> int:
+    # キャッシュ容量の目安として、ページ画像のバイト数とテキストの文字数を合計する
+    return sum(len(element.get("bytes") or b"") + len(element.get("text") or "") for element in pdf_elements)
+
+
+class _PdfElementsCache:
+    """PDFの内容（SHA-256）→ ページごとの抽出結果のLRUキャッシュ。合計サイズが max_bytes を超えたら古いものから破棄する。"""
+
+    def __init__(self, max_bytes: int, max_entry_bytes: int | None = None):
+        self.max_bytes = max_bytes
+        # 1エントリあたりの上限. ページ数の多いPDFで他のエントリがすべて追い出されないよう、これを超える結果はキャッシュしない
+        self.max_entry_bytes = max_bytes if max_entry_bytes is None else min(max_entry_bytes, max_bytes)
+        self._entries: OrderedDict[bytes, tuple[tuple[dict[str, Any], ...], int]] = OrderedDict()
+        self._total_bytes = 0
+        # 非同期版からはスレッドで呼ばれるため、ロックで保護する
+        self._lock = threading.Lock()
+
+    def get(self, key: bytes) -> list[dict[str, Any]] | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            self._entries.move_to_end(key)
+        # 呼び出し元がリストを変更してもキャッシュが壊れないよう、コピーを返す
+        return list(entry[0])
+
+    def put(self, key: bytes, pdf_elements: list[dict[str, Any]]) -> None:
+        elements = tuple(pdf_elements)
+        size = _pdf_elements_size(elements)
+        if size > self.max_entry_bytes:
+            return
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self._total_bytes -= old[1]
+            self._entries[key] = (elements, size)
+            self._total_bytes += size
+            while self._total_bytes > self.max_bytes and self._entries:
+                _, (_, evicted_size) = self._entries.popitem(last=False)
+                self._total_bytes -= evicted_size
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._total_bytes = 0
+
+
+# ページ画像を含むため、件数ではなく合計サイズで上限を設ける
+_pdf_elements_cache = _PdfElementsCache(max_bytes=256 * 1024 * 1024, max_entry_bytes=64 * 1024 * 1024)
+
+
+def _extract_pdf_elements(data: bytes) -> list[dict[str, Any]]:
+    '''
+    PDFのバイトデータからページごとのテキスト・画像を抽出する.
+    同じPDFを異なるプロンプトで繰り返し解析する場合にページの再描画を避けるため、内容のハッシュをキーにキャッシュする
+    '''
+    key = hashlib.sha256(data).digest()
+    cached = _pdf_elements_cache.get(key)
+    if cached is not None:
+        return cached
+
+    pdf_elements = pdf_util.extract_content_from_bytes(data)
+    _pdf_elements_cache.put(key, pdf_elements)
+    return pdf_elements
+
+
 class LLMMessageContentFactoryBase(ABC):
 
     def is_text_content(self, content: ChatContent) -> bool:
-        return content.params.get("type") == "text"
+        return content.kind == "text"
 
     def is_image_content(self, content: ChatContent) -> bool:
-        return content.params.get("type") == "image_url"
+        return content.kind == "image_url"
 
     def is_file_content(self, content: ChatContent) -> bool:
-        return content.params.get("type") == "file"
+        return content.kind == "file"
 
     def get_user_role_name(self) -> str:
         return "user"
@@ -66,8 +146,24 @@ class LLMMessageContentFactoryBase(ABC):
         params = {"type": "text", "text": text}
         return ChatContent(params=params)
 
-    def create_image_content(self, identifier: str, data: bytes, detail: str) -> list["ChatContent"]:
-        return self._create_image_content_(identifier, data, detail)
+    def create_image_content(
+        self, identifier: str, data: bytes, detail: str, mime_type: str = "image/png"
+    ) -> list["ChatContent"]:
+        return self._create_image_content_(identifier, data, detail, mime_type)
+
+    def create_image_content_from_file(self, file_path: str, detail: str) -> list["ChatContent"]:
+        stat = os.stat(file_path)
+        base64_image = _b64_for_path(file_path, stat.st_mtime_ns, stat.st_size)
+        return self._create_image_content_from_base64_(file_path, base64_image, detail)
+
+    def _create_image_content_from_base64_(
+        self, identifier: str, base64_image: str, detail: str, mime_type: str = "image/png"
+    ) -> list["ChatContent"]:
+        '''
+        base64エンコード済みの画像からChatContentのリストを生成する.
+        サブクラスでオーバーライドしない場合は、バイト列に戻して _create_image_content_ に委譲する
+        '''
+        return self._create_image_content_(identifier, base64.b64decode(base64_image), detail, mime_type)
 
     def create_pdf_content(self, identifier: str, data: bytes, detail: str = "auto") -> list["ChatContent"]:
         config = self.get_config()
@@ -84,16 +180,45 @@ class LLMMessageContentFactoryBase(ABC):
         '''
         PDFファイルのバイトデータから、テキスト抽出と画像抽出を行い、ChatContentのリストを生成して返す
         '''
+        # PDFからテキストと画像を抽出
+        pdf_elements = _extract_pdf_elements(data)
+        return self.__create_custom_pdf_contents_from_elements__(identifier, pdf_elements, detail)
+
+    async def _create_custom_pdf_content_async_(self, identifier: str, data: bytes, detail: str = "auto") -> list["ChatContent"]:
+        '''
+        _create_custom_pdf_content_ の非同期版.
+        PyMuPDFによるページ単位のテキスト・画像抽出はCPU処理でイベントループをブロックするため、スレッドで実行する
+        '''
+        loop = asyncio.get_running_loop()
+        pdf_elements = await loop.run_in_executor(None, _extract_pdf_elements, data)
+        return self.__create_custom_pdf_contents_from_elements__(identifier, pdf_elements, detail)
+
+    async def create_pdf_content_async(self, identifier: str, data: bytes, detail: str = "auto") -> list["ChatContent"]:
+        '''
+        create_pdf_content の非同期版. カスタムPDFアナライザ使用時の抽出処理をスレッドで実行する
+        '''
+        config = self.get_config()
+        if not config:
+            raise ValueError("LLMClientの設定が取得できませんでした。")
+
+        if config.features.use_custom_pdf_analyzer:
+            return await self._create_custom_pdf_content_async_(identifier, data, detail=detail)
+        return self._create_pdf_content_(identifier, data, detail=detail)
+
+    def __create_custom_pdf_contents_from_elements__(
+        self, identifier: str, pdf_elements: list[dict], detail: str
+    ) -> list["ChatContent"]:
         page_info_content = self.create_text_content(text=f"PDFファイル: {identifier} の内容を以下に示します。")
         pdf_contents = [page_info_content]
-        # PDFからテキストと画像を抽出
-        pdf_elements = pdf_util.extract_content_from_bytes(data)
         for element in pdf_elements:
             if element["type"] == "text":
                 text_content = self.create_text_content(text=element["text"])
                 pdf_contents.append(text_content)
             elif element["type"] == "image":
-                image_content = self._create_image_content_(identifier, element["bytes"], detail)
+                # ページ画像は PNG とは限らないため、抽出時の形式をそのまま data URL に反映する
+                image_content = self._create_image_content_(
+                    identifier, element["bytes"], detail, element.get("mime_type", "image/png")
+                )
                 pdf_contents.extend(image_content)
 
         return pdf_contents
@@ -155,35 +280,30 @@ class LLMMessageContentFactoryBase(ABC):
             # 分割しない設定の場合はそのまま返す
             return __insert_prompt_template__(chat_message_list, request_context)
 
-        # textタイプのcontentを抽出する
-        text_type_contents = [
-            content for chat_message in chat_message_list for content in chat_message.content if self.is_text_content(content)
-            ]
+        # textタイプのcontentとtext以外のcontentを1回の走査で振り分ける
+        text_type_contents: list[ChatContent] = []
+        non_text_contents: list[ChatContent] = []
+        for chat_message in chat_message_list:
+            for content in chat_message.content:
+                (text_type_contents if content.kind == "text" else non_text_contents).append(content)
         if len(text_type_contents) == 0:
             return __insert_prompt_template__(chat_message_list, request_context)
 
-        # text以外のcontentを抽出する
-        non_text_contents = [
-            content for chat_message in chat_message_list for content in chat_message.content if not self.is_text_content(content)
-        ]
-
         text_result_chat_message_list: list[ChatMessage] = []
         # textを結合
         combined_text = "\n".join([text_content.params.get("text", "") for text_content in text_type_contents])
+        # プロンプトテンプレートの前置部分はループ外で一度だけ作成する
+        prompt_prefix = request_context.prompt_template_text + "\n"
+        user_role_name = self.get_user_role_name()
         # 文字数で分割する
         for i in range(0, len(combined_text), split_message_length):
-            split_text = combined_text[i:i + split_message_length]
-            split_contents = [self.create_text_content(f"{request_context.prompt_template_text}\n{split_text}")]
-            for split_content in split_contents:
-                chat_message = ChatMessage(
-                    role=self.get_user_role_name(),
-                    content=[split_content]
-                )
-                # textタイプ以外のcontentを追加する
-                for non_text_content in non_text_contents:
-                    chat_message.content.append(non_text_content)
-
-                text_result_chat_message_list.append(chat_message)
+            split_content = self.create_text_content(prompt_prefix + combined_text[i:i + split_message_length])
+            # textタイプ以外のcontentを追加する
+            chat_message = ChatMessage(
+                role=user_role_name,
+                content=[split_content, *non_text_contents]
+            )
+            text_result_chat_message_list.append(chat_message)
 
         return text_result_chat_message_list
 
@@ -214,9 +334,18 @@ class LLMMessageContentFactoryBase(ABC):
         result_chat_message_list: list[ChatMessage] = []
 
         for chat_message in chat_message_list:
-            image_url_contents = [
-                content for content in chat_message.content if self.is_image_content(content)
-            ]
+            # 画像・テキスト・その他のcontentを1回の走査で振り分ける
+            image_url_contents: list[ChatContent] = []
+            text_contents: list[ChatContent] = []
+            other_contents: list[ChatContent] = []
+            for content in chat_message.content:
+                kind = content.kind
+                if kind == "image_url":
+                    image_url_contents.append(content)
+                elif kind == "text":
+                    text_contents.append(content)
+                else:
+                    other_contents.append(content)
 
             # 画像が無い、または分割不要ならそのまま
             if len(image_url_contents) == 0 or len(image_url_contents) <= max_images:
@@ -224,14 +353,6 @@ class LLMMessageContentFactoryBase(ABC):
                 continue
 
             # 分割時は、テキスト＋その他（画像以外）を各分割メッセージに維持する
-            text_contents = [
-                content for content in chat_message.content if self.is_text_content(content)
-            ]
-            other_contents = [
-                content
-                for content in chat_message.content
-                if (not self.is_text_content(content)) and (not self.is_image_content(content))
-            ]
             base_contents = text_contents + other_contents
 
             for i in range(0, len(image_url_contents), max_images):
@@ -244,7 +365,9 @@ class LLMMessageContentFactoryBase(ABC):
         return result_chat_message_list
 
     @abstractmethod
-    def _create_image_content_(self, identifier: str, data: bytes, detail: str) -> list[ChatContent]:
+    def _create_image_content_(
+        self, identifier: str, data: bytes, detail: str, mime_type: str = "image/png"
+    ) -> list[ChatContent]:
         pass
 
     @abstractmethod
@@ -264,9 +387,16 @@ class LLMMessageContentFactory(LLMMessageContentFactoryBase):
     def get_config(self) -> AiChatUtilConfig | None:
         return self.config
 
-    def _create_image_content_(self, identifier: str, data: bytes, detail: str) -> list[ChatContent]:
+    def _create_image_content_(
+        self, identifier: str, data: bytes, detail: str, mime_type: str = "image/png"
+    ) -> list[ChatContent]:
         base64_image = base64.b64encode(data).decode('utf-8')
-        image_url = f"data:image/png;base64,{base64_image}"
+        return self._create_image_content_from_base64_(identifier, base64_image, detail, mime_type)
+
+    def _create_image_content_from_base64_(
+        self, identifier: str, base64_image: str, detail: str, mime_type: str = "image/png"
+    ) -> list[ChatContent]:
+        image_url = f"data:{mime_type};base64,{base64_image}"
         identifier_params = {"type": "text", "text": f"Image Identifier: {identifier}"}
         image_params = {"type": "image_url", "image_url": {"url": image_url, "detail": detail}}
         return [ChatContent(params=identifier_params), ChatContent(params=image_params)]
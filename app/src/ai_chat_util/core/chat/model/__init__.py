@@ -2,7 +2,7 @@
 import re
 from typing import Any, ClassVar, Literal, Optional
 
-from pydantic import BaseModel, Field, model_validator
+from pydantic import BaseModel, ConfigDict, Field, model_validator
 import ai_chat_util.core.log.log_settings as log_settings
 logger = log_settings.getLogger(__name__)
 
@@ -39,25 +39,49 @@ class WebRequestModel(BaseModel):
     url: str
     headers: dict[str, Any] = {}
 
+def _exclude_field(exclude: Any, field_name: str) -> Any:
+    """model_dump の exclude 引数に field_name を追加したものを返す."""
+    if exclude is None:
+        return {field_name}
+    if isinstance(exclude, dict):
+        return {**exclude, field_name: True}
+    return set(exclude) | {field_name}
+
 class ChatContent(BaseModel):
+    # 履歴として保持するだけで生成後に書き換えないため frozen にする
+    model_config = ConfigDict(frozen=True)
+
     params: dict[str, Any] = Field(..., description="Parameters of the chat content.")
+
+    @property
+    def kind(self) -> str | None:
+        """コンテンツの種別（"text" / "image_url" / "file" など）。params["type"] を参照する.
+        model_copy で params を差し替えた場合も追従するよう、値は保持しない."""
+        return self.params.get("type")
+
     def model_dump(self, *args, **kwargs):
+            # params は展開して返すため、親クラス側では dump しない（二重 dump を避ける）
+            kwargs["exclude"] = _exclude_field(kwargs.get("exclude"), "params")
             base = super().model_dump(*args, **kwargs)
             # paramsを展開
-            return {**{k: v for k, v in base.items() if k != "params"}, **self.params}
+            return {**base, **self.params}
 
 class ChatMessage(BaseModel):
+    # 履歴として保持するだけで生成後に書き換えないため frozen にする
+    model_config = ConfigDict(frozen=True)
+
     role: str = Field(..., description="The role of the message sender (e.g., 'user', 'assistant').")
     content: list[ChatContent] = Field(..., description="The content of the message, which can be text or other types.")
 
     # model_dump をオーバーライドして content を展開する
     def model_dump(self, *args, **kwargs):
+        # content は展開して返すため、親クラス側では dump しない（二重 dump を避ける）
+        kwargs["exclude"] = _exclude_field(kwargs.get("exclude"), "content")
         base = super().model_dump(*args, **kwargs)
-        # baseからcontentを除去
-        del base["content"]
 
         # contentを展開
-        return {**{k: v for k, v in base.items() if k != "content"}, **{"content": [c.model_dump() for c in self.content]}}
+        base["content"] = [c.model_dump() for c in self.content]
+        return base
 
     def get_last_user_content(self) -> Optional[ChatContent]:
         """
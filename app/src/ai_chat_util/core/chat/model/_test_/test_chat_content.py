@@ -0,0 +1,11 @@
+from ai_chat_util.core.chat.model import ChatContent
+
+
+def test_chat_content_kind_follows_replaced_params() -> None:
+    content = ChatContent(params={"type": "text", "text": "hello"})
+    assert content.kind == "text"
+
+    copied = content.model_copy(update={"params": {"type": "image_url", "image_url": {"url": "data:,"}}})
+
+    assert copied.kind == "image_url"
+    assert content.kind == "text"
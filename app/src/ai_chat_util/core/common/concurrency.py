@@ -0,0 +1,28 @@
+from __future__ import annotations
+
+import asyncio
+from typing import Awaitable, Callable, Sequence, TypeVar
+
+_S = TypeVar("_S")
+_T = TypeVar("_T")
+
+# 要素ごとの処理（ファイルごとのコンテンツ生成など）を同時に実行する既定の最大数
+DEFAULT_GATHER_CONCURRENCY_LIMIT = 8
+
+
+async def gather_per_item(
+    items: Sequence[_S],
+    func: Callable[[_S], Awaitable[_T]],
+    concurrency_limit: int = DEFAULT_GATHER_CONCURRENCY_LIMIT,
+) -> list[_T]:
+    """items の各要素（ファイルパスやURLなど）に func を並列適用し、入力順のまま結果を返す."""
+    sem = asyncio.Semaphore(concurrency_limit)
+
+    async def _run_one(item: _S) -> _T:
+        async with sem:
+            return await func(item)
+
+    return list(await asyncio.gather(*[_run_one(item) for item in items or []]))
+
+
+__all__ = ["DEFAULT_GATHER_CONCURRENCY_LIMIT", "gather_per_item"]
@@ -28,6 +28,18 @@ class ConfigError(RuntimeError):
     pass
 
 
+_dotenv_loaded = False
+
+
+def ensure_dotenv_loaded() -> None:
+    """Load .env into the process environment once per process."""
+    global _dotenv_loaded
+    if _dotenv_loaded:
+        return
+    load_dotenv()
+    _dotenv_loaded = True
+
+
 def resolve_path_placeholders(
     value: str,
     *,
@@ -55,7 +67,7 @@ def load_resolved_yaml(
     resolver: Callable[[str | None], Path],
 ) -> tuple[Path, dict[str, Any]]:
     # Load secrets from .env / env. Non-secrets are not read from env.
-    load_dotenv()
+    ensure_dotenv_loaded()
     resolved = resolver(config_path)
     raw_root = load_yaml_config(resolved)
     return resolved, raw_root
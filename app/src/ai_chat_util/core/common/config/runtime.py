@@ -526,6 +526,10 @@ def _resolve_coding_llm_api_key_in_place(
     config.llm.api_key = resolved
 
 
+# api_key が必須のプロバイダ（LiteLLM のプロバイダ名、小文字）
+_PROVIDERS_REQUIRING_API_KEY = frozenset({"openai", "azure", "azure_openai", "anthropic"})
+
+
 class LLMSection(BaseModel):
     model_config = ConfigDict(extra="forbid")
 
@@ -552,59 +556,49 @@ class LLMSection(BaseModel):
     @model_validator(mode="after")
     def _validate_api_key_required(self) -> "LLMSection":
         provider = (self.provider or "").lower()
-        providers_requiring_key = {"openai", "azure", "azure_openai", "anthropic"}
-        if provider in providers_requiring_key and not self.api_key:
+        if provider in _PROVIDERS_REQUIRING_API_KEY and not self.api_key:
             raise ValueError(
                 "llm.api_key が未設定です。ai-chat-util-config.yml で 'ai_chat_util_config.llm.api_key: os.environ/ENV_VAR_NAME' を設定し、"
                 "参照先の環境変数を設定してください。"
             )
         return self
 
-    def create_litellm_model_list(self) -> list[dict[str, Any]]:
-        """Create a list of model names to try with LiteLLM, based on the config."""
-        litellm_extra_headers: dict[str, str] | None = None
-        if self.extra_headers:
-            # Reserve x-mcp-* for MCP forwarding (do NOT send to LiteLLM).
-            filtered = {
-                k: v for k, v in self.extra_headers.items() if not (k or "").lower().startswith("x-mcp-")
-            }
-            if filtered:
-                litellm_extra_headers = filtered
-
-        completion_litellm_dict = {}
-        completion_litellm_dict["model"] = f"{self.provider}/{self.completion_model}"
-        completion_litellm_dict["api_key"] = self.api_key
-        if self.base_url:
-            completion_litellm_dict["api_base"] = self.base_url
-        if self.api_version:
-            completion_litellm_dict["api_version"] = self.api_version
-        if litellm_extra_headers:
-            completion_litellm_dict["extra_headers"] = litellm_extra_headers
-
-        completion_model_dict = {
-            "model_name": self.completion_model,
-            "litellm_params": completion_litellm_dict
+    def get_litellm_extra_headers(self) -> dict[str, str] | None:
+        """Return extra_headers to send to LiteLLM (x-mcp-* is reserved for MCP forwarding)."""
+        if not self.extra_headers:
+            return None
+        filtered = {
+            k: v for k, v in self.extra_headers.items() if not (k or "").lower().startswith("x-mcp-")
         }
+        return filtered or None
 
-        embedding_litellm_dict = {}
-        embedding_litellm_dict["model"] = f"{self.provider}/{self.embedding_model}"
-        embedding_litellm_dict["api_key"] = self.api_key
+    def _create_litellm_params(self, model: str | None, extra_headers: dict[str, str] | None) -> dict[str, Any]:
+        litellm_dict: dict[str, Any] = {}
+        litellm_dict["model"] = f"{self.provider}/{model}"
+        litellm_dict["api_key"] = self.api_key
         if self.base_url:
-            embedding_litellm_dict["api_base"] = self.base_url
+            litellm_dict["api_base"] = self.base_url
         if self.api_version:
-            embedding_litellm_dict["api_version"] = self.api_version
-        if litellm_extra_headers:
-            embedding_litellm_dict["extra_headers"] = litellm_extra_headers
-        embedding_model_dict = {
-            "model_name": self.embedding_model,
-            "litellm_params": embedding_litellm_dict
-        }
+            litellm_dict["api_version"] = self.api_version
+        if extra_headers:
+            litellm_dict["extra_headers"] = extra_headers
+        return litellm_dict
+
+    def create_litellm_model_list(self) -> list[dict[str, Any]]:
+        """Create a list of model names to try with LiteLLM, based on the config."""
+        litellm_extra_headers = self.get_litellm_extra_headers()
 
         models: list[dict[str, Any]] = []
         if self.completion_model:
-            models.append(completion_model_dict)
+            models.append({
+                "model_name": self.completion_model,
+                "litellm_params": self._create_litellm_params(self.completion_model, litellm_extra_headers),
+            })
         if self.embedding_model:
-            models.append(embedding_model_dict)
+            models.append({
+                "model_name": self.embedding_model,
+                "litellm_params": self._create_litellm_params(self.embedding_model, litellm_extra_headers),
+            })
         return models
 
 class PathsSection(BaseModel):
@@ -930,6 +924,14 @@ class Office2PDFLibreOfficeExecSection(BaseModel):
 
     libreoffice_path: str | None = Field(default=None)
 
+    # 1以上の場合、soffice をリスナーモードで指定数だけ常駐させ、変換ごとの起動コストを省く.
+    # LibreOffice の Python UNO ブリッジ（uno モジュール）を import できる環境でのみ有効で、
+    # import できない場合は従来どおり変換ごとに soffice を起動する.
+    listener_pool_size: int = Field(default=0, ge=0)
+
+    # 常駐プロセス1つあたりの最大変換件数. 超えたプロセスは再起動してメモリの増加を抑える.
+    listener_max_tasks_per_process: int = Field(default=200, ge=1)
+
 
 class Office2PDFLibreOfficeUnoSection(BaseModel):
     model_config = ConfigDict(extra="forbid")
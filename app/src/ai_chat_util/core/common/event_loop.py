@@ -0,0 +1,35 @@
+from __future__ import annotations
+
+import asyncio
+import importlib.util
+import os
+from typing import Any, Coroutine, TypeVar
+
+from ai_chat_util.core.common.flags import is_truthy
+
+_T = TypeVar("_T")
+
+# uvloop を使わずに標準の asyncio イベントループで実行したい場合（CIでの再現性確認など）に設定する
+_DISABLE_UVLOOP_ENV = "AI_CHAT_UTIL_DISABLE_UVLOOP"
+
+
+def _is_uvloop_enabled() -> bool:
+    if is_truthy(os.environ.get(_DISABLE_UVLOOP_ENV)):
+        return False
+    return importlib.util.find_spec("uvloop") is not None
+
+
+def run(main: Coroutine[Any, Any, _T]) -> _T:
+    """エントリポイントのコルーチンを実行する.
+
+    uvloop がインストールされていれば uvloop のイベントループで、なければ asyncio.run で実行する.
+    uvloop は任意の依存関係であり、未インストール（Windows など）の場合も動作は変わらない.
+    """
+    if _is_uvloop_enabled():
+        import uvloop  # type: ignore[import-not-found]
+
+        return uvloop.run(main)
+    return asyncio.run(main)
+
+
+__all__ = ["run"]
@@ -0,0 +1,12 @@
+from __future__ import annotations
+
+# 環境変数やメタデータのフラグ値で「真」とみなす値（小文字化・前後空白除去後に比較する）
+TRUTHY_VALUES = frozenset({"1", "true", "yes", "y", "on"})
+
+
+def is_truthy(value: str | None) -> bool:
+    """フラグ値の文字列が「真」を表すかを返す. None や空文字は偽とする."""
+    return value is not None and value.strip().lower() in TRUTHY_VALUES
+
+
+__all__ = ["TRUTHY_VALUES", "is_truthy"]
@@ -1,5 +1,4 @@
 import asyncio
-from dotenv import load_dotenv
 import argparse
 from fastmcp import FastMCP
 from ai_chat_util.core.common.config.runtime import init_runtime
@@ -20,6 +19,28 @@ from ai_chat_util.core.analysis.base import (
 )
 mcp = FastMCP("file_util") #type :ignore
 
+# デフォルトで登録するツール
+_DEFAULT_TOOLS = (
+    get_document_type,
+    get_mime_type,
+    get_sheet_names,
+    extract_excel_sheet,
+    extract_text_from_file,
+    list_zip_contents,
+    extract_zip,
+    create_zip,
+    extract_base64_to_text,
+    export_data_to_excel,
+    import_data_from_excel,
+    list_file_server_roots,
+    list_file_server_entries,
+)
+# -t オプションで指定可能なツール（ツール名 -> 関数）
+TOOL_REGISTRY = {tool.__name__: tool for tool in _DEFAULT_TOOLS}
+
+# --mode の値と FastMCP のトランスポート名の対応（stdio 以外）
+_NETWORK_TRANSPORTS = {"sse": "sse", "http": "streamable-http"}
+
 # 引数解析用の関数
 def parse_args() -> argparse.Namespace:
     parser = argparse.ArgumentParser(description="Run MCP server with specified mode and APP_DATA_PATH.")
@@ -36,51 +57,33 @@ def parse_args() -> argparse.Namespace:
     return parser.parse_args()
 
 async def main():
-    # load_dotenv() を使用して環境変数を読み込む
-    load_dotenv()
     # 引数を解析
     args = parse_args()
     init_runtime(args.config or None)
     mode = args.mode
 
     # tools オプションが指定されている場合は、ツールを登録
+    register_tool = mcp.tool()
     if args.tools:
         tools = [tool.strip() for tool in args.tools.split(",")]
         for tool_name in tools:
-            # tool_nameという名前の関数が存在する場合は登録
-            tool = globals().get(tool_name)
-            if tool and callable(tool):
-                mcp.tool()(tool)
+            # tool_nameという名前のツールが存在する場合は登録
+            tool = TOOL_REGISTRY.get(tool_name)
+            if tool is not None:
+                register_tool(tool)
             else:
                 print(f"Warning: Tool '{tool_name}' not found or not callable. Skipping registration.")
     else:
         # デフォルトのツールを登録
-        mcp.tool()(get_document_type)
-        mcp.tool()(get_mime_type)
-        mcp.tool()(get_sheet_names)
-        mcp.tool()(extract_excel_sheet)
-        mcp.tool()(extract_text_from_file)
-        mcp.tool()(list_zip_contents)
-        mcp.tool()(extract_zip)
-        mcp.tool()(create_zip)
-        mcp.tool()(extract_base64_to_text)
-        mcp.tool()(export_data_to_excel)
-        mcp.tool()(import_data_from_excel)
-        mcp.tool()(list_file_server_roots)
-        mcp.tool()(list_file_server_entries)
+        for tool in _DEFAULT_TOOLS:
+            register_tool(tool)
 
     if mode == "stdio":
         await mcp.run_async()
+        return
 
-    elif mode == "sse":
-        # port番号を取得
-        port = args.port
-        await mcp.run_async(transport="sse", host="0.0.0.0", port=port)
-
-    elif mode == "http":
-        # port番号を取得
-        port = args.port
-        await mcp.run_async(transport="streamable-http", host="0.0.0.0", port=port)
+    # sse / http はトランスポート名以外は同じ引数で起動する
+    await mcp.run_async(transport=_NETWORK_TRANSPORTS[mode], host="0.0.0.0", port=args.port)
 
 if __name__ == "__main__":
     asyncio.run(main())
@@ -202,6 +202,58 @@ def parse_args() -> argparse.Namespace:
 
     return parser.parse_args()
 
+# --mode の値と FastMCP のトランスポート名の対応（stdio 以外）
+_NETWORK_TRANSPORTS = {"sse": "sse", "http": "streamable-http"}
+
+# MCPツールとして公開できる関数の一覧（ツール名→関数）。起動時に一度だけ構築する
+_TOOL_REGISTRY: dict[str, Callable[..., object]] = {
+    # analysis tools
+    "analyze_image_files": analyze_image_files,
+    "analyze_pdf_files": analyze_pdf_files,
+    "analyze_office_files": analyze_office_files,
+    "analyze_files": analyze_files,
+    "analyze_documents_data": analyze_documents_data,
+    "analyze_image_urls": analyze_image_urls,
+    "analyze_pdf_urls": analyze_pdf_urls,
+    "analyze_office_urls": analyze_office_urls,
+    "convert_office_files_to_pdf": convert_office_files_to_pdf,
+    "convert_pdf_files_to_images": convert_pdf_files_to_images,
+    "extract_time_range_from_logfile": extract_time_range_from_logfile,
+    "infer_log_header_pattern": infer_log_header_pattern,
+    # chat/batch
+    "run_chat": run_chat,
+    "run_deepagent_chat": run_deepagent_chat,
+    "run_simple_chat": run_simple_chat,
+    "run_batch_chat": run_batch_chat,
+    "run_deepagent_batch_chat": run_deepagent_batch_chat,
+    "deepagent_batch_chat": run_deepagent_batch_chat,
+    "run_simple_batch_chat": run_simple_batch_chat,
+    "run_batch_chat_from_excel": run_batch_chat_from_excel,
+    "run_deepagent_batch_chat_from_excel": run_deepagent_batch_chat_from_excel,
+    "deepagent_batch_chat_from_excel": run_deepagent_batch_chat_from_excel,
+    "run_mermaid_workflow_from_file": run_mermaid_workflow_from_file,
+    "run_durable_workflow_from_file": run_durable_workflow_from_file,
+    "resume_durable_workflow": resume_durable_workflow,
+    # browser automation
+    "run_browser_task": run_browser_task,
+    "run_browser_task_with_output": run_browser_task_with_output,
+    # docker operations
+    "docker_compose_up": docker_compose_up,
+    "docker_compose_down": docker_compose_down,
+    "docker_compose_restart": docker_compose_restart,
+    "docker_compose_logs": docker_compose_logs,
+    "docker_list_containers": docker_list_containers,
+    "docker_list_images": docker_list_images,
+    "docker_remove_containers": docker_remove_containers,
+    "docker_remove_images": docker_remove_images,
+    # docker AI generation
+    "docker_generate_dockerfile": docker_generate_dockerfile,
+    "docker_generate_compose": docker_generate_compose,
+    # debug helper
+    "get_loaded_config_info": get_loaded_config_info,
+}
+
+
 def prepare_mcp(mcp: FastMCP, tools_option: str):
     tool_metadata = _build_tool_metadata_registry()
 
@@ -294,68 +346,21 @@ def prepare_mcp(mcp: FastMCP, tools_option: str):
 
         return decorator
 
-    tool_registry: dict[str, Callable[..., object]] = {
-        # analysis tools
-        "analyze_image_files": analyze_image_files,
-        "analyze_pdf_files": analyze_pdf_files,
-        "analyze_office_files": analyze_office_files,
-        "analyze_files": analyze_files,
-        "analyze_documents_data": analyze_documents_data,
-        "analyze_image_urls": analyze_image_urls,
-        "analyze_pdf_urls": analyze_pdf_urls,
-        "analyze_office_urls": analyze_office_urls,
-        "convert_office_files_to_pdf": convert_office_files_to_pdf,
-        "convert_pdf_files_to_images": convert_pdf_files_to_images,
-        "extract_time_range_from_logfile": extract_time_range_from_logfile,
-        "infer_log_header_pattern": infer_log_header_pattern,
-        # chat/batch
-        "run_chat": run_chat,
-        "run_deepagent_chat": run_deepagent_chat,
-        "run_simple_chat": run_simple_chat,
-        "run_batch_chat": run_batch_chat,
-        "run_deepagent_batch_chat": run_deepagent_batch_chat,
-        "deepagent_batch_chat": run_deepagent_batch_chat,
-        "run_simple_batch_chat": run_simple_batch_chat,
-        "run_batch_chat_from_excel": run_batch_chat_from_excel,
-        "run_deepagent_batch_chat_from_excel": run_deepagent_batch_chat_from_excel,
-        "deepagent_batch_chat_from_excel": run_deepagent_batch_chat_from_excel,
-        "run_mermaid_workflow_from_file": run_mermaid_workflow_from_file,
-        "run_durable_workflow_from_file": run_durable_workflow_from_file,
-        "resume_durable_workflow": resume_durable_workflow,
-        # browser automation
-        "run_browser_task": run_browser_task,
-        "run_browser_task_with_output": run_browser_task_with_output,
-        # docker operations
-        "docker_compose_up": docker_compose_up,
-        "docker_compose_down": docker_compose_down,
-        "docker_compose_restart": docker_compose_restart,
-        "docker_compose_logs": docker_compose_logs,
-        "docker_list_containers": docker_list_containers,
-        "docker_list_images": docker_list_images,
-        "docker_remove_containers": docker_remove_containers,
-        "docker_remove_images": docker_remove_images,
-        # docker AI generation
-        "docker_generate_dockerfile": docker_generate_dockerfile,
-        "docker_generate_compose": docker_generate_compose,
-        # debug helper
-        "get_loaded_config_info": get_loaded_config_info,
-    }
-    allowed_registry = dict(tool_registry)
 
     if tools_option:
         tools = [tool.strip() for tool in tools_option.split(",") if tool.strip()]
-        missing = [t for t in tools if t not in allowed_registry]
+        missing = [t for t in tools if t not in _TOOL_REGISTRY]
         if missing:
             raise ValueError(
-                f"Unknown tool(s): {missing}. Supported: {sorted(allowed_registry.keys())}"
+                f"Unknown tool(s): {missing}. Supported: {sorted(_TOOL_REGISTRY.keys())}"
             )
         for tool in tools:
-            header_aware_tool(mcp, tool_name=tool)(allowed_registry[tool])
+            header_aware_tool(mcp, tool_name=tool)(_TOOL_REGISTRY[tool])
         return
 
     # デフォルトのツールを登録（後方互換: 以前の default と同等 + analyze_documents_data）
-    for name in allowed_registry.keys():
-        header_aware_tool(mcp, tool_name=name)(allowed_registry[name])
+    for name, func in _TOOL_REGISTRY.items():
+        header_aware_tool(mcp, tool_name=name)(func)
     
 
 async def main():
@@ -382,14 +387,7 @@ async def main():
         await mcp.run_async()
         return
 
-    host = args.host
-    port = args.port
-    if mode == "sse":
-        await mcp.run_async(transport="sse", host=host, port=port)
-        return
-
-    # mode == "http"
-    await mcp.run_async(transport="streamable-http", host=host, port=port)
+    await mcp.run_async(transport=_NETWORK_TRANSPORTS[mode], host=args.host, port=args.port)
 
 
 if __name__ == "__main__":
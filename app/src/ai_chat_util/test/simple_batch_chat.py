@@ -1,3 +1,5 @@
+import os
+
 from ai_chat_util.core.chat.batch_client import BatchClient
 
 async def main():
@@ -9,10 +11,10 @@ async def main():
         "明日の天気は？",
         "今週のニュースを教えて"
     ]
-    results = await batch.run_simple_batch_chat(prompt, messages, concurrency=3)
+    results = await batch.run_simple_batch_chat(prompt, messages, concurrency=int(os.getenv("LLM_CONCURRENCY", "3")))
     for r in results:
         print(r)
 
 if __name__ == "__main__":
-    import asyncio
-    asyncio.run(main())
\ No newline at end of file
+    from ai_chat_util.core.common.event_loop import run
+    run(main())
\ No newline at end of file
@@ -1,3 +1,5 @@
+import os
+
 from ai_chat_util.core.chat.batch_client import BatchClient
 
 async def main(input_file: str, output_file: str):
@@ -7,7 +9,8 @@ async def main(input_file: str, output_file: str):
     await batch.run_batch_chat_from_excel(
         prompt=prompt,
         input_excel_path=input_file,
-        output_excel_path=output_file
+        output_excel_path=output_file,
+        concurrency=int(os.getenv("LLM_CONCURRENCY", "16")),
     )
 
 
@@ -15,5 +18,5 @@ if __name__ == "__main__":
     import sys
     input_file = sys.argv[1]
     output_file = sys.argv[2]
-    import asyncio
-    asyncio.run(main(input_file, output_file))
\ No newline at end of file
+    from ai_chat_util.core.common.event_loop import run
+    run(main(input_file, output_file))
\ No newline at end of file
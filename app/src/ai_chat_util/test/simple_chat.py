@@ -7,5 +7,5 @@ async def main():
     print(response)
 
 if __name__ == "__main__":
-    import asyncio
-    asyncio.run(main())
\ No newline at end of file
+    from ai_chat_util.core.common.event_loop import run
+    run(main())
\ No newline at end of file
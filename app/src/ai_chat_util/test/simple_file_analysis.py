@@ -14,5 +14,5 @@ async def main(files):
 if __name__ == "__main__":
     import sys
     files = sys.argv[1:]
-    import asyncio
-    asyncio.run(main(files))
\ No newline at end of file
+    from ai_chat_util.core.common.event_loop import run
+    run(main(files))
\ No newline at end of file
@@ -0,0 +1,62 @@
+from pathlib import Path
+
+import pytest
+
+from ai_chat_util.core.chat.model import WebRequestModel
+from ai_chat_util.util.analyze_file_util import downloader as downloader_mod
+from ai_chat_util.util.analyze_file_util.downloader import DownLoader, _UrlContentCache
+
+
+def test_download_files_reuses_cached_content(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    calls: list[str] = []
+
+    class _FakeResponse:
+        def __enter__(self):
+            return self
+
+        def __exit__(self, *exc_info):
+            return False
+
+        def raise_for_status(self) -> None:
+            pass
+
+        def iter_content(self, chunk_size=None):
+            yield b"pay"
+            yield b"load"
+
+    def _fake_get(url, headers=None, verify=True, timeout=None, stream=False):
+        calls.append(url)
+        return _FakeResponse()
+
+    monkeypatch.setattr(downloader_mod.requests, "get", _fake_get)
+    monkeypatch.setattr(DownLoader, "url_cache", _UrlContentCache(max_bytes=1024))
+
+    item = WebRequestModel(url="http://example.com/files/a.png?x=1")
+    first = DownLoader.download_files([item], str(tmp_path))
+    second = DownLoader.download_files([item], str(tmp_path))
+
+    assert calls == [item.url]
+    assert first == second == [str(tmp_path / "a.png")]
+    assert (tmp_path / "a.png").read_bytes() == b"payload"
+
+
+def test_url_content_cache_evicts_least_recently_used() -> None:
+    cache = _UrlContentCache(max_bytes=10)
+    cache.put(("a", frozenset()), b"12345")
+    cache.put(("b", frozenset()), b"12345")
+    assert cache.get(("a", frozenset())) == b"12345"
+
+    cache.put(("c", frozenset()), b"12345")
+
+    assert cache.get(("b", frozenset())) is None
+    assert cache.get(("a", frozenset())) == b"12345"
+    assert cache.get(("c", frozenset())) == b"12345"
+
+
+def test_get_file_name_from_url_distinguishes_urls_without_path() -> None:
+    first = downloader_mod._get_file_name_from_url("https://example.com/?id=1")
+    second = downloader_mod._get_file_name_from_url("https://example.com/?id=2")
+
+    assert first != second
+    assert first.startswith("download-") and first.endswith(".bin")
+    assert first == downloader_mod._get_file_name_from_url("https://example.com/?id=1")
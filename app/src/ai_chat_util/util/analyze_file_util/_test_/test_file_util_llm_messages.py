@@ -1,3 +1,4 @@
+import asyncio
 from pathlib import Path
 from types import SimpleNamespace
 from unittest.mock import MagicMock
@@ -58,4 +59,69 @@ def test_create_office_content_from_file_uses_original_path_for_uno(
     assert len(result) == 1
     assert captured["input_path"] == str(source.resolve())
     assert captured["api_url"] == "http://127.0.0.1:2004"
-    assert Path(captured["output_path"]).parent.parent == source.parent
\ No newline at end of file
+    assert Path(captured["output_path"]).parent.parent == source.parent
+
+def test_create_multi_format_contents_from_file_async_reads_text(tmp_path: Path) -> None:
+    source = tmp_path / "note.txt"
+    source.write_text("hello async world\n" * 20, encoding="utf-8")
+
+    result = asyncio.run(
+        FileUtilLLMMessages(MagicMock()).create_multi_format_contents_from_file_async(str(source))
+    )
+
+    assert len(result) == 1
+    assert result[0].params == {"type": "text", "text": "hello async world\n" * 20}
+
+
+def test_custom_pdf_content_reuses_extraction_for_same_bytes(monkeypatch) -> None:
+    from ai_chat_util.core.analysis.model import FileUtilDocument
+    from ai_chat_util.core.chat.llm_messages_factory import LLMMessageContentFactory
+    from ai_chat_util.util.analyze_file_util import pdf_util
+
+    calls: list[bytes] = []
+
+    def _fake_extract(data: bytes):
+        calls.append(data)
+        return [{"type": "text", "text": "page text"}]
+
+    monkeypatch.setattr(pdf_util, "extract_content_from_bytes", _fake_extract)
+
+    config = SimpleNamespace(features=SimpleNamespace(use_custom_pdf_analyzer=True))
+    llm_client = MagicMock()
+    llm_client.get_config.return_value = config
+    llm_client.get_message_factory.return_value = LLMMessageContentFactory(config)  # type: ignore[arg-type]
+    messages = FileUtilLLMMessages(llm_client)
+
+    data = b"%PDF-1.4 extraction cache test"
+    first = messages.create_pdf_content(FileUtilDocument(data=data, identifier="a.pdf"))
+    second = messages.create_pdf_content(FileUtilDocument(data=data, identifier="b.pdf"))
+
+    assert calls == [data]
+    assert first[1].params == second[1].params == {"type": "text", "text": "page text"}
+
+
+def test_create_multi_format_contents_from_file_classifies_office_file_once(monkeypatch, tmp_path: Path) -> None:
+    from ai_chat_util.core.analysis.model import FileUtilDocument
+
+    source = tmp_path / "sample.docx"
+    source.write_bytes(b"dummy")
+    document_type = MagicMock()
+    document_type.mime_type = "application/vnd.openxmlformats-officedocument.wordprocessingml.document"
+    document_type.is_text.return_value = False
+    document_type.is_image.return_value = False
+    document_type.is_pdf.return_value = False
+    document_type.is_office_document.return_value = True
+
+    monkeypatch.setattr(FileUtilDocument, "from_file", classmethod(lambda cls, document_path: document_type))
+
+    def _unexpected_identify(cls, filename):
+        raise AssertionError("file type must not be identified twice")
+
+    monkeypatch.setattr(FileUtilDocument, "identify_file_type", classmethod(_unexpected_identify))
+    monkeypatch.setattr(
+        FileUtilLLMMessages, "_convert_office_file_to_pdf_content", lambda self, file_path, detail="auto": ["converted"]
+    )
+
+    result = FileUtilLLMMessages(MagicMock()).create_multi_format_contents_from_file(str(source))
+
+    assert result == ["converted"]
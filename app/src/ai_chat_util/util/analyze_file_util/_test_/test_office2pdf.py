@@ -2,6 +2,8 @@ from pathlib import Path
 import subprocess
 from types import SimpleNamespace
 import asyncio
+import tempfile
+import threading
 from unittest.mock import MagicMock
 
 import pytest
@@ -13,6 +15,7 @@ from ai_chat_util.util.analyze_file_util.office2pdf import (
     LibreOfficeExecOffice2PDFUtil,
     LibreOfficeUnoOffice2PDFUtil,
     Pywin32Office2PDFUtil,
+    _LibreOfficeListenerPool,
     _build_default_output_path,
 )
 
@@ -132,6 +135,136 @@ def test_create_pdf_from_document_file_via_exec_uses_generated_pdf_immediately(
     assert result == target
 
 
+def test_create_pdfs_from_document_files_converts_all_sources_in_one_invocation(
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path: Path,
+) -> None:
+    sources = [tmp_path / "a.docx", tmp_path / "b.xlsx"]
+    for source in sources:
+        source.write_bytes(b"dummy")
+    output_dir = tmp_path / "out"
+    commands: list[list[str]] = []
+
+    def _fake_run(cls, command, timeout):
+        commands.append(command)
+        outdir = Path(command[command.index("--outdir") + 1])
+        for arg in command[command.index("--outdir") + 2:]:
+            (outdir / (Path(arg).stem + ".pdf")).write_bytes(b"pdf")
+        return subprocess.CompletedProcess(command, 0, b"", b""), MagicMock()
+
+    monkeypatch.setattr(LibreOfficeExecOffice2PDFUtil, "find_libreoffice_binary", classmethod(lambda cls, explicit_path=None, configured_path=None: "/usr/bin/soffice"))
+    monkeypatch.setattr(LibreOfficeExecOffice2PDFUtil, "_run_command_with_timeout_return_proc", classmethod(_fake_run))
+
+    result = LibreOfficeExecOffice2PDFUtil.create_pdfs_from_document_files(
+        [str(source) for source in sources],
+        str(output_dir),
+    )
+
+    assert len(commands) == 1
+    assert commands[0][-2:] == [str(source.resolve()) for source in sources]
+    assert result == [(output_dir / "a.pdf").resolve(), (output_dir / "b.pdf").resolve()]
+
+
+def test_listener_pool_reuses_listener_and_replaces_failed_one(
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path: Path,
+) -> None:
+    created: list[MagicMock] = []
+
+    def _fake_create_listener(self):
+        listener = MagicMock()
+        listener.is_reusable.return_value = True
+        if not created:
+            listener.convert.side_effect = lambda source, target: target.write_bytes(b"pdf")
+        created.append(listener)
+        return listener
+
+    monkeypatch.setattr(_LibreOfficeListenerPool, "_create_listener", _fake_create_listener)
+    pool = _LibreOfficeListenerPool("/usr/bin/soffice", size=1, max_tasks_per_process=10)
+    source = tmp_path / "a.docx"
+    source.write_bytes(b"dummy")
+
+    pool.convert(source, tmp_path / "a.pdf", timeout=None)
+    pool.convert(source, tmp_path / "b.pdf", timeout=None)
+    assert len(created) == 1
+
+    created[0].convert.side_effect = RuntimeError("boom")
+    with pytest.raises(RuntimeError, match="failed to convert a.docx"):
+        pool.convert(source, tmp_path / "c.pdf", timeout=None)
+    created[0].close.assert_called_once_with()
+
+    pool.convert(source, tmp_path / "d.pdf", timeout=None)
+    assert len(created) == 2
+
+
+def test_listener_pool_timeout_closes_listener_once(
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path: Path,
+) -> None:
+    from ai_chat_util.util.analyze_file_util.office2pdf import _LibreOfficeListener
+
+    kills: list[str] = []
+    killed = threading.Event()
+
+    def _fake_kill_tree(cls, proc) -> None:
+        kills.append("tree")
+        killed.set()
+
+    monkeypatch.setattr(LibreOfficeExecOffice2PDFUtil, "_kill_process_tree", classmethod(_fake_kill_tree))
+    monkeypatch.setattr(
+        LibreOfficeExecOffice2PDFUtil,
+        "_kill_libreoffice_by_user_installation",
+        classmethod(lambda cls, arg: kills.append("scan")),
+    )
+
+    def _fake_create_listener(self):
+        listener = _LibreOfficeListener.__new__(_LibreOfficeListener)
+        listener.max_tasks = 10
+        listener.tasks = 0
+        listener._close_lock = threading.Lock()
+        listener._closed = False
+        listener._profile_dir = tempfile.TemporaryDirectory(ignore_cleanup_errors=True)
+        listener._user_installation_arg = "-env:UserInstallation=file:///tmp/x"
+        listener._proc = MagicMock()
+
+        def _blocking_convert(source, target):
+            # 強制終了されたプロセスへの UNO 呼び出しが失敗する様子を再現する
+            killed.wait(5)
+            raise RuntimeError("bridge disposed")
+
+        listener.convert = _blocking_convert
+        return listener
+
+    monkeypatch.setattr(_LibreOfficeListenerPool, "_create_listener", _fake_create_listener)
+    pool = _LibreOfficeListenerPool("/usr/bin/soffice", size=1, max_tasks_per_process=10)
+    source = tmp_path / "a.docx"
+    source.write_bytes(b"dummy")
+
+    with pytest.raises(RuntimeError, match="timed out"):
+        pool.convert(source, tmp_path / "a.pdf", timeout=0.05)  # type: ignore[arg-type]
+
+    assert kills == ["tree", "scan"]
+    assert pool._slots.get_nowait() is None
+    assert not pool._listeners
+
+
+def test_listener_pool_is_replaced_when_config_changes(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(_LibreOfficeListenerPool, "_pools", {})
+    old_pool = _LibreOfficeListenerPool.get("/usr/bin/soffice", 1, 10)
+    idle = MagicMock()
+    old_pool._slots.get_nowait()
+    old_pool._slots.put(idle)
+    old_pool._listeners.add(idle)
+
+    assert _LibreOfficeListenerPool.get("/usr/bin/soffice", 1, 10) is old_pool
+    new_pool = _LibreOfficeListenerPool.get("/usr/bin/soffice", 2, 10)
+
+    assert new_pool is not old_pool
+    assert _LibreOfficeListenerPool._pools == {"/usr/bin/soffice": new_pool}
+    idle.close.assert_called_once_with()
+    assert old_pool._slots.get_nowait() is None
+
+
 def test_create_pdf_from_document_file_calls_uno_api(
     monkeypatch: pytest.MonkeyPatch,
     tmp_path: Path,
@@ -200,6 +333,60 @@ def test_create_pdf_from_document_bytes_preserves_input_suffix(
     assert Path(captured["input_path"]).suffix == ".docx"
 
 
+def test_create_pdf_from_document_bytes_async_preserves_input_suffix(
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path: Path,
+) -> None:
+    output_path = tmp_path / "result.pdf"
+    captured: dict[str, Path] = {}
+
+    async def _fake_convert(cls, input_path, output_path=None, libreoffice_path=None, timeout=None):
+        captured["input_path"] = Path(input_path)
+        assert Path(input_path).read_bytes() == b"dummy"
+        return Path(output_path)
+
+    monkeypatch.setattr(LibreOfficeExecOffice2PDFUtil, "create_pdf_from_document_file_async", classmethod(_fake_convert))
+
+    result = asyncio.run(
+        LibreOfficeExecOffice2PDFUtil.create_pdf_from_document_bytes_async(
+            input_bytes=b"dummy",
+            output_path=str(output_path),
+            libreoffice_path="/usr/bin/soffice",
+            input_filename="sample.xlsx",
+        )
+    )
+
+    assert result == output_path
+    assert captured["input_path"].suffix == ".xlsx"
+    assert not captured["input_path"].exists()
+
+
+def test_create_pdf_from_document_bytes_prefers_ramdisk_temp_dir(
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path: Path,
+) -> None:
+    ramdisk = tmp_path / "shm"
+    ramdisk.mkdir()
+    captured: dict[str, Path] = {}
+
+    def _fake_convert(cls, input_path, output_path=None, libreoffice_path=None, timeout=None):
+        captured["input_path"] = Path(input_path)
+        return Path(output_path)
+
+    monkeypatch.setattr(LibreOfficeExecOffice2PDFUtil, "create_pdf_from_document_file", classmethod(_fake_convert))
+    monkeypatch.setattr(LibreOfficeExecOffice2PDFUtil, "RAMDISK_TEMP_DIR", ramdisk)
+    monkeypatch.setattr("sys.platform", "linux")
+
+    LibreOfficeExecOffice2PDFUtil.create_pdf_from_document_bytes(
+        input_bytes=b"dummy",
+        output_path=str(tmp_path / "result.pdf"),
+        libreoffice_path="/usr/bin/soffice",
+        input_filename="sample.docx",
+    )
+
+    assert captured["input_path"].parent.parent == ramdisk
+
+
 def test_create_pdf_from_document_file_rejects_layout_override_for_uno_api(tmp_path: Path) -> None:
     source = tmp_path / "sample.xlsx"
     source.write_bytes(b"dummy")
@@ -252,6 +439,7 @@ def test_convert_office_files_to_pdf_uses_runtime_method_uno(monkeypatch: pytest
 
 
 def test_kill_libreoffice_by_user_installation_uses_psutil(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr("sys.platform", "darwin")
     matching_process = MagicMock()
     matching_process.info = {"cmdline": ["soffice", "-env:UserInstallation=file:///tmp/profile-a"]}
     non_matching_process = MagicMock()
@@ -266,6 +454,7 @@ def test_kill_libreoffice_by_user_installation_uses_psutil(monkeypatch: pytest.M
 
 
 def test_kill_libreoffice_by_user_installation_ignores_process_errors(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr("sys.platform", "darwin")
     vanished_process = MagicMock()
     vanished_process.info = {"cmdline": ["soffice", "-env:UserInstallation=file:///tmp/profile-b"]}
     vanished_process.kill.side_effect = psutil.NoSuchProcess(1234)
@@ -277,6 +466,20 @@ def test_kill_libreoffice_by_user_installation_ignores_process_errors(monkeypatc
     vanished_process.kill.assert_called_once_with()
 
 
+@pytest.mark.skipif(not Path("/proc/self/cmdline").exists(), reason="requires procfs")
+def test_kill_libreoffice_by_user_installation_scans_procfs_on_linux(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr("sys.platform", "linux")
+    marker_arg = "-env:UserInstallation=file:///tmp/profile-procfs-test"
+    proc = subprocess.Popen(["sleep", "30", marker_arg], stdin=subprocess.DEVNULL)
+    try:
+        LibreOfficeExecOffice2PDFUtil._kill_libreoffice_by_user_installation(marker_arg)
+        assert proc.wait(timeout=5) != 0
+    finally:
+        if proc.poll() is None:
+            proc.kill()
+            proc.wait()
+
+
 def test_kill_process_tree_uses_psutil_children(monkeypatch: pytest.MonkeyPatch) -> None:
     proc = MagicMock()
     proc.pid = 4321
@@ -307,4 +510,172 @@ def test_kill_process_tree_falls_back_to_proc_kill(monkeypatch: pytest.MonkeyPat
 
     LibreOfficeExecOffice2PDFUtil._kill_process_tree(proc)
 
-    proc.kill.assert_called_once_with()
\ No newline at end of file
+    proc.kill.assert_called_once_with()
+
+def test_try_find_libreoffice_binary_memoizes_path_lookup(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    binary = tmp_path / "soffice"
+    binary.write_bytes(b"")
+    calls: list[str] = []
+
+    def _fake_which(name: str) -> str | None:
+        calls.append(name)
+        return str(binary) if name == "soffice" and binary.exists() else None
+
+    monkeypatch.setattr(LibreOfficeExecOffice2PDFUtil, "_binary_cache", {})
+    monkeypatch.setattr("shutil.which", _fake_which)
+    monkeypatch.setenv("PATH", str(tmp_path))
+
+    assert LibreOfficeExecOffice2PDFUtil.try_find_libreoffice_binary() == str(binary)
+    assert LibreOfficeExecOffice2PDFUtil.try_find_libreoffice_binary() == str(binary)
+    assert calls == ["soffice"]
+
+    binary.unlink()
+    assert LibreOfficeExecOffice2PDFUtil.try_find_libreoffice_binary() is None
+    assert calls == ["soffice", "soffice", "libreoffice"]
+
+
+def test_run_command_async_waits_for_free_process_slot(monkeypatch: pytest.MonkeyPatch) -> None:
+    import threading
+
+    monkeypatch.setattr(LibreOfficeExecOffice2PDFUtil, "_process_slots", threading.BoundedSemaphore(1))
+    running = 0
+    peak = 0
+
+    async def _fake_run(cls, command, timeout):
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0.01)
+        running -= 1
+        return subprocess.CompletedProcess(command, 0, b"", b"")
+
+    monkeypatch.setattr(LibreOfficeExecOffice2PDFUtil, "_run_command_async_unbounded", classmethod(_fake_run))
+
+    async def _main() -> None:
+        await asyncio.gather(*(LibreOfficeExecOffice2PDFUtil._run_command_async(["soffice"], 5) for _ in range(3)))
+
+    asyncio.run(_main())
+
+    assert peak == 1
+
+
+def test_async_conversion_seeds_profile_without_blocking_event_loop(
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path: Path,
+) -> None:
+    import time
+
+    source = tmp_path / "sample.docx"
+    source.write_bytes(b"dummy")
+    ticks = 0
+
+    def _slow_seed(cls, libreoffice_path, profile_dir):
+        # 初回のテンプレート初期化を模して、ブロッキングで待つ
+        time.sleep(0.3)
+
+    async def _fake_run(cls, command, timeout):
+        outdir = Path(command[command.index("--outdir") + 1])
+        (outdir / "sample.pdf").write_bytes(b"pdf")
+        return subprocess.CompletedProcess(command, 0, b"", b"")
+
+    monkeypatch.setattr(LibreOfficeExecOffice2PDFUtil, "_seed_profile_dir", classmethod(_slow_seed))
+    monkeypatch.setattr(LibreOfficeExecOffice2PDFUtil, "_run_command_async", classmethod(_fake_run))
+
+    async def _ticker() -> None:
+        nonlocal ticks
+        for _ in range(5):
+            await asyncio.sleep(0.02)
+            ticks += 1
+
+    async def _main() -> Path:
+        ticker = asyncio.create_task(_ticker())
+        result = await LibreOfficeExecOffice2PDFUtil.create_pdf_from_document_file_via_libreoffice_exec_async(
+            input_path=str(source),
+            output_path=str(tmp_path / "sample.pdf"),
+            libreoffice_path="/usr/bin/soffice",
+        )
+        ticks_during_conversion = ticks
+        await ticker
+        assert ticks_during_conversion == 5
+        return result
+
+    assert asyncio.run(_main()) == (tmp_path / "sample.pdf").resolve()
+
+
+def test_profile_template_is_rebuilt_after_binary_upgrade(
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path: Path,
+) -> None:
+    binary = tmp_path / "soffice"
+    binary.write_bytes(b"v1")
+    keys: list[tuple[str, int, int]] = []
+
+    def _fake_init(cls, key):
+        keys.append(key)
+        return tmp_path / f"template{len(keys)}"
+
+    monkeypatch.setattr(LibreOfficeExecOffice2PDFUtil, "_profile_templates", {})
+    monkeypatch.setattr(LibreOfficeExecOffice2PDFUtil, "_profile_template_locks", {})
+    monkeypatch.setattr(LibreOfficeExecOffice2PDFUtil, "_init_profile_template", classmethod(_fake_init))
+
+    first = LibreOfficeExecOffice2PDFUtil._get_profile_template(str(binary))
+    assert LibreOfficeExecOffice2PDFUtil._get_profile_template(str(binary)) == first
+
+    binary.write_bytes(b"version 2")
+    second = LibreOfficeExecOffice2PDFUtil._get_profile_template(str(binary))
+
+    assert len(keys) == 2
+    assert keys[0][0] == keys[1][0] == str(binary)
+    assert second != first
+
+
+def test_profile_template_init_does_not_block_other_binaries(
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path: Path,
+) -> None:
+    slow_binary = tmp_path / "slow_soffice"
+    fast_binary = tmp_path / "fast_soffice"
+    slow_binary.write_bytes(b"slow")
+    fast_binary.write_bytes(b"fast")
+    release = threading.Event()
+
+    def _fake_init(cls, key):
+        if key[0] == str(slow_binary):
+            release.wait(5)
+        return tmp_path / Path(key[0]).name
+
+    monkeypatch.setattr(LibreOfficeExecOffice2PDFUtil, "_profile_templates", {})
+    monkeypatch.setattr(LibreOfficeExecOffice2PDFUtil, "_profile_template_locks", {})
+    monkeypatch.setattr(LibreOfficeExecOffice2PDFUtil, "_init_profile_template", classmethod(_fake_init))
+
+    slow = threading.Thread(target=LibreOfficeExecOffice2PDFUtil._get_profile_template, args=(str(slow_binary),))
+    slow.start()
+    try:
+        assert LibreOfficeExecOffice2PDFUtil._get_profile_template(str(fast_binary)) == tmp_path / "fast_soffice"
+        assert slow.is_alive()
+    finally:
+        release.set()
+        slow.join(5)
+
+
+def test_seed_profile_dir_copies_template_in_process(
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path: Path,
+) -> None:
+    template = tmp_path / "template"
+    (template / "user").mkdir(parents=True)
+    (template / "user" / "registrymodifications.xcu").write_text("<xcu/>")
+    monkeypatch.setattr(LibreOfficeExecOffice2PDFUtil, "_get_profile_template", classmethod(lambda cls, path: template))
+    monkeypatch.setattr(subprocess, "run", MagicMock(side_effect=AssertionError("no subprocess expected")))
+
+    profile_dir = tmp_path / "profile"
+    LibreOfficeExecOffice2PDFUtil._seed_profile_dir("/usr/bin/soffice", profile_dir)
+
+    assert (profile_dir / "user" / "registrymodifications.xcu").read_text() == "<xcu/>"
+
+
+def test_soffice_runs_in_its_own_session_without_inherited_fds() -> None:
+    kwargs = LibreOfficeExecOffice2PDFUtil._spawn_kwargs()
+
+    assert kwargs.get("start_new_session") is True
+    assert kwargs.get("close_fds", True) is True
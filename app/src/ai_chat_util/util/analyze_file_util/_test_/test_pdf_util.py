@@ -0,0 +1,117 @@
+import io
+from multiprocessing import shared_memory
+
+import fitz
+import pytest
+from PIL import Image
+
+from ai_chat_util.util.analyze_file_util import pdf_util
+from ai_chat_util.util.analyze_file_util.pdf_util import (
+    AUTO_RENDER_MIN_TEXT_CHARS,
+    _split_page_ranges,
+    extract_content_from_bytes,
+    extract_content_from_file,
+)
+
+
+def _pdf_bytes(texts: list[str]) -> bytes:
+    doc = fitz.open()
+    for text in texts:
+        page = doc.new_page()
+        page.insert_text((50, 72), text, fontsize=9)
+        page.draw_rect(fitz.Rect(100, 500, 300, 600), color=(1, 0, 0), fill=(0, 0, 1))
+    return doc.tobytes()
+
+
+@pytest.fixture
+def force_parallel(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(pdf_util.os, "cpu_count", lambda: 2)
+    monkeypatch.setattr(pdf_util, "PARALLEL_EXTRACT_MIN_PAGES", 1)
+    yield
+    pdf_util._shutdown_executor()
+
+
+def test_split_page_ranges_covers_all_pages_in_order() -> None:
+    assert _split_page_ranges(10, 3) == [(0, 4), (4, 7), (7, 10)]
+    assert _split_page_ranges(2, 4) == [(0, 1), (1, 2)]
+    assert _split_page_ranges(0, 2) == []
+
+
+def test_parallel_extraction_matches_serial_and_unlinks_shared_memory(
+    monkeypatch: pytest.MonkeyPatch, force_parallel
+) -> None:
+    data = _pdf_bytes([f"page {i}" for i in range(5)])
+    with fitz.open(stream=data, filetype="pdf") as doc:
+        serial = pdf_util._extract_content(doc)
+
+    created: list[str] = []
+    real_shared_memory = shared_memory.SharedMemory
+
+    class _RecordingSharedMemory(real_shared_memory):
+        def __init__(self, *args, **kwargs):
+            super().__init__(*args, **kwargs)
+            if kwargs.get("create"):
+                created.append(self.name)
+
+    monkeypatch.setattr(pdf_util.shared_memory, "SharedMemory", _RecordingSharedMemory)
+
+    parallel = extract_content_from_bytes(data)
+
+    assert parallel == serial
+    assert [item["text"] for item in parallel if item["type"] == "text"] == [f"page {i}" for i in range(5)]
+    assert len(created) == 1
+    with pytest.raises(FileNotFoundError):
+        real_shared_memory(name=created[0])
+
+
+def test_parallel_extraction_from_file_reuses_pool(tmp_path, force_parallel) -> None:
+    pdf_path = tmp_path / "doc.pdf"
+    pdf_path.write_bytes(_pdf_bytes([f"page {i}" for i in range(4)]))
+    with fitz.open(str(pdf_path)) as doc:
+        serial = pdf_util._extract_content(doc)
+
+    assert extract_content_from_file(str(pdf_path)) == serial
+    executor = pdf_util._executor
+    assert extract_content_from_file(str(pdf_path)) == serial
+    assert pdf_util._executor is executor
+
+
+def test_broken_pool_falls_back_to_serial_extraction(monkeypatch: pytest.MonkeyPatch, force_parallel) -> None:
+    class _BrokenExecutor:
+        def map(self, *args, **kwargs):
+            raise pdf_util.BrokenProcessPool("worker died")
+
+        def shutdown(self, *args, **kwargs):
+            pass
+
+    broken = _BrokenExecutor()
+    monkeypatch.setattr(pdf_util, "_executor", broken)
+    data = _pdf_bytes(["a", "b"])
+    with fitz.open(stream=data, filetype="pdf") as doc:
+        serial = pdf_util._extract_content(doc)
+
+    assert extract_content_from_bytes(data) == serial
+    assert pdf_util._executor is None
+
+
+def test_page_images_have_no_alpha_and_support_jpeg() -> None:
+    data = _pdf_bytes(["hello"])
+
+    png = [item for item in extract_content_from_bytes(data) if item["type"] == "image"]
+    jpeg = [item for item in extract_content_from_bytes(data, image_format="jpeg") if item["type"] == "image"]
+
+    assert png[0]["mime_type"] == "image/png"
+    assert Image.open(io.BytesIO(png[0]["bytes"])).mode == "RGB"
+    assert jpeg[0]["mime_type"] == "image/jpeg"
+    assert jpeg[0]["bytes"][:2] == b"\xff\xd8"
+    assert Image.open(io.BytesIO(jpeg[0]["bytes"])).mode == "RGB"
+
+
+def test_auto_render_skips_images_only_for_text_rich_pages() -> None:
+    long_text = "\n".join(["lorem ipsum dolor sit amet"] * (AUTO_RENDER_MIN_TEXT_CHARS // 20))
+    data = _pdf_bytes([long_text, "short"])
+
+    content = extract_content_from_bytes(data, render_images="auto")
+
+    assert [item["type"] for item in content] == ["text", "text", "image"]
+    assert [item["type"] for item in extract_content_from_bytes(data, render_images=False)] == ["text", "text"]
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import itertools
 import time
 import json
 import re
@@ -24,6 +25,7 @@ from ai_chat_util.core.analysis.model import (
 )
 import fitz  # PyMuPDF
 import ai_chat_util.core.log.log_settings as log_settings
+from ai_chat_util.core.common.concurrency import gather_per_item
 from .file_util_llm_messages import FileUtilLLMMessages
 
 logger = log_settings.getLogger(__name__)
@@ -48,8 +50,8 @@ class AnalyzeImageUtil:
         image_content_list: list[ChatContent] = []
         encode_started = time.perf_counter()
         total_bytes = 0
-        for image_path in file_list:
-            doc = FileUtilDocument.from_file(document_path=image_path)
+        docs = await gather_per_item(file_list, FileUtilDocument.from_file_async)
+        for doc in docs:
             try:
                 total_bytes += len(doc.data or b"")
             except Exception:
@@ -86,15 +88,16 @@ class AnalyzeImageUtil:
         detail: str,
     ) -> ChatResponse:
         prompt_content = llm_client.get_message_factory().create_text_content(text=prompt)
-        image_content_list: list[ChatContent] = []
         file_util_llm_messages = FileUtilLLMMessages(llm_client)
-        for image_url in image_url_list:
-            image_contents = await file_util_llm_messages.create_image_content_from_url_async(
-                image_url, detail
-            )
-            image_content_list.extend(image_contents)
+        async def _create_one(image_url: WebRequestModel) -> list[ChatContent]:
+            return await file_util_llm_messages.create_image_content_from_url_async(image_url, detail)
 
-        chat_message = ChatMessage(role="user", content=[prompt_content] + image_content_list)
+        image_contents_per_url = await gather_per_item(image_url_list, _create_one)
+
+        chat_message = ChatMessage(
+            role="user",
+            content=[prompt_content, *itertools.chain.from_iterable(image_contents_per_url)],
+        )
         chat_request: ChatRequest = ChatRequest(
             chat_history=ChatHistory(messages=[chat_message]), chat_request_context=None
         )
@@ -113,25 +116,24 @@ class AnalyzePDFUtil:
         detail: str = "auto",
     ) -> ChatResponse:
         prompt_content = llm_client.get_message_factory().create_text_content(text=prompt)
-        pdf_content_list = []
         config = llm_client.get_config()
         if not config:
             raise ValueError("LLMClientの設定が取得できませんでした。")
 
-        for file_path in file_list:
+        async def _create_one(file_path: str) -> list[ChatContent]:
+            pdf_data = await FileUtilDocument.read_bytes_async(file_path)
             if config.features.use_custom_pdf_analyzer:
                 logger.info(f"Using custom PDF analyzer for file: {file_path}")
-                with open(file_path, "rb") as f:
-                    pdf_data = f.read()
-                pdf_content = llm_client.get_message_factory()._create_custom_pdf_content_(file_path, pdf_data, detail)
-            else:
-                logger.info(f"Using standard PDF analyzer for file: {file_path}")
-                with open(file_path, "rb") as f:
-                    pdf_data = f.read()
-                pdf_content = llm_client.get_message_factory()._create_pdf_content_(file_path, pdf_data, detail)
-            pdf_content_list.extend(pdf_content)
-
-        chat_message = ChatMessage(role="user", content=[prompt_content] + pdf_content_list)
+                return await llm_client.get_message_factory()._create_custom_pdf_content_async_(file_path, pdf_data, detail)
+            logger.info(f"Using standard PDF analyzer for file: {file_path}")
+            return llm_client.get_message_factory()._create_pdf_content_(file_path, pdf_data, detail)
+
+        # 中間リストを作らず、プロンプトと各PDFのコンテンツから送信用のリストを1回で組み立てる
+        pdf_contents_per_file = await gather_per_item(file_list, _create_one)
+        chat_message = ChatMessage(
+            role="user",
+            content=[prompt_content, *itertools.chain.from_iterable(pdf_contents_per_file)],
+        )
         chat_request: ChatRequest = ChatRequest(
             chat_history=ChatHistory(messages=[chat_message]), chat_request_context=None
         )
@@ -173,17 +175,18 @@ class AnalyzeOfficeUtil:
         prompt: str,
         detail: str = "auto",
     ) -> ChatResponse:
-        office_contents: list[ChatContent] = []
         file_util_llm_messages = FileUtilLLMMessages(llm_client)
-        for file_path in file_path_list:
-            pdf_content = file_util_llm_messages.create_office_content_from_file(
-                file_path, detail=detail
-            )
-            office_contents.extend(pdf_content)
+        async def _create_one(file_path: str) -> list[ChatContent]:
+            return await file_util_llm_messages.create_office_content_from_file_async(file_path, detail=detail)
+
+        office_contents_per_file = await gather_per_item(file_path_list, _create_one)
 
         prompt_content = file_util_llm_messages.create_text_content(text=prompt)
 
-        chat_message = ChatMessage(role="user", content=[prompt_content] + office_contents)
+        chat_message = ChatMessage(
+            role="user",
+            content=[prompt_content, *itertools.chain.from_iterable(office_contents_per_file)],
+        )
         chat_request: ChatRequest = ChatRequest(
             chat_history=ChatHistory(messages=[chat_message]), chat_request_context=None
         )
@@ -227,14 +230,18 @@ class AnalyzeFileUtil:
         content_list = []
         skipped_files: list[str] = []
         file_util_llm_messages = FileUtilLLMMessages(llm_client)
-        for file_path in file_path_list:
+        async def _create_one(file_path: str) -> list[ChatContent] | None:
             try:
-                contents = file_util_llm_messages.create_multi_format_contents_from_file(
+                return await file_util_llm_messages.create_multi_format_contents_from_file_async(
                     file_path, detail=detail
                 )
             except ValueError as exc:
                 if "Unsupported document type" not in str(exc):
                     raise
+                return None
+
+        for file_path, contents in zip(file_path_list, await gather_per_item(file_path_list, _create_one)):
+            if contents is None:
                 skipped_files.append(file_path)
                 logger.info("FILE_ANALYZE_SKIP unsupported=%s", file_path)
                 continue
@@ -1,10 +1,19 @@
 from __future__ import annotations
 
 import asyncio
+import hashlib
 import os
-from typing import Any, Sequence
+import threading
+from collections import OrderedDict
+from typing import Any, Hashable, Sequence
+from urllib.parse import urlparse
 
 import requests
+
+# ストリーミングダウンロード時の読み書きの単位
+_DOWNLOAD_CHUNK_SIZE = 64 * 1024
+
+
 def _get_verify_option(*, requests_verify: bool = True, ca_bundle: str | None = None) -> bool | str:
     if ca_bundle:
         return ca_bundle
@@ -12,10 +21,14 @@ def _get_verify_option(*, requests_verify: bool = True, ca_bundle: str | None =
 
 
 def _get_file_name_from_url(url: str) -> str:
-    from urllib.parse import urlparse
-
+    # クエリ文字列やフラグメントをファイル名に含めないよう、URLのパス部分から取得する
     parsed_url = urlparse(url)
-    return os.path.basename(parsed_url.path)
+    file_name = os.path.basename(parsed_url.path)
+    if file_name:
+        return file_name
+    # パスを持たないURL同士が同じファイルを上書きしないよう、URLのハッシュで名前を分ける
+    url_hash = hashlib.sha256(url.encode("utf-8")).hexdigest()[:12]
+    return f"download-{url_hash}.bin"
 
 
 def _get_headers(item: Any) -> dict[str, Any] | None:
@@ -25,7 +38,73 @@ def _get_headers(item: Any) -> dict[str, Any] | None:
     return dict(headers)
 
 
+def _get_cache_key(item: Any) -> tuple[str, Hashable]:
+    # 認証ヘッダ等が異なれば別コンテンツになり得るため、URLとヘッダの組をキーにする
+    headers = _get_headers(item) or {}
+    return item.url, frozenset((k, str(v)) for k, v in headers.items())
+
+
+class _UrlContentCache:
+    """URL→ダウンロード内容のLRUキャッシュ。合計サイズが max_bytes を超えたら古いものから破棄する。"""
+
+    def __init__(self, max_bytes: int, max_entry_bytes: int | None = None):
+        self.max_bytes = max_bytes
+        # 1エントリあたりの上限。これを超えるコンテンツはキャッシュしない
+        self.max_entry_bytes = max_bytes if max_entry_bytes is None else min(max_entry_bytes, max_bytes)
+        self._entries: OrderedDict[tuple[str, Hashable], bytes] = OrderedDict()
+        self._total_bytes = 0
+        # 同期版は複数スレッドから呼ばれ得るため、ロックで保護する
+        self._lock = threading.Lock()
+
+    def get(self, key: tuple[str, Hashable]) -> bytes | None:
+        with self._lock:
+            data = self._entries.get(key)
+            if data is not None:
+                self._entries.move_to_end(key)
+            return data
+
+    def put(self, key: tuple[str, Hashable], data: bytes) -> None:
+        if len(data) > self.max_entry_bytes:
+            return
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self._total_bytes -= len(old)
+            self._entries[key] = data
+            self._total_bytes += len(data)
+            while self._total_bytes > self.max_bytes and self._entries:
+                _, evicted = self._entries.popitem(last=False)
+                self._total_bytes -= len(evicted)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._total_bytes = 0
+
+
+class _ChunkCollector:
+    """ストリーミング書き込み中のチャンクを、キャッシュ可能なサイズの間だけメモリに保持する。"""
+
+    def __init__(self, limit: int):
+        self._limit = limit
+        self._buffer: bytearray | None = bytearray()
+
+    def add(self, chunk: bytes) -> None:
+        if self._buffer is None:
+            return
+        if len(self._buffer) + len(chunk) > self._limit:
+            # 上限を超えたらキャッシュを諦め、以降はファイルへの書き込みのみ行う
+            self._buffer = None
+            return
+        self._buffer.extend(chunk)
+
+    def getvalue(self) -> bytes | None:
+        return None if self._buffer is None else bytes(self._buffer)
+
+
 class DownLoader:
+    # 同じURLを繰り返し参照する場合に再ダウンロードしないためのキャッシュ（上限 256MB、1件あたり 32MB）
+    url_cache = _UrlContentCache(max_bytes=256 * 1024 * 1024, max_entry_bytes=32 * 1024 * 1024)
 
     @classmethod
     def download_files(
@@ -41,17 +120,33 @@ class DownLoader:
 
         file_paths: list[str] = []
         for item in urls:
-            res = requests.get(
+            cache_key = _get_cache_key(item)
+            file_path = os.path.join(download_dir, _get_file_name_from_url(item.url))
+            content = cls.url_cache.get(cache_key)
+            if content is not None:
+                with open(file_path, "wb") as f:
+                    f.write(content)
+                file_paths.append(file_path)
+                continue
+
+            # レスポンス全体をメモリに載せず、チャンク単位でファイルへ書き込む
+            collector = _ChunkCollector(cls.url_cache.max_entry_bytes)
+            with requests.get(
                 url=item.url,
                 headers=_get_headers(item),
                 verify=verify,
                 timeout=(10, 60),
-            )
-            res.raise_for_status()
-
-            file_path = os.path.join(download_dir, _get_file_name_from_url(item.url))
-            with open(file_path, "wb") as f:
-                f.write(res.content)
+                stream=True,
+            ) as res:
+                res.raise_for_status()
+                with open(file_path, "wb") as f:
+                    for chunk in res.iter_content(chunk_size=_DOWNLOAD_CHUNK_SIZE):
+                        f.write(chunk)
+                        collector.add(chunk)
+
+            content = collector.getvalue()
+            if content is not None:
+                cls.url_cache.put(cache_key, content)
             file_paths.append(file_path)
         return file_paths
 
@@ -63,25 +158,46 @@ class DownLoader:
         *,
         requests_verify: bool = True,
         ca_bundle: str | None = None,
+        concurrency_limit: int = 8,
     ) -> list[str]:
         """Download files asynchronously and in parallel for async workflows."""
         try:
             import httpx
         except Exception as e:
             raise RuntimeError("httpx が見つかりません。依存関係を確認してください。") from e
+        import aiofiles
 
         verify = _get_verify_option(requests_verify=requests_verify, ca_bundle=ca_bundle)
         timeout = httpx.Timeout(60.0, connect=10.0)
+        limits = httpx.Limits(max_connections=concurrency_limit)
+        sem = asyncio.Semaphore(concurrency_limit)
 
         async def _fetch_one(client: httpx.AsyncClient, item: Any) -> str:
-            resp = await client.get(item.url, headers=_get_headers(item))
-            resp.raise_for_status()
+            cache_key = _get_cache_key(item)
             file_path = os.path.join(download_dir, _get_file_name_from_url(item.url))
-            with open(file_path, "wb") as f:
-                f.write(resp.content)
+            content = cls.url_cache.get(cache_key)
+            if content is not None:
+                # イベントループをブロックしないよう、書き込みも非同期で行う
+                async with aiofiles.open(file_path, "wb") as f:
+                    await f.write(content)
+                return file_path
+
+            # レスポンス全体をメモリに載せず、チャンク単位でファイルへ書き込む
+            collector = _ChunkCollector(cls.url_cache.max_entry_bytes)
+            async with sem:
+                async with client.stream("GET", item.url, headers=_get_headers(item)) as resp:
+                    resp.raise_for_status()
+                    async with aiofiles.open(file_path, "wb") as f:
+                        async for chunk in resp.aiter_bytes(_DOWNLOAD_CHUNK_SIZE):
+                            await f.write(chunk)
+                            collector.add(chunk)
+
+            content = collector.getvalue()
+            if content is not None:
+                cls.url_cache.put(cache_key, content)
             return file_path
 
-        async with httpx.AsyncClient(verify=verify, timeout=timeout, follow_redirects=True) as client:
+        async with httpx.AsyncClient(verify=verify, timeout=timeout, limits=limits, follow_redirects=True) as client:
             file_paths: list[str] = await asyncio.gather(
                 *[_fetch_one(client, item) for item in urls]
             )
@@ -13,6 +13,7 @@ MCP/CLI/ローカル実行のどの形態でも、ユーザーが渡したファ
 from __future__ import annotations
 
 from dataclasses import dataclass
+from functools import lru_cache
 import os
 import ntpath
 from pathlib import Path
@@ -53,8 +54,12 @@ def _iter_unique(candidates: Iterable[str]) -> list[str]:
     return out
 
 
+@lru_cache(maxsize=32)
 def _find_repo_root(start: Path) -> Path | None:
-    """pyproject.toml がある場所をリポジトリルートとみなして探索"""
+    """pyproject.toml がある場所をリポジトリルートとみなして探索
+
+    プロセス実行中にリポジトリルートが変わることはないため、探索開始位置ごとに結果をキャッシュする。
+    """
     cur = start
     for _ in range(10):
         if (cur / "pyproject.toml").exists():
@@ -129,12 +134,13 @@ def resolve_existing_path(
     for c in candidates:
         try:
             candidate = Path(c)
-            if candidate.exists() and candidate.is_file():
+            # is_file()/is_dir() は存在しない場合 False を返すため、exists() の stat は不要
+            if candidate.is_file():
                 return PathResolutionResult(
                     resolved_path=str(candidate.resolve()),
                     tried_candidates=candidates,
                 )
-            if allow_directory and candidate.exists() and candidate.is_dir():
+            if allow_directory and candidate.is_dir():
                 return PathResolutionResult(
                     resolved_path=str(candidate.resolve()),
                     tried_candidates=candidates,
@@ -1,6 +1,8 @@
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
 from io import BytesIO
+import asyncio
 import itertools
 import os
 import uuid
@@ -37,6 +39,13 @@ class FileUtilLLMMessages:
     _OFFICE_EXTRACT_MAX_ROWS_PER_SHEET = 200
     _OFFICE_EXTRACT_MAX_COLS_PER_ROW = 20
 
+    # Office→PDF変換の実体は LibreOffice/Office の子プロセス側で動くため、
+    # Python 側は待機用のスレッドで十分。同時変換数はCPUコア数までに制限する。
+    _office2pdf_executor = ThreadPoolExecutor(
+        max_workers=os.cpu_count() or 1,
+        thread_name_prefix="office2pdf",
+    )
+
     def __init__(self, llm_client: AbstractChatClient):
         self.llm_client = llm_client
 
@@ -130,13 +139,13 @@ class FileUtilLLMMessages:
         return [explanation_content, body_content]
 
     def is_text_content(self, content: ChatContent) -> bool:
-        return content.params.get("type") == "text"
+        return content.kind == "text"
 
     def is_image_content(self, content: ChatContent) -> bool:
-        return content.params.get("type") == "image_url"
+        return content.kind == "image_url"
 
     def is_file_content(self, content: ChatContent) -> bool:
-        return content.params.get("type") == "file"
+        return content.kind == "file"
 
     def create_text_content(self, text: str) -> "ChatContent":
         params = {"type": "text", "text": text}
@@ -148,7 +157,10 @@ class FileUtilLLMMessages:
         )
 
     def create_image_content_from_file(self, file_path: str, detail: str) -> list["ChatContent"]:
-        return self.create_image_content(FileUtilDocument.from_file(file_path), detail)
+        return self.llm_client.get_message_factory().create_image_content_from_file(file_path, detail)
+
+    async def create_image_content_from_file_async(self, file_path: str, detail: str) -> list["ChatContent"]:
+        return self.create_image_content(await FileUtilDocument.from_file_async(file_path), detail)
 
     def create_image_content_from_url(self, file_url: WebRequestModel, detail: str) -> list["ChatContent"]:
         with tempfile.TemporaryDirectory() as tmpdir:
@@ -173,7 +185,7 @@ class FileUtilLLMMessages:
                 requests_verify=requests_verify,
                 ca_bundle=ca_bundle,
             )
-            document = FileUtilDocument.from_file(file_paths[0])
+            document = await FileUtilDocument.from_file_async(file_paths[0])
             return self.llm_client.get_message_factory()._create_image_content_(
                 document.identifier, document.data, detail
             )
@@ -195,6 +207,14 @@ class FileUtilLLMMessages:
     def create_pdf_content_from_file(self, file_path: str, detail: str = "auto") -> list["ChatContent"]:
             return self.create_pdf_content(FileUtilDocument.from_file(file_path), detail=detail)
 
+    async def create_pdf_content_async(self, document_type: FileUtilDocument, detail: str = "auto") -> list["ChatContent"]:
+        return await self.llm_client.get_message_factory().create_pdf_content_async(
+            document_type.identifier, document_type.data, detail=detail
+        )
+
+    async def create_pdf_content_from_file_async(self, file_path: str, detail: str = "auto") -> list["ChatContent"]:
+        return await self.create_pdf_content_async(await FileUtilDocument.from_file_async(file_path), detail=detail)
+
     def create_pdf_content_from_url(self, file_url: str, detail: str = "auto") -> list["ChatContent"]:
         with tempfile.TemporaryDirectory() as tmpdir:
             requests_verify, ca_bundle = self._get_network_download_options()
@@ -220,6 +240,10 @@ class FileUtilLLMMessages:
         '''
         複数のOfficeドキュメントとプロンプトからドキュメント解析を行う。各ドキュメントのテキスト抽出、各ドキュメントの説明、プロンプト応答を生成して返す
         '''
+        # 既にPDFの場合はOffice→PDF変換を行わずにPDFとして扱う
+        if document_type.is_pdf():
+            return self.create_pdf_content(document_type, detail=detail)
+
         effective_config = self._get_effective_config()
         office2pdf_method = effective_config.office2pdf.method
         if office2pdf_method == LibreOfficeExecOffice2PDFUtil.METHOD_NAME:
@@ -257,6 +281,8 @@ class FileUtilLLMMessages:
                         input_path=str(source_path),
                         output_path=temp_file_path,
                         libreoffice_path=effective_config.office2pdf.libreoffice_exec.libreoffice_path,
+                        listener_pool_size=effective_config.office2pdf.libreoffice_exec.listener_pool_size,
+                        listener_max_tasks_per_process=effective_config.office2pdf.libreoffice_exec.listener_max_tasks_per_process,
                     )
                 elif office2pdf_method == LibreOfficeUnoOffice2PDFUtil.METHOD_NAME:
                     LibreOfficeUnoOffice2PDFUtil.create_pdf_from_document_file(
@@ -294,10 +320,28 @@ class FileUtilLLMMessages:
             )
 
     def create_office_content_from_file(
-            self, file_path: str, detail: str = "auto"
+            self, file_path: str, detail: str = "auto",
+            document_type: FileUtilDocument | None = None,
             ) -> list["ChatContent"]:
         '''
         複数のOfficeドキュメントとプロンプトからドキュメント解析を行う。各ドキュメントのテキスト抽出、各ドキュメントの説明、プロンプト応答を生成して返す
+        呼び出し元で判定済みのdocument_typeを渡した場合は、ファイル種別の再判定を行わない
+        '''
+        # 既にPDFの場合はOffice→PDF変換を行わずにPDFとして扱う
+        if document_type is not None:
+            mime_type = document_type.mime_type
+        else:
+            mime_type, _ = FileUtilDocument.identify_file_type(file_path)
+        if mime_type == "application/pdf":
+            return self.create_pdf_content_from_file(file_path, detail=detail)
+
+        return self._convert_office_file_to_pdf_content(file_path, detail=detail)
+
+    def _convert_office_file_to_pdf_content(
+            self, file_path: str, detail: str = "auto"
+            ) -> list["ChatContent"]:
+        '''
+        OfficeドキュメントをOffice2PDFでPDFに変換し、変換後のPDFからChatContentのリストを生成して返す
         '''
         effective_config = self._get_effective_config()
         office2pdf_method = effective_config.office2pdf.method
@@ -334,6 +378,8 @@ class FileUtilLLMMessages:
                         input_path=str(source_path),
                         output_path=temp_file_path,
                         libreoffice_path=effective_config.office2pdf.libreoffice_exec.libreoffice_path,
+                        listener_pool_size=effective_config.office2pdf.libreoffice_exec.listener_pool_size,
+                        listener_max_tasks_per_process=effective_config.office2pdf.libreoffice_exec.listener_max_tasks_per_process,
                     )
                 elif office2pdf_method == LibreOfficeUnoOffice2PDFUtil.METHOD_NAME:
                     LibreOfficeUnoOffice2PDFUtil.create_pdf_from_document_file(
@@ -371,6 +417,30 @@ class FileUtilLLMMessages:
                 f"Failed to convert office document to PDF with method {office2pdf_method}."
             )
 
+    async def create_office_content_from_file_async(
+            self, file_path: str, detail: str = "auto",
+            document_type: FileUtilDocument | None = None,
+            ) -> list["ChatContent"]:
+        '''
+        create_office_content_from_file の非同期版. Office→PDF変換は外部プロセス待ちでブロックするため、
+        変換専用のエグゼキュータで実行する.
+        呼び出し元で判定済みのdocument_typeを渡した場合は、ファイル種別の再判定を行わない
+        '''
+        if document_type is None:
+            document_type = await FileUtilDocument.from_file_async(file_path)
+
+        # 既にPDFの場合はOffice→PDF変換を行わずにPDFとして扱う
+        if document_type.is_pdf():
+            return await self.create_pdf_content_async(document_type, detail=detail)
+
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._office2pdf_executor,
+            self._convert_office_file_to_pdf_content,
+            file_path,
+            detail,
+        )
+
     def create_office_content_from_url(self, file_url: str, detail: str = "auto") -> list["ChatContent"]:
         '''
         複数のOfficeドキュメントとプロンプトからドキュメント解析を行う。各ドキュメントのテキスト抽出、各ドキュメントの説明、プロンプト応答を生成して返す
@@ -435,10 +505,29 @@ class FileUtilLLMMessages:
             return self.create_pdf_content_from_file(file_path, detail=detail)
 
         if document_type.is_office_document():
-            return self.create_office_content_from_file(file_path, detail=detail)
+            return self.create_office_content_from_file(file_path, detail=detail, document_type=document_type)
 
         raise ValueError(f"Unsupported document type for file: {file_path}")
 
+    async def create_multi_format_contents_from_file_async(
+            self, file_path: str, detail: str = "auto"
+            ) -> list["ChatContent"]:
+        '''
+        create_multi_format_contents_from_file の非同期版.
+        ファイルの読み込みはイベントループをブロックせずに1回だけ行い、読み込んだバイト列を各形式の処理で使い回す.
+        '''
+        document_type = await FileUtilDocument.from_file_async(file_path)
+
+        if document_type.is_pdf():
+            return await self.create_pdf_content_async(document_type, detail=detail)
+
+        if document_type.is_office_document():
+            return await self.create_office_content_from_file_async(
+                file_path, detail=detail, document_type=document_type
+            )
+
+        return self.create_multi_format_content(document_type, detail=detail)
+
     def create_multi_format_contents_from_url(
             self, file_url: str, detail: str = "auto"
             ) -> list["ChatContent"]:
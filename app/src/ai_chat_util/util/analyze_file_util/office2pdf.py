@@ -1,18 +1,31 @@
 from __future__ import annotations
 
+import asyncio
+import contextlib
+import hashlib
 import importlib.util
+import atexit
 import os
+import queue
 import shutil
+import signal
+import socket
 import subprocess
+import sys
 import tempfile
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Any, Iterable, Literal, Protocol, cast
+from typing import Any, AsyncIterator, Iterable, Iterator, Literal, Protocol, Sequence, cast
 
 import psutil  # type: ignore[import-not-found]
 import requests
 
 from ai_chat_util.core.common.config.runtime import get_runtime_config
+import ai_chat_util.core.log.log_settings as log_settings
+
+logger = log_settings.getLogger(__name__)
 
 
 class _Office2PDFPyWin32Config(Protocol):
@@ -24,6 +37,12 @@ class _Office2PDFLibreOfficeExecConfig(Protocol):
     @property
     def libreoffice_path(self) -> str | None: ...
 
+    @property
+    def listener_pool_size(self) -> int: ...
+
+    @property
+    def listener_max_tasks_per_process(self) -> int: ...
+
 
 class _Office2PDFLibreOfficeUnoConfig(Protocol):
     @property
@@ -52,14 +71,20 @@ class _HasOffice2PDFConfig(Protocol):
 PrintOrientation = Literal["portrait", "landscape"]
 
 
+def _resolve_source_path(input_path: str) -> Path:
+    source = Path(input_path).expanduser()
+    # 存在確認と絶対パス化を1回の resolve で行う
+    try:
+        return source.resolve(strict=True)
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Input file not found: {source}") from None
+
+
 def _resolve_target_path(
     input_path: str,
     output_path: str,
 ) -> tuple[Path, Path]:
-    source = Path(input_path).expanduser()
-    if not source.exists():
-        raise FileNotFoundError(f"Input file not found: {source}")
-    source = source.resolve()
+    source = _resolve_source_path(input_path)
 
     output_candidate = Path(output_path).expanduser()
     if output_candidate.is_dir():
@@ -251,6 +276,25 @@ class LibreOfficeUnoOffice2PDFUtil:
 class LibreOfficeExecOffice2PDFUtil:
     METHOD_NAME = "libreoffice_exec"
     DEFAULT_TIMEOUT_SECONDS = 600
+    # create_pdf_from_document_bytes で temp_dir 未指定時に優先する一時ディレクトリ（Linux の tmpfs）
+    RAMDISK_TEMP_DIR = Path("/dev/shm")
+    DEFAULT_LISTENER_MAX_TASKS_PER_PROCESS = 200
+    PROFILE_TEMPLATE_INIT_TIMEOUT_SECONDS = 120
+
+    # 初期化済みの UserInstallation プロファイルのテンプレート置き場（LibreOffice のバイナリごとに分ける）
+    PROFILE_TEMPLATE_ROOT = Path("~/.cache/ai_chat_util/lo_profile_template")
+    # (バイナリのパス, 更新時刻, サイズ) -> テンプレート. 上書きアップグレード後は別のテンプレートを作り直す
+    _profile_templates: dict[tuple[str, int, int], Path | None] = {}
+    _profile_template_locks: dict[tuple[str, int, int], threading.Lock] = {}
+    _profile_templates_lock = threading.Lock()
+    # (指定パス, PATH) -> 解決した LibreOffice バイナリのパス
+    _binary_cache: dict[tuple[str, str], str] = {}
+
+    # プロセス内で同時に実行する soffice（変換1回ごとに起動するもの）の上限. 未設定時は CPU 数.
+    # 呼び出し元がそれぞれ並列化していても soffice が増えすぎて CPU・ディスクを奪い合わないよう、超えた分は待たせる
+    MAX_CONCURRENCY_ENV = "AI_CHAT_UTIL_OFFICE2PDF_MAX_CONCURRENCY"
+    _process_slots: threading.BoundedSemaphore | None = None
+    _process_slots_lock = threading.Lock()
 
     class _ConversionTimeout(RuntimeError):
         """Internal exception used to distinguish timeout paths."""
@@ -261,8 +305,117 @@ class LibreOfficeExecOffice2PDFUtil:
         return f"-env:UserInstallation={uri}"
 
     @classmethod
-    def _kill_process_tree(cls, proc: subprocess.Popen[bytes]) -> None:
-        if proc.poll() is not None:
+    def _profile_template_key(cls, libreoffice_path: str) -> tuple[str, int, int] | None:
+        resolved = shutil.which(libreoffice_path) or libreoffice_path
+        try:
+            stat = Path(resolved).resolve().stat()
+        except OSError:
+            return None
+        return libreoffice_path, stat.st_mtime_ns, stat.st_size
+
+    @classmethod
+    def _get_profile_template(cls, libreoffice_path: str | Path) -> Path | None:
+        key = cls._profile_template_key(str(libreoffice_path))
+        if key is None:
+            return None
+        with cls._profile_templates_lock:
+            if key in cls._profile_templates:
+                return cls._profile_templates[key]
+            key_lock = cls._profile_template_locks.setdefault(key, threading.Lock())
+        # 初回の初期化は数秒かかるため、同じバイナリの変換同士だけが初期化の完了を待つ
+        with key_lock:
+            with cls._profile_templates_lock:
+                if key in cls._profile_templates:
+                    return cls._profile_templates[key]
+            template_dir = cls._init_profile_template(key)
+            with cls._profile_templates_lock:
+                cls._profile_templates[key] = template_dir
+            return template_dir
+
+    @classmethod
+    def _init_profile_template(cls, key: tuple[str, int, int]) -> Path | None:
+        libreoffice_path = key[0]
+        digest = hashlib.sha256("\0".join(map(str, key)).encode("utf-8")).hexdigest()[:16]
+        template_dir = cls.PROFILE_TEMPLATE_ROOT.expanduser() / digest
+        marker = template_dir / ".initialized"
+        if marker.is_file():
+            return template_dir
+
+        staging_dir = template_dir.with_name(f"{digest}.{os.getpid()}.tmp")
+        shutil.rmtree(staging_dir, ignore_errors=True)
+        user_installation_arg = cls._build_user_installation_arg(staging_dir)
+        try:
+            staging_dir.parent.mkdir(parents=True, exist_ok=True)
+            subprocess.run(
+                [
+                    libreoffice_path,
+                    "--headless",
+                    "--nologo",
+                    "--norestore",
+                    "--nolockcheck",
+                    user_installation_arg,
+                    "--terminate_after_init",
+                ],
+                stdin=subprocess.DEVNULL,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+                timeout=cls.PROFILE_TEMPLATE_INIT_TIMEOUT_SECONDS,
+                check=True,
+            )
+            if not staging_dir.is_dir() or not any(staging_dir.iterdir()):
+                raise RuntimeError("LibreOffice did not initialize the profile")
+            (staging_dir / ".initialized").touch()
+            shutil.rmtree(template_dir, ignore_errors=True)
+            os.replace(staging_dir, template_dir)
+        except Exception:
+            # テンプレートが作れなくても変換はできる（空のプロファイルから初期化される）ため、ここでは失敗させない.
+            # 別プロセスが先にテンプレートを作り終えていればそれを使う
+            cls._kill_libreoffice_by_user_installation(user_installation_arg)
+            shutil.rmtree(staging_dir, ignore_errors=True)
+            return template_dir if marker.is_file() else None
+        return template_dir
+
+    @classmethod
+    def _seed_profile_dir(cls, libreoffice_path: str | Path, profile_dir: Path) -> None:
+        """初期化済みテンプレートを profile_dir に複製する。テンプレートがなければ何もしない。"""
+        template_dir = cls._get_profile_template(libreoffice_path)
+        if template_dir is None:
+            return
+        try:
+            # 変換ごとに外部コマンド（cp）を起動しないよう、プロセス内で複製する
+            shutil.copytree(template_dir, profile_dir, symlinks=True)
+        except Exception:
+            # 複製に失敗した場合は、従来どおり空のプロファイルから初期化させる
+            shutil.rmtree(profile_dir, ignore_errors=True)
+
+    @classmethod
+    @contextlib.contextmanager
+    def _temporary_profile_dir(cls, libreoffice_path: str | Path) -> Iterator[Path]:
+        # 変換ごとに独立したプロファイルを使い、並行実行時のプロファイルロックの取り合いを避ける
+        with tempfile.TemporaryDirectory() as lo_profile_root:
+            profile_dir = Path(lo_profile_root) / "profile"
+            cls._seed_profile_dir(libreoffice_path, profile_dir)
+            yield profile_dir
+
+    @classmethod
+    @contextlib.asynccontextmanager
+    async def _temporary_profile_dir_async(cls, libreoffice_path: str | Path) -> AsyncIterator[Path]:
+        # _temporary_profile_dir の非同期版。テンプレートの初期化（初回は soffice の起動を伴う）・複製と
+        # 後片付けをスレッドで行い、イベントループを止めない
+        lo_profile_root = await asyncio.to_thread(tempfile.mkdtemp)
+        try:
+            profile_dir = Path(lo_profile_root) / "profile"
+            await asyncio.to_thread(cls._seed_profile_dir, libreoffice_path, profile_dir)
+            yield profile_dir
+        finally:
+            await asyncio.to_thread(shutil.rmtree, lo_profile_root, True)
+
+    @classmethod
+    def _kill_process_tree(cls, proc: subprocess.Popen[bytes] | asyncio.subprocess.Process) -> None:
+        # asyncio.subprocess.Process には poll() がないため returncode で終了済みかを判定する
+        poll = getattr(proc, "poll", None)
+        returncode = poll() if poll is not None else proc.returncode
+        if returncode is not None:
             return
 
         try:
@@ -292,6 +445,10 @@ class LibreOfficeExecOffice2PDFUtil:
         if not marker:
             return
 
+        if sys.platform.startswith("linux") and os.path.isdir("/proc"):
+            cls._kill_processes_by_cmdline_marker_procfs(marker)
+            return
+
         try:
             for process in psutil.process_iter(["cmdline"]):
                 cmdline = process.info.get("cmdline")
@@ -306,6 +463,35 @@ class LibreOfficeExecOffice2PDFUtil:
         except Exception:
             pass
 
+    @staticmethod
+    def _kill_processes_by_cmdline_marker_procfs(marker: str) -> None:
+        # Linux では /proc/<pid>/cmdline を直接読んで照合する.
+        # 全プロセスの Process オブジェクト生成や引数リストの結合をせず、NUL 区切りのバイト列のまま探す
+        marker_bytes = marker.encode()
+        own_pid = os.getpid()
+        try:
+            entries = os.scandir("/proc")
+        except OSError:
+            return
+        with entries:
+            for entry in entries:
+                if not entry.name.isdigit():
+                    continue
+                pid = int(entry.name)
+                if pid == own_pid:
+                    continue
+                try:
+                    with open(f"/proc/{pid}/cmdline", "rb") as f:
+                        cmdline = f.read()
+                except OSError:
+                    continue
+                if marker_bytes not in cmdline:
+                    continue
+                try:
+                    os.kill(pid, signal.SIGKILL)
+                except OSError:
+                    pass
+
     @classmethod
     def _resolve_produced_pdf_path(
         cls,
@@ -332,28 +518,87 @@ class LibreOfficeExecOffice2PDFUtil:
             return None
         return newest
 
+    @staticmethod
+    def _spawn_kwargs() -> dict[str, Any]:
+        # soffice は別セッションで起動し、端末の SIGINT/SIGHUP が直接届かないようにする（停止はこちらで行う）.
+        # close_fds も既定（True）のままにし、ホストプロセスが継承可能にした fd（MCP サーバーの親から渡されたもの等）を渡さない.
+        # CPython の subprocess は start_new_session / close_fds 指定時に posix_spawn を使わず fork/exec で起動するが、
+        # 起動コストより soffice をホストのシグナル・fd から切り離すことを優先する
+        return {"start_new_session": True}
+
+    @classmethod
+    def _get_process_slots(cls) -> threading.BoundedSemaphore:
+        with cls._process_slots_lock:
+            if cls._process_slots is None:
+                limit = os.cpu_count() or 1
+                raw = os.environ.get(cls.MAX_CONCURRENCY_ENV, "").strip()
+                if raw:
+                    try:
+                        limit = max(1, int(raw))
+                    except ValueError:
+                        logger.warning("Invalid %s=%r; using %d", cls.MAX_CONCURRENCY_ENV, raw, limit)
+                cls._process_slots = threading.BoundedSemaphore(limit)
+            return cls._process_slots
+
+    @classmethod
+    @contextlib.contextmanager
+    def _process_slot(cls) -> Iterator[None]:
+        slots = cls._get_process_slots()
+        slots.acquire()
+        try:
+            yield
+        finally:
+            slots.release()
+
+    @classmethod
+    @contextlib.asynccontextmanager
+    async def _process_slot_async(cls) -> AsyncIterator[None]:
+        slots = cls._get_process_slots()
+        if not slots.acquire(blocking=False):
+            # 空きを待つ間もイベントループを止めないよう、待機はスレッドで行う
+            acquire = asyncio.ensure_future(asyncio.to_thread(slots.acquire))
+            try:
+                await asyncio.shield(acquire)
+            except asyncio.CancelledError:
+                # 待機中にキャンセルされた場合は、後から取得された枠を返却する
+                acquire.add_done_callback(lambda _: slots.release())
+                raise
+        try:
+            yield
+        finally:
+            slots.release()
+
     @classmethod
     def _run_command_with_timeout_return_proc(
         cls,
         command: list[str],
         timeout: int | None,
     ) -> tuple[subprocess.CompletedProcess[bytes], subprocess.Popen[bytes]]:
-        proc = subprocess.Popen(
-            command,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-            start_new_session=True,
-        )
+        # 出力はパイプではなく一時ファイルで受ける。変換中に Python 側でパイプを読み続ける必要がなくなり、
+        # 出力が必要なエラー時・検証時にだけまとめて読み出す
+        with cls._process_slot(), tempfile.TemporaryFile() as stdout_file, tempfile.TemporaryFile() as stderr_file:
+            proc = subprocess.Popen(
+                command,
+                stdin=subprocess.DEVNULL,
+                stdout=stdout_file,
+                stderr=stderr_file,
+                **cls._spawn_kwargs(),
+            )
 
-        try:
-            stdout, stderr = proc.communicate(timeout=timeout)
-        except subprocess.TimeoutExpired as exc:
-            cls._kill_process_tree(proc)
             try:
-                proc.communicate(timeout=5)
-            except Exception:
-                pass
-            raise cls._ConversionTimeout(f"LibreOffice conversion timed out after {timeout}s") from exc
+                proc.wait(timeout=timeout)
+            except subprocess.TimeoutExpired as exc:
+                cls._kill_process_tree(proc)
+                try:
+                    proc.wait(timeout=5)
+                except Exception:
+                    pass
+                raise cls._ConversionTimeout(f"LibreOffice conversion timed out after {timeout}s") from exc
+
+            stdout_file.seek(0)
+            stdout = stdout_file.read()
+            stderr_file.seek(0)
+            stderr = stderr_file.read()
 
         if proc.returncode != 0:
             raise subprocess.CalledProcessError(
@@ -365,19 +610,76 @@ class LibreOfficeExecOffice2PDFUtil:
 
         return (subprocess.CompletedProcess(command, proc.returncode, stdout, stderr), proc)
 
+    @classmethod
+    async def _run_command_async(
+        cls,
+        command: list[str],
+        timeout: int | None,
+    ) -> subprocess.CompletedProcess[bytes]:
+        # _run_command_with_timeout_return_proc の非同期版。待機中もイベントループを止めない
+        async with cls._process_slot_async():
+            return await cls._run_command_async_unbounded(command, timeout)
+
+    @classmethod
+    async def _run_command_async_unbounded(
+        cls,
+        command: list[str],
+        timeout: int | None,
+    ) -> subprocess.CompletedProcess[bytes]:
+        with tempfile.TemporaryFile() as stdout_file, tempfile.TemporaryFile() as stderr_file:
+            proc = await asyncio.create_subprocess_exec(
+                *command,
+                stdin=asyncio.subprocess.DEVNULL,
+                stdout=stdout_file,
+                stderr=stderr_file,
+                **cls._spawn_kwargs(),
+            )
+
+            try:
+                await asyncio.wait_for(proc.wait(), timeout=timeout)
+            except asyncio.TimeoutError as exc:
+                cls._kill_process_tree(proc)
+                try:
+                    await asyncio.wait_for(proc.wait(), timeout=5)
+                except Exception:
+                    pass
+                raise cls._ConversionTimeout(f"LibreOffice conversion timed out after {timeout}s") from exc
+
+            stdout_file.seek(0)
+            stdout = stdout_file.read()
+            stderr_file.seek(0)
+            stderr = stderr_file.read()
+
+        returncode = cast(int, proc.returncode)
+        if returncode != 0:
+            raise subprocess.CalledProcessError(
+                returncode,
+                command,
+                output=stdout,
+                stderr=stderr,
+            )
+
+        return subprocess.CompletedProcess(command, returncode, stdout, stderr)
+
     @classmethod
     def _build_command(
         cls,
         libreoffice_path: str | Path,
-        source: Path,
+        sources: Path | Sequence[Path],
         output_dir: Path,
         extra_args: Iterable[str] | None = None,
     ) -> list[str]:
+        # LibreOffice は1回の起動で複数の入力ファイルを順に変換できるため、--outdir の後ろに全て並べる
+        if isinstance(sources, Path):
+            sources = [sources]
+        # --norestore: クラッシュ復旧の確認をしない / --nodefault: 起動時に空のドキュメントを開かない
         command = [
             str(libreoffice_path),
             "--headless",
             "--nologo",
             "--nolockcheck",
+            "--norestore",
+            "--nodefault",
         ]
         if extra_args:
             command.extend(extra_args)
@@ -386,21 +688,52 @@ class LibreOfficeExecOffice2PDFUtil:
             "pdf",
             "--outdir",
             str(output_dir),
-            str(source),
         ])
+        command.extend(str(source) for source in sources)
         return command
 
     @classmethod
-    def create_pdf_from_document_file_via_libreoffice_exec(
+    @contextlib.contextmanager
+    def _conversion_errors(
+        cls,
+        user_installation_arg: str,
+        timeout: int | None,
+        source_label: str,
+    ) -> Iterator[None]:
+        # 同期版・非同期版で共通の例外変換
+        try:
+            yield
+        except subprocess.CalledProcessError as exc:
+            stderr = exc.stderr.decode(errors="ignore") if exc.stderr else ""
+            raise RuntimeError(
+                f"LibreOffice failed to convert {source_label}: {stderr.strip()}"
+            ) from exc
+        except cls._ConversionTimeout as exc:
+            # タイムアウト時は起動したプロセスツリーは停止済み。UserInstallation を共有する残存プロセスも止める
+            cls._kill_libreoffice_by_user_installation(user_installation_arg)
+            raise RuntimeError(f"LibreOffice conversion timed out after {timeout}s") from exc
+        except FileNotFoundError:
+            raise
+        except Exception as exc:
+            raise RuntimeError(f"Failed to convert {source_label} to PDF") from exc
+
+    @classmethod
+    def _format_process_output(cls, result: subprocess.CompletedProcess[bytes]) -> str:
+        stdout = result.stdout.decode(errors="ignore") if result.stdout else ""
+        stderr = result.stderr.decode(errors="ignore") if result.stderr else ""
+        return f"stdout: {stdout.strip()} stderr: {stderr.strip()}"
+
+    @classmethod
+    def _prepare_single_conversion(
         cls,
         input_path: str,
         output_path: str,
-        libreoffice_path: str | Path,
-        timeout: int | None = DEFAULT_TIMEOUT_SECONDS,
-    ) -> Path:
+    ) -> tuple[Path, Path, Path, Path, float]:
         source, target = _resolve_target_path(input_path, output_path)
 
+        # 出力先は一度だけ resolve し、以降は解決済みのディレクトリ配下のパスとして扱う
         output_dir = target.parent.resolve()
+        target = output_dir / target.name
         expected_produced_path = output_dir / (source.stem + ".pdf")
         start_epoch = time.time()
         for p in (target, expected_produced_path):
@@ -409,9 +742,97 @@ class LibreOfficeExecOffice2PDFUtil:
                     p.unlink()
             except Exception:
                 pass
+        return source, target, output_dir, expected_produced_path, start_epoch
 
-        with tempfile.TemporaryDirectory() as lo_profile_dirname:
-            lo_profile_dir = Path(lo_profile_dirname)
+    @classmethod
+    def _finalize_single_conversion(
+        cls,
+        result: subprocess.CompletedProcess[bytes],
+        target: Path,
+        output_dir: Path,
+        expected_produced_path: Path,
+        start_epoch: float,
+    ) -> Path:
+        produced_candidate = cls._resolve_produced_pdf_path(
+            expected_produced_path,
+            output_dir,
+            start_time_epoch=start_epoch,
+        )
+        if produced_candidate is None:
+            raise RuntimeError(
+                f"Expected PDF not found at {target}; {cls._format_process_output(result)}"
+            )
+
+        if produced_candidate != target:
+            produced_candidate.rename(target)
+
+        return target
+
+    @classmethod
+    def _prepare_batch_conversion(
+        cls,
+        input_paths: Sequence[str],
+        output_dir: str,
+    ) -> tuple[Path, list[Path], list[Path]]:
+        resolved_output_dir = Path(output_dir).expanduser()
+        resolved_output_dir.mkdir(parents=True, exist_ok=True)
+        resolved_output_dir = resolved_output_dir.resolve()
+
+        sources: list[Path] = []
+        targets: list[Path] = []
+        for input_path in input_paths:
+            # 出力先ディレクトリは作成・解決済みのため、ファイルごとに確認し直さない
+            source = _resolve_source_path(input_path)
+            target = resolved_output_dir / (source.stem + ".pdf")
+            sources.append(source)
+            targets.append(target)
+            try:
+                if target.exists():
+                    target.unlink()
+            except Exception:
+                pass
+        return resolved_output_dir, sources, targets
+
+    @classmethod
+    def _finalize_batch_conversion(
+        cls,
+        result: subprocess.CompletedProcess[bytes],
+        targets: list[Path],
+    ) -> list[Path]:
+        missing = [target for target in targets if not target.exists()]
+        if missing:
+            raise RuntimeError(
+                f"Expected PDF not found at {', '.join(str(p) for p in missing)}; "
+                f"{cls._format_process_output(result)}"
+            )
+        return targets
+
+    @classmethod
+    def _group_by_output_dir(
+        cls,
+        input_paths: Sequence[str],
+        output_dir: str | None,
+    ) -> dict[str, list[int]]:
+        # 出力先ディレクトリごとに入力をまとめる（入力順の位置も保持する）
+        groups: dict[str, list[int]] = {}
+        for index, input_path in enumerate(input_paths):
+            group_dir = output_dir if output_dir is not None else str(Path(_build_default_output_path(input_path)).parent)
+            groups.setdefault(group_dir, []).append(index)
+        return groups
+
+    @classmethod
+    def create_pdf_from_document_file_via_libreoffice_exec(
+        cls,
+        input_path: str,
+        output_path: str,
+        libreoffice_path: str | Path,
+        timeout: int | None = DEFAULT_TIMEOUT_SECONDS,
+    ) -> Path:
+        source, target, output_dir, expected_produced_path, start_epoch = cls._prepare_single_conversion(
+            input_path, output_path,
+        )
+
+        with cls._temporary_profile_dir(libreoffice_path) as lo_profile_dir:
             user_installation_arg = cls._build_user_installation_arg(lo_profile_dir)
             command = cls._build_command(
                 libreoffice_path,
@@ -419,51 +840,113 @@ class LibreOfficeExecOffice2PDFUtil:
                 output_dir,
                 extra_args=[user_installation_arg],
             )
+            with cls._conversion_errors(user_installation_arg, timeout, source.name):
+                result, _proc = cls._run_command_with_timeout_return_proc(command=command, timeout=timeout)
 
-            try:
-                result, proc = cls._run_command_with_timeout_return_proc(command=command, timeout=timeout)
-                produced_candidate = cls._resolve_produced_pdf_path(
-                    expected_produced_path,
-                    output_dir,
-                    start_time_epoch=start_epoch,
-                )
-            except subprocess.CalledProcessError as exc:
-                stderr = exc.stderr.decode(errors="ignore") if exc.stderr else ""
-                raise RuntimeError(
-                    f"LibreOffice failed to convert {source.name}: {stderr.strip()}"
-                ) from exc
-            except cls._ConversionTimeout as exc:
-                try:
-                    if "proc" in locals() and isinstance(locals().get("proc"), subprocess.Popen):
-                        cls._kill_process_tree(locals()["proc"])
-                except Exception:
-                    pass
-                cls._kill_libreoffice_by_user_installation(user_installation_arg)
-                raise RuntimeError(f"LibreOffice conversion timed out after {timeout}s") from exc
-            except FileNotFoundError:
-                raise
-            except Exception as exc:
-                raise RuntimeError(f"Failed to convert {source} to PDF") from exc
+        return cls._finalize_single_conversion(
+            result, target, output_dir, expected_produced_path, start_epoch,
+        )
 
-        if produced_candidate is None:
-            stdout = result.stdout.decode(errors="ignore") if result.stdout else ""
-            stderr = result.stderr.decode(errors="ignore") if result.stderr else ""
-            raise RuntimeError(
-                f"Expected PDF not found at {target}; stdout: {stdout.strip()} stderr: {stderr.strip()}"
+    @classmethod
+    async def create_pdf_from_document_file_via_libreoffice_exec_async(
+        cls,
+        input_path: str,
+        output_path: str,
+        libreoffice_path: str | Path,
+        timeout: int | None = DEFAULT_TIMEOUT_SECONDS,
+    ) -> Path:
+        source, target, output_dir, expected_produced_path, start_epoch = cls._prepare_single_conversion(
+            input_path, output_path,
+        )
+
+        async with cls._temporary_profile_dir_async(libreoffice_path) as lo_profile_dir:
+            user_installation_arg = cls._build_user_installation_arg(lo_profile_dir)
+            command = cls._build_command(
+                libreoffice_path,
+                source,
+                output_dir,
+                extra_args=[user_installation_arg],
             )
+            with cls._conversion_errors(user_installation_arg, timeout, source.name):
+                result = await cls._run_command_async(command=command, timeout=timeout)
 
-        produced_path = produced_candidate
-        if produced_path.exists() and produced_path.resolve() != target.resolve():
-            produced_path.rename(target)
+        return cls._finalize_single_conversion(
+            result, target, output_dir, expected_produced_path, start_epoch,
+        )
 
-        if not target.exists():
-            stdout = result.stdout.decode(errors="ignore") if result.stdout else ""
-            stderr = result.stderr.decode(errors="ignore") if result.stderr else ""
-            raise RuntimeError(
-                f"Expected PDF not found at {target}; stdout: {stdout.strip()} stderr: {stderr.strip()}"
+    @classmethod
+    def create_pdfs_from_document_files_via_libreoffice_exec(
+        cls,
+        input_paths: Sequence[str],
+        output_dir: str,
+        libreoffice_path: str | Path,
+        timeout: int | None = DEFAULT_TIMEOUT_SECONDS,
+    ) -> list[Path]:
+        """複数のOfficeファイルを1回の soffice 起動でまとめてPDFへ変換する。
+
+        timeout はファイル1件あたりの秒数として扱い、件数分を合計したものを起動全体のタイムアウトとする。
+        同じ stem のファイルを渡した場合は、1件ずつ変換した場合と同じく後の入力で上書きされる。
+        """
+        if not input_paths:
+            return []
+
+        resolved_output_dir, sources, targets = cls._prepare_batch_conversion(input_paths, output_dir)
+        batch_timeout = timeout * len(sources) if timeout is not None else None
+        with cls._temporary_profile_dir(libreoffice_path) as lo_profile_dir:
+            user_installation_arg = cls._build_user_installation_arg(lo_profile_dir)
+            command = cls._build_command(
+                libreoffice_path,
+                sources,
+                resolved_output_dir,
+                extra_args=[user_installation_arg],
             )
+            source_label = ", ".join(source.name for source in sources)
+            with cls._conversion_errors(user_installation_arg, batch_timeout, source_label):
+                result, _proc = cls._run_command_with_timeout_return_proc(command=command, timeout=batch_timeout)
 
-        return target.resolve()
+        return cls._finalize_batch_conversion(result, targets)
+
+    @classmethod
+    async def create_pdfs_from_document_files_via_libreoffice_exec_async(
+        cls,
+        input_paths: Sequence[str],
+        output_dir: str,
+        libreoffice_path: str | Path,
+        timeout: int | None = DEFAULT_TIMEOUT_SECONDS,
+    ) -> list[Path]:
+        """create_pdfs_from_document_files_via_libreoffice_exec の非同期版。"""
+        if not input_paths:
+            return []
+
+        resolved_output_dir, sources, targets = cls._prepare_batch_conversion(input_paths, output_dir)
+        batch_timeout = timeout * len(sources) if timeout is not None else None
+        async with cls._temporary_profile_dir_async(libreoffice_path) as lo_profile_dir:
+            user_installation_arg = cls._build_user_installation_arg(lo_profile_dir)
+            command = cls._build_command(
+                libreoffice_path,
+                sources,
+                resolved_output_dir,
+                extra_args=[user_installation_arg],
+            )
+            source_label = ", ".join(source.name for source in sources)
+            with cls._conversion_errors(user_installation_arg, batch_timeout, source_label):
+                result = await cls._run_command_async(command=command, timeout=batch_timeout)
+
+        return cls._finalize_batch_conversion(result, targets)
+
+    @classmethod
+    def _default_bytes_temp_dir(cls) -> Path | None:
+        """バイト列の入力を一時的に書き出すディレクトリの既定値を返す。
+
+        Linux で /dev/shm（tmpfs）が書き込み可能ならそこを使い、入力をディスクへ書き出して読み戻す往復を避ける。
+        soffice は入力ファイル名の拡張子で形式と出力名を決めるため、パイプやメモリファイルではなく実ファイルとして置く。
+        """
+        if not sys.platform.startswith("linux"):
+            return None
+        ramdisk = cls.RAMDISK_TEMP_DIR
+        if ramdisk.is_dir() and os.access(ramdisk, os.W_OK | os.X_OK):
+            return ramdisk
+        return None
 
     @classmethod
     def create_pdf_from_document_bytes(
@@ -478,6 +961,8 @@ class LibreOfficeExecOffice2PDFUtil:
         source_suffix = Path(input_filename).suffix if input_filename else ""
         source_name = f"input_document{source_suffix}" if source_suffix else "input_document"
 
+        if temp_dir is None:
+            temp_dir = cls._default_bytes_temp_dir()
         with tempfile.TemporaryDirectory(dir=temp_dir) as tmpdirname:
             source_path = Path(tmpdirname) / source_name
             source_path.write_bytes(input_bytes)
@@ -489,6 +974,33 @@ class LibreOfficeExecOffice2PDFUtil:
                 timeout=timeout,
             )
 
+    @classmethod
+    async def create_pdf_from_document_bytes_async(
+        cls,
+        input_bytes: bytes,
+        output_path: str,
+        libreoffice_path: str,
+        timeout: int | None = DEFAULT_TIMEOUT_SECONDS,
+        temp_dir: str | Path | None = None,
+        input_filename: str | Path | None = None,
+    ) -> Path:
+        """create_pdf_from_document_bytes の非同期版。変換中もイベントループを止めない。"""
+        source_suffix = Path(input_filename).suffix if input_filename else ""
+        source_name = f"input_document{source_suffix}" if source_suffix else "input_document"
+
+        if temp_dir is None:
+            temp_dir = cls._default_bytes_temp_dir()
+        with tempfile.TemporaryDirectory(dir=temp_dir) as tmpdirname:
+            source_path = Path(tmpdirname) / source_name
+            await asyncio.to_thread(source_path.write_bytes, input_bytes)
+
+            return await cls.create_pdf_from_document_file_async(
+                input_path=source_path.as_posix(),
+                output_path=output_path,
+                libreoffice_path=libreoffice_path,
+                timeout=timeout,
+            )
+
     @classmethod
     def create_pdf_from_document_file(
         cls,
@@ -497,8 +1009,13 @@ class LibreOfficeExecOffice2PDFUtil:
         *,
         libreoffice_path: str | Path | None = None,
         timeout: int | None = DEFAULT_TIMEOUT_SECONDS,
+        listener_pool_size: int = 0,
+        listener_max_tasks_per_process: int = DEFAULT_LISTENER_MAX_TASKS_PER_PROCESS,
     ) -> Path:
         libreoffice_binary = cls.find_libreoffice_binary(explicit_path=libreoffice_path)
+        pool = cls._get_listener_pool(libreoffice_binary, listener_pool_size, listener_max_tasks_per_process)
+        if pool is not None:
+            return cls._convert_with_listener_pool(pool, input_path, output_path, timeout)
         return cls.create_pdf_from_document_file_via_libreoffice_exec(
             input_path=input_path,
             output_path=output_path,
@@ -506,6 +1023,153 @@ class LibreOfficeExecOffice2PDFUtil:
             timeout=timeout,
         )
 
+    @classmethod
+    def create_pdfs_from_document_files(
+        cls,
+        input_paths: Sequence[str],
+        output_dir: str | None = None,
+        *,
+        libreoffice_path: str | Path | None = None,
+        timeout: int | None = DEFAULT_TIMEOUT_SECONDS,
+        listener_pool_size: int = 0,
+        listener_max_tasks_per_process: int = DEFAULT_LISTENER_MAX_TASKS_PER_PROCESS,
+    ) -> list[Path]:
+        """複数のOfficeファイルをPDFへ変換し、入力順に生成したPDFのパスを返す。
+
+        output_dir を省略した場合は各ファイルと同じディレクトリに出力する。
+        出力先ディレクトリごとに soffice を1回だけ起動する。
+        常駐リスナーを使う場合は、リスナー数を上限に1件ずつ並行して変換する。
+        """
+        libreoffice_binary = cls.find_libreoffice_binary(explicit_path=libreoffice_path)
+        pool = cls._get_listener_pool(libreoffice_binary, listener_pool_size, listener_max_tasks_per_process)
+        if pool is not None:
+            output_paths = cls._plan_listener_output_paths(input_paths, output_dir)
+            with ThreadPoolExecutor(max_workers=listener_pool_size, thread_name_prefix="office2pdf") as executor:
+                return list(executor.map(
+                    lambda paths: cls._convert_with_listener_pool(pool, paths[0], paths[1], timeout),
+                    zip(input_paths, output_paths),
+                ))
+
+        results: list[Path | None] = [None] * len(input_paths)
+        for group_dir, indexes in cls._group_by_output_dir(input_paths, output_dir).items():
+            pdf_paths = cls.create_pdfs_from_document_files_via_libreoffice_exec(
+                input_paths=[input_paths[i] for i in indexes],
+                output_dir=group_dir,
+                libreoffice_path=libreoffice_binary,
+                timeout=timeout,
+            )
+            for index, pdf_path in zip(indexes, pdf_paths):
+                results[index] = pdf_path
+        return cast(list[Path], results)
+
+    @classmethod
+    async def create_pdf_from_document_file_async(
+        cls,
+        input_path: str,
+        output_path: str,
+        *,
+        libreoffice_path: str | Path | None = None,
+        timeout: int | None = DEFAULT_TIMEOUT_SECONDS,
+        listener_pool_size: int = 0,
+        listener_max_tasks_per_process: int = DEFAULT_LISTENER_MAX_TASKS_PER_PROCESS,
+    ) -> Path:
+        """create_pdf_from_document_file の非同期版。変換中もイベントループを止めない。"""
+        libreoffice_binary = cls.find_libreoffice_binary(explicit_path=libreoffice_path)
+        pool = cls._get_listener_pool(libreoffice_binary, listener_pool_size, listener_max_tasks_per_process)
+        if pool is not None:
+            return await asyncio.to_thread(cls._convert_with_listener_pool, pool, input_path, output_path, timeout)
+        return await cls.create_pdf_from_document_file_via_libreoffice_exec_async(
+            input_path=input_path,
+            output_path=output_path,
+            libreoffice_path=libreoffice_binary,
+            timeout=timeout,
+        )
+
+    @classmethod
+    async def create_pdfs_from_document_files_async(
+        cls,
+        input_paths: Sequence[str],
+        output_dir: str | None = None,
+        *,
+        libreoffice_path: str | Path | None = None,
+        timeout: int | None = DEFAULT_TIMEOUT_SECONDS,
+        listener_pool_size: int = 0,
+        listener_max_tasks_per_process: int = DEFAULT_LISTENER_MAX_TASKS_PER_PROCESS,
+    ) -> list[Path]:
+        """create_pdfs_from_document_files の非同期版。
+
+        出力先ディレクトリごとの soffice 起動を、CPUコア数を上限に並行して実行する。
+        """
+        libreoffice_binary = cls.find_libreoffice_binary(explicit_path=libreoffice_path)
+        pool = cls._get_listener_pool(libreoffice_binary, listener_pool_size, listener_max_tasks_per_process)
+        if pool is not None:
+            # 同時変換数はプール側でリスナー数に制限される
+            output_paths = cls._plan_listener_output_paths(input_paths, output_dir)
+            return list(await asyncio.gather(*[
+                asyncio.to_thread(cls._convert_with_listener_pool, pool, input_path, output_path, timeout)
+                for input_path, output_path in zip(input_paths, output_paths)
+            ]))
+        groups = cls._group_by_output_dir(input_paths, output_dir)
+        sem = asyncio.Semaphore(os.cpu_count() or 1)
+
+        async def _convert_group(group_dir: str, indexes: list[int]) -> list[Path]:
+            async with sem:
+                return await cls.create_pdfs_from_document_files_via_libreoffice_exec_async(
+                    input_paths=[input_paths[i] for i in indexes],
+                    output_dir=group_dir,
+                    libreoffice_path=libreoffice_binary,
+                    timeout=timeout,
+                )
+
+        group_items = list(groups.items())
+        group_results = await asyncio.gather(
+            *[_convert_group(group_dir, indexes) for group_dir, indexes in group_items]
+        )
+
+        results: list[Path | None] = [None] * len(input_paths)
+        for (_group_dir, indexes), pdf_paths in zip(group_items, group_results):
+            for index, pdf_path in zip(indexes, pdf_paths):
+                results[index] = pdf_path
+        return cast(list[Path], results)
+
+    @classmethod
+    def _get_listener_pool(
+        cls,
+        libreoffice_binary: str,
+        listener_pool_size: int,
+        listener_max_tasks_per_process: int,
+    ) -> _LibreOfficeListenerPool | None:
+        # 常駐リスナーとのやり取りには LibreOffice 同梱の uno モジュールが必要. 使えなければ従来の起動方式にする
+        if listener_pool_size <= 0 or importlib.util.find_spec("uno") is None:
+            return None
+        return _LibreOfficeListenerPool.get(libreoffice_binary, listener_pool_size, listener_max_tasks_per_process)
+
+    @classmethod
+    def _plan_listener_output_paths(cls, input_paths: Sequence[str], output_dir: str | None) -> list[str]:
+        if output_dir is None:
+            return [_build_default_output_path(input_path) for input_path in input_paths]
+        Path(output_dir).expanduser().mkdir(parents=True, exist_ok=True)
+        return [output_dir] * len(input_paths)
+
+    @classmethod
+    def _convert_with_listener_pool(
+        cls,
+        pool: _LibreOfficeListenerPool,
+        input_path: str,
+        output_path: str,
+        timeout: int | None,
+    ) -> Path:
+        source, target = _resolve_target_path(input_path, output_path)
+        try:
+            if target.exists():
+                target.unlink()
+        except Exception:
+            pass
+        pool.convert(source, target, timeout)
+        if not target.exists():
+            raise RuntimeError(f"Expected PDF not found at {target}")
+        return target.resolve()
+
     @classmethod
     def try_find_libreoffice_binary(
         cls,
@@ -513,6 +1177,22 @@ class LibreOfficeExecOffice2PDFUtil:
         configured_path: str | Path | None = None,
     ) -> str | None:
         candidate = explicit_path or configured_path
+        # 変換のたびに PATH 上を探索しないよう、見つかった結果を (指定パス, PATH) をキーに覚えておく.
+        # バイナリが削除された場合は覚えた結果を捨てて探し直す
+        cache_key = (str(candidate or ""), os.environ.get("PATH", ""))
+        cached = cls._binary_cache.get(cache_key)
+        if cached is not None:
+            if os.path.exists(cached):
+                return cached
+            cls._binary_cache.pop(cache_key, None)
+
+        resolved = cls._resolve_libreoffice_binary(candidate)
+        if resolved is not None:
+            cls._binary_cache[cache_key] = resolved
+        return resolved
+
+    @classmethod
+    def _resolve_libreoffice_binary(cls, candidate: str | Path | None) -> str | None:
         if candidate:
             candidate_path = Path(candidate).expanduser()
             if candidate_path.exists():
@@ -551,6 +1231,259 @@ class LibreOfficeExecOffice2PDFUtil:
             "or ensure LibreOffice is on PATH."
         )
 
+def _find_free_port() -> int:
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+        sock.bind(("127.0.0.1", 0))
+        return int(sock.getsockname()[1])
+
+
+# ドキュメントの種類ごとのPDFエクスポートフィルタ（どれにも当たらなければ Writer 用を使う）
+_PDF_EXPORT_FILTERS: tuple[tuple[str, str], ...] = (
+    ("com.sun.star.sheet.SpreadsheetDocument", "calc_pdf_Export"),
+    ("com.sun.star.presentation.PresentationDocument", "impress_pdf_Export"),
+    ("com.sun.star.drawing.DrawingDocument", "draw_pdf_Export"),
+)
+
+
+class _LibreOfficeListener:
+    """リスナーモード（--accept）で常駐する soffice プロセス1つ分。UNO 経由で変換を依頼する。"""
+
+    CONNECT_TIMEOUT_SECONDS = 60.0
+
+    def __init__(self, libreoffice_path: str, max_tasks: int) -> None:
+        self.max_tasks = max_tasks
+        self.tasks = 0
+        self._desktop: Any = None
+        # close はタイムアウト監視スレッドと変換スレッドの両方から呼ばれ得るため、1回だけ実行する
+        self._close_lock = threading.Lock()
+        self._closed = False
+        # プロファイルはリスナーごとに分け、同時に動く soffice 同士でロックを取り合わないようにする
+        self._profile_dir = tempfile.TemporaryDirectory(ignore_cleanup_errors=True)
+        profile_dir = Path(self._profile_dir.name) / "profile"
+        LibreOfficeExecOffice2PDFUtil._seed_profile_dir(libreoffice_path, profile_dir)
+        self._port = _find_free_port()
+        self._user_installation_arg = LibreOfficeExecOffice2PDFUtil._build_user_installation_arg(profile_dir)
+        self._proc = subprocess.Popen(
+            [
+                libreoffice_path,
+                "--headless",
+                "--invisible",
+                "--nologo",
+                "--nodefault",
+                "--norestore",
+                "--nolockcheck",
+                self._user_installation_arg,
+                f"--accept=socket,host=127.0.0.1,port={self._port};urp;StarOffice.ComponentContext",
+            ],
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            start_new_session=True,
+        )
+
+    def is_reusable(self) -> bool:
+        return not self._closed and self._proc.poll() is None and self.tasks < self.max_tasks
+
+    def _connect(self) -> Any:
+        import uno  # type: ignore[import-not-found]
+
+        local_context = uno.getComponentContext()
+        resolver = local_context.ServiceManager.createInstanceWithContext(
+            "com.sun.star.bridge.UnoUrlResolver", local_context
+        )
+        deadline = time.monotonic() + self.CONNECT_TIMEOUT_SECONDS
+        while True:
+            try:
+                context = resolver.resolve(
+                    f"uno:socket,host=127.0.0.1,port={self._port};urp;StarOffice.ComponentContext"
+                )
+                break
+            except Exception as exc:
+                # 起動直後はまだ接続を受け付けないため、プロセスが生きている間は再試行する
+                if self._proc.poll() is not None or time.monotonic() >= deadline:
+                    raise RuntimeError("Failed to connect to LibreOffice listener") from exc
+                time.sleep(0.2)
+        return context.ServiceManager.createInstanceWithContext("com.sun.star.frame.Desktop", context)
+
+    def convert(self, source: Path, target: Path) -> None:
+        import uno  # type: ignore[import-not-found]
+        from com.sun.star.beans import PropertyValue  # type: ignore[import-not-found]
+
+        def _property(name: str, value: Any) -> Any:
+            prop = PropertyValue()
+            prop.Name = name
+            prop.Value = value
+            return prop
+
+        if self._desktop is None:
+            self._desktop = self._connect()
+
+        self.tasks += 1
+        document = self._desktop.loadComponentFromURL(
+            uno.systemPathToFileUrl(str(source)),
+            "_blank",
+            0,
+            (_property("Hidden", True), _property("ReadOnly", True)),
+        )
+        if document is None:
+            raise RuntimeError(f"LibreOffice could not load {source.name}")
+        try:
+            filter_name = next(
+                (name for service, name in _PDF_EXPORT_FILTERS if document.supportsService(service)),
+                "writer_pdf_Export",
+            )
+            document.storeToURL(
+                uno.systemPathToFileUrl(str(target)),
+                (_property("FilterName", filter_name),),
+            )
+        finally:
+            try:
+                document.close(True)
+            except Exception:
+                pass
+
+    def close(self) -> None:
+        with self._close_lock:
+            if self._closed:
+                return
+            self._closed = True
+        LibreOfficeExecOffice2PDFUtil._kill_process_tree(self._proc)
+        try:
+            self._proc.wait(timeout=5)
+        except Exception:
+            pass
+        LibreOfficeExecOffice2PDFUtil._kill_libreoffice_by_user_installation(self._user_installation_arg)
+        self._profile_dir.cleanup()
+
+
+class _LibreOfficeListenerPool:
+    """常駐 soffice リスナーのプール。
+
+    空きスロットのキューで同時変換数をリスナー数までに制限する。リスナーは初回使用時に起動し、
+    異常終了・タイムアウト・最大変換件数到達のいずれかで破棄して次回使用時に起動し直す。
+    """
+
+    # soffice のパスごとに1つ. 設定（リスナー数・最大変換件数）が変わったら古いプールは retire する
+    _pools: dict[str, "_LibreOfficeListenerPool"] = {}
+    _pools_lock = threading.Lock()
+
+    def __init__(self, libreoffice_path: str, size: int, max_tasks_per_process: int) -> None:
+        self._libreoffice_path = libreoffice_path
+        self._size = size
+        self._max_tasks_per_process = max_tasks_per_process
+        self._retired = False
+        self._slots: queue.Queue[_LibreOfficeListener | None] = queue.Queue()
+        for _ in range(size):
+            self._slots.put(None)
+        # 起動中のリスナー（プロセス終了時の後始末用）
+        self._listeners: set[_LibreOfficeListener] = set()
+        self._listeners_lock = threading.Lock()
+
+    @classmethod
+    def get(cls, libreoffice_path: str, size: int, max_tasks_per_process: int) -> "_LibreOfficeListenerPool":
+        retired: _LibreOfficeListenerPool | None = None
+        with cls._pools_lock:
+            pool = cls._pools.get(libreoffice_path)
+            if pool is not None and (pool._size, pool._max_tasks_per_process) != (size, max_tasks_per_process):
+                retired, pool = pool, None
+            if pool is None:
+                pool = cls(libreoffice_path, size, max_tasks_per_process)
+                cls._pools[libreoffice_path] = pool
+        if retired is not None:
+            retired.retire()
+        return pool
+
+    def _create_listener(self) -> _LibreOfficeListener:
+        listener = _LibreOfficeListener(self._libreoffice_path, self._max_tasks_per_process)
+        with self._listeners_lock:
+            self._listeners.add(listener)
+        return listener
+
+    def _discard_listener(self, listener: _LibreOfficeListener) -> None:
+        with self._listeners_lock:
+            self._listeners.discard(listener)
+        listener.close()
+
+    def _forget_listener(self, listener: _LibreOfficeListener) -> None:
+        with self._listeners_lock:
+            self._listeners.discard(listener)
+
+    def convert(self, source: Path, target: Path, timeout: int | None) -> None:
+        listener = self._slots.get()
+        try:
+            if listener is not None and not listener.is_reusable():
+                self._discard_listener(listener)
+                listener = None
+            if listener is None:
+                listener = self._create_listener()
+
+            # UNO 呼び出しはブロックするため、タイムアウト時はリスナーごと停止して呼び出しを中断させる
+            timed_out = threading.Event()
+            active_listener = listener
+
+            def _on_timeout() -> None:
+                timed_out.set()
+                active_listener.close()
+
+            timer = threading.Timer(timeout, _on_timeout) if timeout else None
+            if timer is not None:
+                timer.daemon = True
+                timer.start()
+            try:
+                listener.convert(source, target)
+            except Exception as exc:
+                if timed_out.is_set():
+                    # 停止はタイムアウト監視スレッドが行っているため、ここではプールから外すだけにする
+                    self._forget_listener(listener)
+                    listener = None
+                    raise RuntimeError(f"LibreOffice conversion timed out after {timeout}s") from exc
+                self._discard_listener(listener)
+                listener = None
+                raise RuntimeError(f"LibreOffice failed to convert {source.name}") from exc
+            finally:
+                if timer is not None:
+                    timer.cancel()
+        finally:
+            if listener is not None and self._retired:
+                self._discard_listener(listener)
+                listener = None
+            self._slots.put(listener)
+
+    def retire(self) -> None:
+        """新しい設定のプールに置き換えられたプールを片付ける. 待機中のリスナーは停止し、変換中のものは返却時に停止する。"""
+        self._retired = True
+        idle: list[_LibreOfficeListener | None] = []
+        while True:
+            try:
+                idle.append(self._slots.get_nowait())
+            except queue.Empty:
+                break
+        for listener in idle:
+            if listener is not None:
+                self._discard_listener(listener)
+            # 置き換え前にこのプールを取得していた呼び出し元が待ち続けないよう、スロット自体は戻す
+            self._slots.put(None)
+
+    def close(self) -> None:
+        with self._listeners_lock:
+            listeners = list(self._listeners)
+            self._listeners.clear()
+        for listener in listeners:
+            listener.close()
+
+    @classmethod
+    def close_all(cls) -> None:
+        with cls._pools_lock:
+            pools = list(cls._pools.values())
+            cls._pools.clear()
+        for pool in pools:
+            pool.close()
+
+
+# プロセス終了時に常駐させた soffice を残さない
+atexit.register(_LibreOfficeListenerPool.close_all)
+
+
 __all__ = [
     "LibreOfficeExecOffice2PDFUtil",
     "LibreOfficeUnoOffice2PDFUtil",
@@ -1,39 +1,264 @@
 from __future__ import annotations
 
-from typing import Any
+import atexit
+import io
+import itertools
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from multiprocessing import shared_memory
+from typing import Any, Iterator, Literal
 
 import fitz
-from fitz import Document
+from fitz import Document, Page
 from pdfminer.high_level import extract_text
+from PIL import Image
 
+# ワーカー1つあたりにこのページ数以上を割り当てられる場合だけ、ページ範囲ごとに別プロセスで抽出する.
+# 実測では描画+エンコードが1ページ約20ms、spawn したワーカーの起動（パッケージの import）が約0.5sで、
+# 初回のプール起動込みで2分割が逐次を上回るのは50ページ程度からのため、余裕を見て64とする
+PARALLEL_EXTRACT_MIN_PAGES = 64
+
+# ページ画像のエンコード形式. jpeg は png の deflate 圧縮より軽いが、受け取り側が mime_type を見る必要がある
+PageImageFormat = Literal["png", "jpeg"]
+JPEG_QUALITY = 85
+
+# ページ画像の生成方針. "auto" はテキストが十分に取れて埋め込み画像もないページの描画を省く
+RenderImages = bool | Literal["auto"]
+# "auto" でページ画像を省くのに必要な抽出テキストの文字数
+AUTO_RENDER_MIN_TEXT_CHARS = 200
 
-def _extract_content(doc: Document) -> list[dict[str, Any]]:
-    results: list[dict[str, Any]] = []
 
-    for page_num in range(len(doc)):
-        page = doc.load_page(page_num)
-        text = page.get_text("text")
-        text = text.strip() if isinstance(text, str) else ""
+def _encode_jpeg(pix: fitz.Pixmap) -> bytes:
+    # JPEG は PyMuPDF 自身のエンコーダより、Pillow（libjpeg-turbo を同梱）でエンコードした方が大幅に速い.
+    # PNG は PyMuPDF の方が速く小さいため、そのまま tobytes("png") を使う
+    image = Image.frombuffer("RGB", (pix.width, pix.height), pix.samples, "raw", "RGB", pix.stride, 1)
+    buffer = io.BytesIO()
+    image.save(buffer, format="JPEG", quality=JPEG_QUALITY)
+    return buffer.getvalue()
 
-        if text:
-            results.append({"type": "text", "text": text})
 
-        pix = page.get_pixmap()
-        png_bytes = pix.tobytes("png")
-        del pix
-        results.append({"type": "image", "bytes": png_bytes})
+def _needs_page_image(page: Page, text: str, render_images: RenderImages) -> bool:
+    if render_images != "auto":
+        return bool(render_images)
+    # ベクター描画（図表の線など）は get_images に現れないため、既定では "auto" にしない
+    return len(text) < AUTO_RENDER_MIN_TEXT_CHARS or bool(page.get_images())
+
+
+def _extract_page(
+    page: Page, image_format: PageImageFormat = "png", render_images: RenderImages = True
+) -> list[dict[str, Any]]:
+    results: list[dict[str, Any]] = []
+    text = page.get_text("text")
+    text = text.strip() if isinstance(text, str) else ""
 
+    if text:
+        results.append({"type": "text", "text": text})
+
+    if not _needs_page_image(page, text, render_images):
+        return results
+
+    # ページ描画に透過は不要なため、アルファチャネルなしで描画してエンコードするデータ量を減らす
+    pix = page.get_pixmap(alpha=False)
+    if image_format == "jpeg":
+        image_bytes = _encode_jpeg(pix)
+    else:
+        image_bytes = pix.tobytes("png")
+    del pix
+    results.append({"type": "image", "bytes": image_bytes, "mime_type": f"image/{image_format}"})
     return results
 
 
-def extract_content_from_bytes(pdf_bytes: bytes) -> list[dict[str, Any]]:
-    with fitz.open(stream=pdf_bytes, filetype="pdf") as doc:
-        return _extract_content(doc)
+def _iter_content(
+    doc: Document,
+    start: int = 0,
+    stop: int | None = None,
+    image_format: PageImageFormat = "png",
+    render_images: RenderImages = True,
+) -> Iterator[dict[str, Any]]:
+    for page_num in range(start, len(doc) if stop is None else stop):
+        yield from _extract_page(doc.load_page(page_num), image_format, render_images)
+
+
+def _extract_content(
+    doc: Document,
+    start: int = 0,
+    stop: int | None = None,
+    image_format: PageImageFormat = "png",
+    render_images: RenderImages = True,
+) -> list[dict[str, Any]]:
+    return list(_iter_content(doc, start, stop, image_format, render_images))
+
+
+def _open_document(source: bytes | str) -> Document:
+    if isinstance(source, bytes):
+        return fitz.open(stream=source, filetype="pdf")
+    return fitz.open(source)
+
+
+def _read_shared_bytes(name: str, size: int) -> bytes:
+    shm = shared_memory.SharedMemory(name=name)
+    try:
+        # PyMuPDF は渡されたバッファを参照し続け共有メモリを閉じられなくなるため、プロセス内のバイト列に複製する
+        return bytes(shm.buf[:size])
+    finally:
+        shm.close()
+
+
+def _extract_page_range(
+    source: tuple[str, int] | str,
+    start: int,
+    stop: int,
+    image_format: PageImageFormat = "png",
+    render_images: RenderImages = True,
+) -> list[dict[str, Any]]:
+    '''
+    ワーカープロセスで実行する. PDFを開き直し、[start, stop) のページを抽出する.
+    source はファイルパス、またはPDFのバイト列を置いた共有メモリの (名前, サイズ)
+    '''
+    pdf_source = source if isinstance(source, str) else _read_shared_bytes(*source)
+    with _open_document(pdf_source) as doc:
+        return _extract_content(doc, start, stop, image_format, render_images)
+
+
+def _split_page_ranges(page_count: int, chunks: int) -> list[tuple[int, int]]:
+    size, rest = divmod(page_count, chunks)
+    ranges: list[tuple[int, int]] = []
+    start = 0
+    for i in range(chunks):
+        stop = start + size + (1 if i < rest else 0)
+        if stop > start:
+            ranges.append((start, stop))
+        start = stop
+    return ranges
+
+
+# ページ抽出用のプロセスプール. 起動コストが大きいため初回の並列抽出時に作成し、プロセス内で使い回す
+_executor: ProcessPoolExecutor | None = None
+_executor_lock = threading.Lock()
+
 
+def _get_executor() -> ProcessPoolExecutor:
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            # 呼び出し元はスレッドから呼ばれることがあるため、fork ではなく spawn でワーカーを起動する.
+            # spawn はワーカーで呼び出し元の __main__ を import し直すため、スクリプトから使う場合は
+            # `if __name__ == "__main__":` で保護されている必要がある（保護がなくプールが壊れた場合は逐次抽出に戻す）
+            _executor = ProcessPoolExecutor(
+                max_workers=os.cpu_count() or 1, mp_context=multiprocessing.get_context("spawn")
+            )
+        return _executor
 
-def extract_content_from_file(pdf_path: str) -> list[dict[str, Any]]:
-    with fitz.open(pdf_path) as doc:
-        return _extract_content(doc)
+
+def _discard_executor(executor: ProcessPoolExecutor) -> None:
+    global _executor
+    with _executor_lock:
+        if _executor is executor:
+            _executor = None
+    executor.shutdown(wait=False, cancel_futures=True)
+
+
+def _shutdown_executor() -> None:
+    global _executor
+    with _executor_lock:
+        executor, _executor = _executor, None
+    if executor is not None:
+        executor.shutdown(wait=True, cancel_futures=True)
+
+
+atexit.register(_shutdown_executor)
+
+
+def _extract_content_from_source(
+    source: bytes | str, image_format: PageImageFormat = "png", render_images: RenderImages = True
+) -> list[dict[str, Any]]:
+    '''
+    ページ数が多い場合はページ範囲に分けてプロセスプールで並列に抽出する.
+    PyMuPDFはスレッドセーフではなく描画中もGILを保持するため、スレッドではなくプロセスで分割する.
+    範囲は連続したページで区切り、結果はページ順に連結する
+    '''
+    with _open_document(source) as doc:
+        page_count = len(doc)
+        workers = min(os.cpu_count() or 1, page_count // PARALLEL_EXTRACT_MIN_PAGES)
+        if workers <= 1:
+            return _extract_content(doc, image_format=image_format, render_images=render_images)
+
+    ranges = _split_page_ranges(page_count, workers)
+    # バイト列はワーカーごとに pickle して送らず、共有メモリに一度だけ置いて各ワーカーから読ませる
+    shm: shared_memory.SharedMemory | None = None
+    worker_source: tuple[str, int] | str
+    if isinstance(source, bytes):
+        shm = shared_memory.SharedMemory(create=True, size=len(source))
+        shm.buf[: len(source)] = source
+        worker_source = (shm.name, len(source))
+    else:
+        worker_source = source
+
+    executor = _get_executor()
+    try:
+        chunks = executor.map(
+            _extract_page_range,
+            itertools.repeat(worker_source),
+            [start for start, _ in ranges],
+            [stop for _, stop in ranges],
+            itertools.repeat(image_format),
+            itertools.repeat(render_images),
+        )
+        return list(itertools.chain.from_iterable(chunks))
+    except BrokenProcessPool:
+        _discard_executor(executor)
+        with _open_document(source) as doc:
+            return _extract_content(doc, image_format=image_format, render_images=render_images)
+    finally:
+        if shm is not None:
+            shm.close()
+            shm.unlink()
+
+
+def _iter_content_from_source(
+    source: bytes | str, image_format: PageImageFormat, render_images: RenderImages
+) -> Iterator[dict[str, Any]]:
+    with _open_document(source) as doc:
+        yield from _iter_content(doc, image_format=image_format, render_images=render_images)
+
+
+def iter_content_from_bytes(
+    pdf_bytes: bytes, image_format: PageImageFormat = "png", render_images: RenderImages = True
+) -> Iterator[dict[str, Any]]:
+    '''
+    extract_content_from_bytes の逐次版. ページごとに要素を返すため、全ページの画像を同時にメモリに保持しない.
+    ページの並列抽出は行わない
+    '''
+    return _iter_content_from_source(pdf_bytes, image_format, render_images)
+
+
+def iter_content_from_file(
+    pdf_path: str, image_format: PageImageFormat = "png", render_images: RenderImages = True
+) -> Iterator[dict[str, Any]]:
+    '''
+    extract_content_from_file の逐次版. ページごとに要素を返すため、全ページの画像を同時にメモリに保持しない.
+    ページの並列抽出は行わない
+    '''
+    return _iter_content_from_source(pdf_path, image_format, render_images)
+
+
+def extract_content_from_bytes(
+    pdf_bytes: bytes, image_format: PageImageFormat = "png", render_images: RenderImages = True
+) -> list[dict[str, Any]]:
+    '''
+    PDFのページごとにテキストとページ画像を抽出する.
+    render_images="auto" の場合、十分なテキストが取れて埋め込み画像もないページは画像を生成しない
+    '''
+    return _extract_content_from_source(pdf_bytes, image_format, render_images)
+
+
+def extract_content_from_file(
+    pdf_path: str, image_format: PageImageFormat = "png", render_images: RenderImages = True
+) -> list[dict[str, Any]]:
+    return _extract_content_from_source(pdf_path, image_format, render_images)
 
 
 class PDFUtil:
@@ -41,5 +266,3 @@ class PDFUtil:
     def extract_text_from_pdf(cls, filename: str) -> str:
         """PDFファイルからテキストを抽出する。"""
         return extract_text(filename)
-
-